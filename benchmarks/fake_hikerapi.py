@@ -0,0 +1,257 @@
+"""Local stand-in for the HikerAPI endpoints used by HikerApiClient.
+
+Serves /v1/user/by/username and /v2/user/medias with synthetic data, a
+configurable latency distribution, a server error rate and injected 429
+responses. Run it standalone with
+
+    python -m benchmarks.fake_hikerapi --port 8765 --latency lognormal:20:0.5
+"""
+import argparse
+import json
+import multiprocessing
+import random
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass(frozen=True)
+class FakeApiConfig:
+    """Behaviour of the fake API."""
+    latency: str = 'fixed:0'
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 0
+    media_count: int = 12
+    seed: int = 0
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Parse a latency distribution into a sampler returning seconds.
+
+    Supported forms, all in milliseconds:
+    'fixed:MS', 'uniform:LOW:HIGH' and 'lognormal:MEDIAN:SIGMA'.
+
+    Args:
+        spec: The distribution
+
+    Returns:
+        A function drawing one latency from a random generator
+
+    Raises:
+        ValueError: If the distribution is malformed
+    """
+    kind, _, rest = spec.partition(':')
+    try:
+        values = [float(v) for v in rest.split(':')] if rest else []
+    except ValueError as e:
+        raise ValueError(f"Invalid latency: {spec}") from e
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'lognormal' and len(values) == 2:
+        median, sigma = values
+        return lambda rng: median * rng.lognormvariate(0, sigma) / 1000 if median else 0.0
+    raise ValueError(f"Invalid latency: {spec}")
+
+
+def user_payload(username: str) -> Dict[str, Any]:
+    """Deterministic user object for a username."""
+    seed = zlib.crc32(username.encode('utf-8'))
+    return {
+        'pk': str(seed),
+        'username': username,
+        'full_name': f'Bench {username}',
+        'biography': 'Synthetic account',
+        'is_verified': seed % 7 == 0,
+        'is_private': False,
+        'profile_pic_url': None,
+        'follower_count': seed % 1_000_000,
+        'following_count': seed % 1000,
+        'media_count': seed % 500,
+    }
+
+
+def medias_payload(user_id: str, count: int) -> Dict[str, Any]:
+    """Deterministic recent media of a user."""
+    seed = int(user_id) if user_id.isdigit() else zlib.crc32(user_id.encode('utf-8'))
+    items = [
+        {
+            'pk': f'{user_id}_{ix}',
+            'like_count': (seed + ix * 37) % 5000,
+            'comment_count': (seed + ix * 11) % 200,
+            'reshare_count': ix % 5,
+        }
+        for ix in range(count)
+    ]
+    return {'response': {'items': items}, 'next_page_id': None}
+
+
+class FakeHikerApiServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like HikerAPI."""
+
+    daemon_threads = True
+    # The default backlog of 5 drops connection bursts from many workers
+    request_queue_size = 1024
+
+    def __init__(self, address: Tuple[str, int], config: FakeApiConfig) -> None:
+        super().__init__(address, _Handler)
+        self.config = config
+        self.sample_latency = parse_latency(config.latency)
+        self._rng = random.Random(config.seed)
+        self._rng_lock = threading.Lock()
+        self.counts: Dict[int, int] = {}
+        self.peers: Set[Tuple[str, int]] = set()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def draw(self) -> Tuple[float, float]:
+        """Draw a latency and a uniform number for fault injection."""
+        with self._rng_lock:
+            return self.sample_latency(self._rng), self._rng.random()
+
+    def count(self, status: int, peer: Tuple[str, int]) -> None:
+        """Count a response by status code and remember the connection it used."""
+        with self._rng_lock:
+            self.counts[status] = self.counts.get(status, 0) + 1
+            self.peers.add(peer)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler of FakeHikerApiServer."""
+
+    protocol_version = 'HTTP/1.1'
+    # Buffered so headers and body leave in one segment; separate writes
+    # on a keep-alive connection stall on Nagle and delayed ACKs
+    wbufsize = 64 * 1024
+    server: FakeHikerApiServer
+
+    def do_GET(self) -> None:
+        config = self.server.config
+        latency, roll = self.server.draw()
+        if latency:
+            time.sleep(latency)
+
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if roll < config.rate_limit_rate:
+            self._send(429, {'detail': 'Too Many Requests'}, {'Retry-After': str(config.retry_after)})
+        elif roll < config.rate_limit_rate + config.error_rate:
+            self._send(500, {'detail': 'Internal Server Error'})
+        elif url.path == '/v1/user/by/username' and 'username' in params:
+            self._send(200, user_payload(params['username']))
+        elif url.path == '/v2/user/medias' and 'user_id' in params:
+            self._send(200, medias_payload(params['user_id'], config.media_count))
+        else:
+            self._send(404, {'detail': 'Not Found'})
+
+    def _send(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.count(status, self.client_address)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep benchmark output free of access logs."""
+
+
+@contextmanager
+def fake_api_in_thread(config: FakeApiConfig = FakeApiConfig()) -> Iterator[FakeHikerApiServer]:
+    """Run the fake API on a background thread of this process."""
+    server = FakeHikerApiServer(('127.0.0.1', 0), config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _serve(config: FakeApiConfig, ports: "multiprocessing.Queue[int]") -> None:
+    """Subprocess entry point."""
+    server = FakeHikerApiServer(('127.0.0.1', 0), config)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+@contextmanager
+def fake_api_in_subprocess(config: FakeApiConfig = FakeApiConfig()) -> Iterator[str]:
+    """
+    Run the fake API in a separate process and yield its base URL.
+
+    A separate process keeps the server's work out of the measured
+    process, so it neither competes for the GIL nor shows up in its
+    memory figures.
+    """
+    ports: "multiprocessing.Queue[int]" = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config, ports), daemon=True)
+    process.start()
+    try:
+        yield f'http://127.0.0.1:{ports.get(timeout=10)}'
+    finally:
+        process.terminate()
+        process.join()
+
+
+def point_client_at(api_client: Any, url: str) -> None:
+    """
+    Send the requests of a HikerApiClient to another base URL.
+
+    hikerapi releases without user_medias_v2 get an equivalent method so
+    the client's endpoints all resolve.
+
+    Args:
+        api_client: A HikerApiClient
+        url: Base URL of the fake API
+    """
+    client = api_client._client
+    client._client.base_url = url
+    if not hasattr(client, 'user_medias_v2'):
+        client.user_medias_v2 = lambda user_id, page_id=None: client._request(
+            'get', '/v2/user/medias', params={'user_id': user_id, 'page_id': page_id}
+        )
+
+
+def main() -> None:
+    """Run the fake API until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default='lognormal:20:0.5', help="fixed:MS, uniform:LOW:HIGH or lognormal:MEDIAN:SIGMA")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Fraction of requests answered with 429")
+    parser.add_argument('--retry-after', type=int, default=0, help="Retry-After seconds sent with 429 responses")
+    args = parser.parse_args()
+
+    config = FakeApiConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after
+    )
+    server = FakeHikerApiServer(('127.0.0.1', args.port), config)
+    print(f"Fake HikerAPI listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+"""Throughput, latency and memory benchmarks.
+
+Measures HikerApiClient.search_profiles against the local fake API,
+CsvExporter.export_profiles and MainWindow._display_profiles at several
+result sizes, and the import time of main.py. Results can be saved as
+JSON and compared with a baseline, failing when throughput drops by more
+than a tolerance.
+
+    python -m benchmarks.run_benchmarks --sizes 10,1000,100000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from benchmarks.fake_hikerapi import FakeApiConfig, fake_api_in_subprocess, point_client_at
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.request_scheduler import RequestScheduler
+from src.infrastructure.export.csv_exporter import CsvExporter
+
+
+# Working directory of the interpreters timed by the startup benchmark
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Measurements of one benchmark at one size."""
+    name: str
+    size: int
+    seconds: float
+    per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_mib: Optional[float]
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of the samples, 0 when empty."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def make_profiles(count: int) -> List[Profile]:
+    """Synthetic profiles with varied values."""
+    return [
+        Profile(
+            userid=str(ix),
+            username=f'bench_user_{ix}',
+            full_name=f'Bench User {ix}',
+            bio='Synthetic account',
+            is_verified=ix % 7 == 0,
+            is_private=False,
+            profile_pic_url=None,
+            statistics=ProfileStatistics(
+                followers_count=ix * 13 % 1_000_000,
+                following_count=ix % 1000,
+                posts_count=ix % 500,
+                last_updated=datetime(2024, 1, 1)
+            ),
+            engagement_stats=EngagementStatistics(
+                recent_avg_post_likes=ix % 5000,
+                recent_avg_post_comments=ix % 200,
+                recent_avg_post_reshares=ix % 5,
+                recent_post_count=5,
+                median_post_likes=float(ix % 4000),
+                engagement_rate=0.01
+            )
+        )
+        for ix in range(count)
+    ]
+
+
+def timed_iter(items: Iterable[Profile], samples: List[float]) -> Iterator[Profile]:
+    """Yield items, recording how long the consumer spent on each one."""
+    previous = None
+    for item in items:
+        now = time.perf_counter()
+        if previous is not None:
+            samples.append(now - previous)
+        yield item
+        previous = time.perf_counter()
+    if previous is not None:
+        samples.append(time.perf_counter() - previous)
+
+
+def measure(name: str, size: int, run: Callable[[List[float]], None], memory: bool) -> BenchResult:
+    """Run one benchmark, collecting per-item latency samples and peak memory."""
+    samples: List[float] = []
+    if memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        run(samples)
+        seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20 if memory else None
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return BenchResult(
+        name=name,
+        size=size,
+        seconds=seconds,
+        per_second=size / seconds if seconds else 0.0,
+        p50_ms=percentile(samples, 0.50) * 1000,
+        p99_ms=percentile(samples, 0.99) * 1000,
+        peak_mib=peak
+    )
+
+
+def bench_search(size: int, url: str, workers: int, memory: bool) -> BenchResult:
+    """HikerApiClient.search_profiles against the fake API."""
+    scheduler = RequestScheduler(
+        rate=1_000_000, burst=1_000_000, initial_concurrency=workers,
+        max_concurrency=max(workers, 64), base_delay=0.05, max_delay=1.0
+    )
+    api_client = HikerApiClient(api_key='bench', max_workers=workers, scheduler=scheduler)
+    point_client_at(api_client, url)
+    query = ','.join(f'bench_user_{ix}' for ix in range(size))
+
+    def run(samples: List[float]) -> None:
+        get_profile = api_client.get_profile
+
+        def timed_get_profile(username: str) -> Profile:
+            started = time.perf_counter()
+            try:
+                return get_profile(username)
+            finally:
+                samples.append(time.perf_counter() - started)
+
+        api_client.get_profile = timed_get_profile
+        api_client.search_profiles(query)
+
+    return measure('search_profiles', size, run, memory)
+
+
+def bench_csv(size: int, memory: bool) -> BenchResult:
+    """CsvExporter.export_profiles to a temporary file."""
+    profiles = make_profiles(size)
+    with TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'bench.csv')
+        return measure(
+            'csv_export', size,
+            lambda samples: CsvExporter().export_profiles(timed_iter(profiles, samples), filepath),
+            memory
+        )
+
+
+def bench_display(size: int, memory: bool, chunk_size: int = 100) -> Optional[BenchResult]:
+    """MainWindow._display_profiles fed in polling-sized chunks; None without a display."""
+    try:
+        import tkinter as tk
+        from src.presentation.main_window import MainWindow
+        root = tk.Tk()
+    except Exception:
+        return None
+    root.withdraw()
+    window = MainWindow(root, profile_service=None, exporter=None)
+    profiles = make_profiles(size)
+
+    def run(samples: List[float]) -> None:
+        for start in range(0, size, chunk_size):
+            chunk = profiles[start:start + chunk_size]
+            started = time.perf_counter()
+            window._display_profiles(chunk)
+            root.update()
+            samples.extend([(time.perf_counter() - started) / len(chunk)] * len(chunk))
+
+    try:
+        return measure('display_profiles', size, run, memory)
+    finally:
+        root.destroy()
+
+
+def import_times(*args: str) -> Dict[str, int]:
+    """
+    Run the interpreter from the repository root with -X importtime.
+
+    Returns:
+        Cumulative import time in microseconds by module name
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def bench_startup(runs: int) -> BenchResult:
+    """Cumulative import time of main.py in fresh interpreters; seconds is the best run."""
+    samples = [import_times('-c', 'import main')['main'] / 1e6 for _ in range(runs)]
+    best = min(samples)
+    return BenchResult(
+        name='import_main',
+        size=1,
+        seconds=best,
+        per_second=1 / best if best else 0.0,
+        p50_ms=percentile(samples, 0.50) * 1000,
+        p99_ms=percentile(samples, 0.99) * 1000,
+        peak_mib=None
+    )
+
+
+def compare(results: List[BenchResult], baseline_path: str, tolerance: float) -> List[str]:
+    """Describe the results whose throughput fell below the baseline by more than tolerance."""
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        baseline = {(r['name'], r['size']): r for r in json.load(baseline_file)}
+    regressions = []
+    for result in results:
+        previous = baseline.get((result.name, result.size))
+        if previous and result.per_second < previous['per_second'] * (1 - tolerance):
+            regressions.append(
+                f"{result.name}@{result.size}: {result.per_second:,.0f}/s vs {previous['per_second']:,.0f}/s"
+            )
+    return regressions
+
+
+def print_table(results: List[BenchResult]) -> None:
+    """Print the results as an aligned table."""
+    print(f"{'benchmark':<18}{'size':>8}{'seconds':>10}{'items/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'peak MiB':>10}")
+    for r in results:
+        peak = f"{r.peak_mib:.1f}" if r.peak_mib is not None else '-'
+        print(f"{r.name:<18}{r.size:>8}{r.seconds:>10.2f}{r.per_second:>12,.0f}{r.p50_ms:>10.3f}{r.p99_ms:>10.3f}{peak:>10}")
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default='10,1000,100000', help="Comma separated result sizes (default: 10,1000,100000)")
+    parser.add_argument(
+        '--only', choices=['search', 'csv', 'display', 'startup'], action='append', help="Run only these benchmarks"
+    )
+    parser.add_argument('--workers', type=int, default=32, help="search_profiles worker threads (default: 32)")
+    parser.add_argument('--latency', default='lognormal:2:0.5', help="Fake API latency in ms (default: lognormal:2:0.5)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Fraction of fake API 500 responses")
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Fraction of fake API 429 responses")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc, whose overhead slows the timed code")
+    parser.add_argument('--startup-runs', type=int, default=5, help="Interpreters started to time import main (default: 5)")
+    parser.add_argument(
+        '--import-budget-ms', type=float, default=60.0,
+        help="Fail if the best import time of main.py exceeds this many milliseconds (default: 60, 0 to disable)"
+    )
+    parser.add_argument('--save', help="Write the results to this JSON file")
+    parser.add_argument('--baseline', help="Fail if throughput regressed against this JSON file")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="Allowed throughput drop vs. baseline (default: 0.25)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks and return the process exit code."""
+    args = parse_arguments(argv)
+    sizes = [int(size) for size in args.sizes.split(',')]
+    selected = set(args.only or ['search', 'csv', 'display', 'startup'])
+    memory = not args.no_memory
+    results: List[BenchResult] = []
+
+    if 'search' in selected:
+        config = FakeApiConfig(latency=args.latency, error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate)
+        with fake_api_in_subprocess(config) as url:
+            results.extend(bench_search(size, url, args.workers, memory) for size in sizes)
+    if 'csv' in selected:
+        results.extend(bench_csv(size, memory) for size in sizes)
+    if 'display' in selected:
+        display = [bench_display(size, memory) for size in sizes]
+        if None in display:
+            print("display_profiles skipped: no Tk display available", file=sys.stderr)
+        results.extend(result for result in display if result is not None)
+    startup = bench_startup(args.startup_runs) if 'startup' in selected else None
+    if startup is not None:
+        results.append(startup)
+
+    print_table(results)
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as output:
+            json.dump([asdict(result) for result in results], output, indent=2)
+    regressions = compare(results, args.baseline, args.tolerance) if args.baseline else []
+    if startup is not None and args.import_budget_ms and startup.seconds * 1000 > args.import_budget_ms:
+        regressions.append(f"import main took {startup.seconds * 1000:.1f} ms, budget {args.import_budget_ms} ms")
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,45 +3,364 @@
 Instagram Profile Statistics Viewer
 
 A desktop application for looking up Instagram profile statistics
-through HikerAPI with CSV export capabilities.
+through HikerAPI with CSV, Parquet, Arrow and JSON-lines export, plus a headless batch
+mode for unattended runs.
 
 Usage:
     python main.py --api-key YOUR_API_KEY
+    python main.py --api-key YOUR_API_KEY batch --input names.txt --output stats.csv
+    python main.py --api-keys-file keys.txt batch --input names.txt --output stats.csv
+    python main.py --replay --archive-dir archive batch --from-archive --output stats.parquet
 """
 import argparse
+import os
 import sys
-import tkinter as tk
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from src.infrastructure.api.hiker_api_client import HikerApiClient
-from src.infrastructure.export.csv_exporter import CsvExporter
-from src.application.profile_service import ProfileService
-from src.presentation.main_window import MainWindow
+# Only what argument parsing needs is imported up front. The API clients
+# (hikerapi, httpx), storage and Tkinter are imported by the code path using
+# them, so --help and short scripted runs start fast; the startup benchmark
+# in benchmarks/run_benchmarks.py holds the import time budget.
+from src.infrastructure.api.key_pool import KEYS_ENV_VAR, load_api_keys
+from src.infrastructure.export.registry import EXPORT_FORMATS, MultiFormatExporter, create_exporter, format_for_path
 
+if TYPE_CHECKING:
+    from src.application.profile_service import ProfileService
+    from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+    from src.infrastructure.storage.response_archive import ResponseArchive
 
-def parse_arguments() -> argparse.Namespace:
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="Instagram Profile Statistics Viewer"
     )
     parser.add_argument(
         "--api-key",
+        help="HikerAPI authentication key (required unless --replay, --api-keys-file "
+             f"or the {KEYS_ENV_VAR} environment variable gives keys)"
+    )
+    parser.add_argument(
+        "--api-keys-file",
+        help="File with one HikerAPI key per line, optionally followed by its remaining quota; "
+             "requests are spread over the keys"
+    )
+    parser.add_argument(
+        "--key-quarantine",
+        type=float,
+        default=60.0,
+        help="Seconds a rate limited key is rested when the server gives no Retry-After (default: 60)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Number of profiles fetched concurrently (default: 8)"
+    )
+    parser.add_argument(
+        "--engagement-window",
+        type=int,
+        default=5,
+        help="Number of recent posts engagement metrics are computed over (default: 5)"
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=20.0,
+        help="Maximum HikerAPI requests per second and key (default: 20)"
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=20,
+        help="Requests per key allowed back to back before the rate limit applies (default: 20)"
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        help="Size of the keep-alive HTTP connection pool (default: max(100, --workers))"
+    )
+    parser.add_argument(
+        "--connect-timeout",
+        type=float,
+        default=5.0,
+        help="Seconds allowed to open a connection (default: 5)"
+    )
+    parser.add_argument(
+        "--read-timeout",
+        type=float,
+        default=30.0,
+        help="Seconds allowed to wait for response data (default: 30)"
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 when the server supports it (requires the 'h2' package)"
+    )
+    parser.add_argument(
+        "--cache-db",
+        help="SQLite file used to cache profiles between runs"
+    )
+    parser.add_argument(
+        "--profile-ttl",
+        type=float,
+        default=24 * 3600,
+        help="Seconds a cached profile stays fresh (default: 86400)"
+    )
+    parser.add_argument(
+        "--engagement-ttl",
+        type=float,
+        default=6 * 3600,
+        help="Seconds cached engagement statistics stay fresh (default: 21600)"
+    )
+    parser.add_argument(
+        "--history-db",
+        help="SQLite file recording a timestamped snapshot of every fetched profile"
+    )
+    parser.add_argument(
+        "--history-retention-days",
+        type=float,
+        default=None,
+        help="Delete snapshots older than this many days (default: keep, thinned to weekly)"
+    )
+    parser.add_argument(
+        "--archive-dir",
+        help="Directory archiving every raw HikerAPI response, for replaying them offline"
+    )
+    parser.add_argument(
+        "--replay",
+        action="store_true",
+        help="Serve lookups from --archive-dir instead of HikerAPI; no API key or network needed"
+    )
+    parser.add_argument(
+        "--metrics-out",
+        help="On exit, write API and service metrics to this file, '-' for stderr"
+    )
+    parser.add_argument(
+        "--metrics-format",
+        choices=["json", "prometheus"],
+        default="json",
+        help="Format of --metrics-out (default: json)"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Look up usernames without the GUI and export the results"
+    )
+    batch_parser.add_argument(
+        "--input", "-i",
+        default="-",
+        help="File with usernames separated by commas or newlines, '-' for stdin (default: -)"
+    )
+    batch_parser.add_argument(
+        "--from-archive",
+        action="store_true",
+        help="Look up every username in --archive-dir instead of reading --input"
+    )
+    batch_parser.add_argument(
+        "--output", "-o",
         required=True,
-        help="HikerAPI authentication key"
+        help="Path of the exported file"
+    )
+    batch_parser.add_argument(
+        "--format",
+        choices=sorted(EXPORT_FORMATS),
+        help="Export format (default: chosen from the output extension, else csv)"
     )
-    return parser.parse_args()
+    batch_parser.add_argument(
+        "--delta-manifest",
+        help="Refresh mode: compare against this manifest of the previous run and write only "
+             "new, changed and removed accounts to --output (.csv or .jsonl[.gz])"
+    )
+    batch_parser.add_argument(
+        "--retry-rounds",
+        type=int,
+        default=1,
+        help="Times usernames that failed temporarily (rate limits, server errors) "
+             "are looked up again at the end of the run (default: 1)"
+    )
+    batch_parser.add_argument(
+        "--skip-engagement",
+        action="store_true",
+        help="Only fetch profile statistics, halving the API calls; engagement columns are left empty"
+    )
+    batch_parser.add_argument(
+        "--job-id",
+        help="Journal progress under this ID; rerunning with the same ID resumes the job"
+    )
+    batch_parser.add_argument(
+        "--journal-dir",
+        default=".jobs",
+        help="Directory holding job journals (default: .jobs)"
+    )
+    batch_parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Do not print progress to stderr"
+    )
+    args = parser.parse_args(argv)
+    try:
+        if args.api_keys_file:
+            args.api_keys = load_api_keys(args.api_keys_file)
+        elif args.api_key:
+            args.api_keys = {args.api_key: None}
+        else:
+            args.api_keys = load_api_keys()
+    except (OSError, ValueError) as e:
+        parser.error(f"cannot read API keys: {e}")
+    if not args.api_keys and not args.replay:
+        parser.error(f"--api-key, --api-keys-file or {KEYS_ENV_VAR} is required unless --replay is given")
+    if (args.replay or getattr(args, "from_archive", False)) and not args.archive_dir:
+        parser.error("--replay and --from-archive need --archive-dir")
+    return args
 
 
-def main() -> None:
-    """Application entry point."""
-    args = parse_arguments()
+def build_profile_service(
+    args: argparse.Namespace,
+    metrics: Optional["MetricsRegistry"] = None,
+    archive: Optional["ResponseArchive"] = None
+) -> "ProfileService":
+    """Create the profile service and its API client from the arguments."""
+    from src.application.profile_service import ProfileService
+    
+    if args.replay:
+        from src.infrastructure.api.replay_api_client import ReplayApiClient
+        
+        replay_client = ReplayApiClient(archive, engagement_window=args.engagement_window, max_workers=args.workers)
+        return ProfileService(api_client=replay_client, metrics=metrics)
     
-    # Initialize dependencies
-    api_client = HikerApiClient(api_key=args.api_key)
-    csv_exporter = CsvExporter()
-    profile_service = ProfileService(api_client=api_client)
+    from src.infrastructure.api.hiker_api_client import HikerApiClient
+    from src.infrastructure.api.http_pool import HttpPool, PoolConfig
+    from src.infrastructure.api.request_scheduler import RequestScheduler
     
-    # Start the UI
+    # Each key has its own quota, so the request budget grows with the pool
+    key_count = len(args.api_keys)
+    scheduler = RequestScheduler(rate=args.rate_limit * key_count, burst=args.burst * key_count)
+    pool_options = {"connect_timeout": args.connect_timeout, "read_timeout": args.read_timeout, "http2": args.http2}
+    if args.max_connections:
+        pool_options.update(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    http_pool = HttpPool(PoolConfig.for_workers(args.workers, **pool_options))
+    # The GUI loads engagement statistics on demand, after showing the profiles
+    load_engagement = args.command == "batch" and not args.skip_engagement
+    client_options = {
+        "max_workers": args.workers,
+        "scheduler": scheduler,
+        "engagement_window": args.engagement_window,
+        "metrics": metrics,
+        "http_pool": http_pool,
+        "load_engagement": load_engagement,
+        "archive": archive,
+    }
+    if key_count > 1:
+        from src.infrastructure.api.key_pool import KeyPool
+        from src.infrastructure.api.key_pool_client import KeyPoolApiClient
+        
+        key_pool = KeyPool(list(args.api_keys), quotas=args.api_keys, quarantine=args.key_quarantine)
+        api_client = KeyPoolApiClient(key_pool, **client_options)
+    else:
+        api_client = HikerApiClient(api_key=next(iter(args.api_keys)), **client_options)
+    if args.cache_db:
+        from src.infrastructure.cache.sqlite_profile_cache import SqliteProfileCache
+        
+        api_client = SqliteProfileCache(
+            api_client=api_client,
+            db_path=args.cache_db,
+            profile_ttl=args.profile_ttl,
+            engagement_ttl=args.engagement_ttl
+        )
+    snapshot_store = None
+    if args.history_db:
+        from src.infrastructure.storage.snapshot_store import SnapshotStore
+        
+        snapshot_store = SnapshotStore(args.history_db)
+        snapshot_store.compact(purge_after_days=args.history_retention_days)
+    return ProfileService(api_client=api_client, snapshot_store=snapshot_store, metrics=metrics)
+
+
+def run_batch(
+    args: argparse.Namespace,
+    profile_service: "ProfileService",
+    archive: Optional["ResponseArchive"] = None
+) -> int:
+    """Run a headless batch lookup and return the process exit code."""
+    from src.presentation import cli
+    
+    progress = None if args.quiet else sys.stderr
+    if args.from_archive:
+        usernames = archive.usernames()
+    elif args.input == "-":
+        usernames = cli.read_usernames(sys.stdin, progress=progress)
+    else:
+        with open(args.input, encoding="utf-8") as input_file:
+            usernames = cli.read_usernames(input_file, progress=progress)
+    
+    if not usernames:
+        print("Error: no valid usernames given", file=sys.stderr)
+        return cli.EXIT_FAILED
+    
+    if args.delta_manifest:
+        from src.infrastructure.export.delta_exporter import DeltaExporter
+        
+        exporter = DeltaExporter(args.delta_manifest)
+    else:
+        export_format = args.format or getattr(format_for_path(args.output), "name", "csv")
+        exporter = create_exporter(export_format)
+    
+    if args.job_id:
+        from src.application.batch_job import BatchJob
+        from src.infrastructure.storage.checkpoint_journal import CheckpointJournal
+        
+        journal = CheckpointJournal(os.path.join(args.journal_dir, f"{args.job_id}.jsonl"))
+        job = BatchJob(
+            profile_service=profile_service,
+            journal=journal,
+            max_workers=args.workers,
+            retry_rounds=args.retry_rounds
+        )
+        exit_code = cli.run_job(job, exporter, usernames, args.output, progress=progress)
+    else:
+        exit_code = cli.run_batch(
+            profile_service=profile_service,
+            exporter=exporter,
+            usernames=usernames,
+            output=args.output,
+            concurrency=args.workers,
+            progress=progress,
+            retry_rounds=args.retry_rounds
+        )
+    
+    summary = getattr(exporter, "summary", None)
+    if summary is not None and progress is not None:
+        print(
+            f"Delta: {summary.new} new, {summary.changed} changed, "
+            f"{summary.removed} removed, {summary.unchanged} unchanged",
+            file=progress
+        )
+    return exit_code
+
+
+def write_metrics(metrics: "MetricsRegistry", path: str, metrics_format: str) -> None:
+    """Dump the metrics as JSON or Prometheus text to a file or stderr."""
+    text = metrics.to_prometheus() if metrics_format == "prometheus" else metrics.to_json() + "\n"
+    if path == "-":
+        sys.stderr.write(text)
+    else:
+        with open(path, "w", encoding="utf-8") as metrics_file:
+            metrics_file.write(text)
+
+
+def run_gui(
+    profile_service: "ProfileService",
+    max_workers: int,
+    metrics: Optional["MetricsRegistry"] = None
+) -> None:
+    """Start the Tkinter user interface."""
+    # Imported here so that headless runs never load Tkinter
+    import tkinter as tk
+    from src.presentation.main_window import MainWindow
+    
+    exporter = MultiFormatExporter(default_format="csv")
     root = tk.Tk()
     root.title("Instagram Profile Statistics")
     root.geometry("1024x768")
@@ -49,15 +368,43 @@ def main() -> None:
     app = MainWindow(
         master=root,
         profile_service=profile_service,
-        exporter=csv_exporter
+        exporter=exporter,
+        max_workers=max_workers,
+        metrics=metrics
     )
     
     root.mainloop()
 
 
+def main(argv: Optional[List[str]] = None) -> int:
+    """Application entry point."""
+    args = parse_arguments(argv)
+    from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+    
+    metrics = MetricsRegistry()
+    archive = None
+    if args.archive_dir:
+        from src.infrastructure.storage.response_archive import ResponseArchive
+        
+        archive = ResponseArchive(args.archive_dir)
+    profile_service = build_profile_service(args, metrics, archive)
+    
+    try:
+        if args.command == "batch":
+            return run_batch(args, profile_service, archive)
+        
+        run_gui(profile_service, max_workers=args.workers, metrics=metrics)
+        return 0
+    finally:
+        if archive is not None:
+            archive.close()
+        if args.metrics_out:
+            write_metrics(metrics, args.metrics_out, args.metrics_format)
+
+
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,257 @@
+"""Resumable batch lookups on top of the profile service."""
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Protocol, Set, Tuple
+
+from src.domain.models.lookup import LOOKUP_ERROR, PERMANENT_STATUSES, LookupOutcome
+from src.domain.models.profile import Profile
+
+
+class BatchProfileServiceProtocol(Protocol):
+    """Protocol for the profile service used by batch jobs."""
+
+    def lookup_profile(self, username: str) -> LookupOutcome:
+        """Look up one username, returning the profile or the classified error."""
+        ...
+
+
+class JournalEntryProtocol(Protocol):
+    """Protocol for a recorded username outcome."""
+    username: str
+    status: str
+    profile: Optional[Profile]
+    error: Optional[str]
+    reason: Optional[str]
+
+
+class JournalProtocol(Protocol):
+    """Protocol for the checkpoint journal of a job."""
+
+    def record_done(self, username: str, profile: Profile) -> None:
+        """Record a successful lookup."""
+        ...
+
+    def record_failed(self, username: str, error: str, reason: Optional[str] = None) -> None:
+        """Record a failed lookup and its classification."""
+        ...
+
+    def load(self) -> Dict[str, JournalEntryProtocol]:
+        """Return the latest entry per lower-cased username."""
+        ...
+
+
+@dataclass
+class _RecordedOutcome:
+    """Journal entry of a lookup made by the job, kept without reading the journal back."""
+    username: str
+    status: str
+    profile: Optional[Profile]
+    error: Optional[str]
+    reason: Optional[str]
+
+
+@dataclass(frozen=True)
+class BatchJobSummary:
+    """Counts of a batch job run."""
+    total: int
+    skipped: int
+    done: int
+    failed: int
+    retried: int = 0
+
+
+class BatchJob:
+    """
+    Batch of username lookups that can resume after an interruption.
+
+    Usernames are looked up concurrently and every outcome is appended to
+    the journal as soon as its lookup completes, so an interruption loses
+    at most the lookups in flight. A failing username does not affect the
+    others; once every username was tried, those that failed for a
+    temporary reason (rate limiting, server or network errors) are looked
+    up again. On a new run, usernames the journal has as done or as
+    permanently failed (not found, private, invalid) are skipped. The
+    journal is read once; the outcomes of the job's own lookups are kept
+    alongside what was read, so results() and failures() do not read it
+    again.
+    """
+
+    def __init__(
+        self,
+        profile_service: BatchProfileServiceProtocol,
+        journal: JournalProtocol,
+        max_workers: int = 8,
+        retry_rounds: int = 1
+    ) -> None:
+        """
+        Initialize the job.
+
+        Args:
+            profile_service: Service used for the lookups
+            journal: Journal holding the outcomes of earlier runs
+            max_workers: Number of lookups in flight
+            retry_rounds: Number of times temporary failures are looked up again
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if retry_rounds < 0:
+            raise ValueError("retry_rounds cannot be negative")
+        self._profile_service = profile_service
+        self._journal = journal
+        self._max_workers = max_workers
+        self._retry_rounds = retry_rounds
+        self._entries: Optional[Dict[str, JournalEntryProtocol]] = None
+
+    def run(
+        self,
+        usernames: List[str],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> BatchJobSummary:
+        """
+        Look up every username the journal has neither as done nor as
+        permanently failed.
+
+        Args:
+            usernames: All usernames of the job
+            on_progress: Called with (processed, pending) after each lookup
+                of the first pass
+
+        Returns:
+            Counts of skipped, newly done, failed and retried usernames
+        """
+        entries = self._entries = self._journal.load()
+        unique = self._unique(usernames)
+        pending = [
+            username for username in unique
+            if not self._is_finished(entries.get(username.lower()))
+        ]
+
+        done, failed, retry = self._lookup_all(pending, on_progress)
+        retried = 0
+        for _ in range(self._retry_rounds):
+            if not retry:
+                break
+            retried += len(retry)
+            more_done, more_failed, retry = self._lookup_all(retry)
+            done += more_done
+            failed += more_failed
+
+        return BatchJobSummary(
+            total=len(unique),
+            skipped=len(unique) - len(pending),
+            done=done,
+            failed=failed + len(retry),
+            retried=retried
+        )
+
+    def _lookup_all(
+        self,
+        usernames: List[str],
+        on_progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[int, int, List[str]]:
+        """
+        Look up usernames concurrently and journal each outcome as it completes.
+
+        At most twice max_workers lookups are submitted at a time.
+
+        Returns:
+            (done, permanently failed, usernames that failed temporarily)
+        """
+        done = failed = processed = 0
+        retry: List[str] = []
+        queued = iter(usernames)
+        lookup = self._profile_service.lookup_profile
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            in_flight: Set[Future] = {
+                executor.submit(lookup, username) for username in islice(queued, 2 * self._max_workers)
+            }
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    outcome = future.result()
+                    self._record(outcome)
+                    if outcome.ok:
+                        done += 1
+                    elif outcome.retryable:
+                        retry.append(outcome.username)
+                    else:
+                        failed += 1
+                    processed += 1
+                    if on_progress is not None:
+                        on_progress(processed, len(usernames))
+                    for username in islice(queued, 1):
+                        in_flight.add(executor.submit(lookup, username))
+        return done, failed, retry
+
+    def results(self, usernames: List[str]) -> Iterator[Profile]:
+        """
+        Yield the journaled profiles of the given usernames in input order.
+
+        Args:
+            usernames: All usernames of the job
+
+        Returns:
+            An iterator over the profiles recorded as done
+        """
+        entries = self._journal_entries()
+        for username in self._unique(usernames):
+            profile = self._done_profile(entries.get(username.lower()))
+            if profile is not None:
+                yield profile
+
+    def failures(self, usernames: List[str]) -> List[LookupOutcome]:
+        """Return the failed outcome of every username not recorded as done."""
+        entries = self._journal_entries()
+        failures = []
+        for username in self._unique(usernames):
+            entry = entries.get(username.lower())
+            if not self._is_done(entry):
+                failures.append(LookupOutcome(
+                    username=username,
+                    status=(entry.reason if entry else None) or LOOKUP_ERROR,
+                    error=entry.error if entry else "Not processed"
+                ))
+        return failures
+
+    def _journal_entries(self) -> Dict[str, JournalEntryProtocol]:
+        """The latest entry per lower-cased username, reading the journal on first use only."""
+        if self._entries is None:
+            self._entries = self._journal.load()
+        return self._entries
+
+    def _record(self, outcome: LookupOutcome) -> None:
+        """Journal one outcome and keep it as the username's latest entry."""
+        if outcome.ok and outcome.profile is not None:
+            self._journal.record_done(outcome.username, outcome.profile)
+            entry = _RecordedOutcome(outcome.username, 'done', outcome.profile, None, None)
+        else:
+            error = outcome.error or "Lookup failed"
+            self._journal.record_failed(outcome.username, error, reason=outcome.status)
+            entry = _RecordedOutcome(outcome.username, 'failed', None, error, outcome.status)
+        self._journal_entries()[outcome.username.lower()] = entry
+
+    @staticmethod
+    def _unique(usernames: List[str]) -> List[str]:
+        """Drop case-insensitive duplicates, keeping first occurrences."""
+        unique: Dict[str, str] = {}
+        for username in usernames:
+            unique.setdefault(username.lower(), username)
+        return list(unique.values())
+
+    @staticmethod
+    def _done_profile(entry: Optional[JournalEntryProtocol]) -> Optional[Profile]:
+        """The profile of a journal entry holding a successful lookup, else None."""
+        if entry is None or entry.status != 'done':
+            return None
+        return entry.profile
+
+    @classmethod
+    def _is_done(cls, entry: Optional[JournalEntryProtocol]) -> bool:
+        """Whether a journal entry holds a successful lookup."""
+        return cls._done_profile(entry) is not None
+
+    @classmethod
+    def _is_finished(cls, entry: Optional[JournalEntryProtocol]) -> bool:
+        """Whether a journal entry needs no further lookup."""
+        return cls._is_done(entry) or (entry is not None and entry.reason in PERMANENT_STATUSES)
@@ -1,8 +1,19 @@
 """Application services for profile operations."""
-from typing import List, Optional, Protocol
+import time
+from typing import Any, Iterable, List, Optional, Protocol
 
+from src.domain.models.lookup import (
+    LOOKUP_ERROR,
+    LOOKUP_INVALID,
+    LOOKUP_OK,
+    RETRYABLE_STATUSES,
+    LookupOutcome,
+    failed_outcome,
+    merge_outcomes,
+)
 from src.domain.models.profile import Profile, ProfileSearchResult
 from src.domain.validators.profile_validator import ProfileValidator
+from src.domain.validators.username_input import normalize_username, parse_usernames
 
 
 class ApiClientProtocol(Protocol):
@@ -15,19 +26,87 @@ class ApiClientProtocol(Protocol):
     def search_profiles(self, query: str) -> ProfileSearchResult:
         """Search for profiles matching the query."""
         ...
+    
+    def lookup_profiles(self, query: str) -> List[LookupOutcome]:
+        """Look up every username of the query, keeping going past failures."""
+        ...
+
+
+class AsyncApiClientProtocol(Protocol):
+    """Protocol for asyncio API clients that can fetch profile data."""
+    
+    async def get_profile(self, username: str) -> Profile:
+        """Fetch a single profile by username."""
+        ...
+    
+    async def search_profiles(self, query: str) -> ProfileSearchResult:
+        """Search for profiles matching the query."""
+        ...
+
+
+class SnapshotRecorderProtocol(Protocol):
+    """Protocol for stores keeping a history of fetched profiles."""
+    
+    def record(self, profiles: Iterable[Profile]) -> int:
+        """Append a snapshot of each profile."""
+        ...
+    
+    def update_engagement(self, profiles: Iterable[Profile]) -> int:
+        """Set the engagement metrics of each profile's latest snapshot."""
+        ...
+
+
+class MetricsRecorderProtocol(Protocol):
+    """Protocol for registries collecting counters and latency histograms."""
+    
+    def increment(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Add to a counter."""
+        ...
+    
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a value in a histogram."""
+        ...
+
+
+def _parse_query(query: str) -> tuple[List[str], Optional[str]]:
+    """
+    Normalize and validate the usernames of a search query.
+    
+    Args:
+        query: The search query
+        
+    Returns:
+        A tuple of (unique usernames, error_message)
+    """
+    batch = parse_usernames(query)
+    if batch.rejected:
+        return [], f"Invalid usernames: {', '.join(list(batch.rejected)[:10])}"
+    if not batch.valid:
+        return [], "Search query cannot be empty"
+    return batch.valid, None
 
 
 class ProfileService:
     """Service for Instagram profile operations."""
     
-    def __init__(self, api_client: ApiClientProtocol) -> None:
+    def __init__(
+        self,
+        api_client: ApiClientProtocol,
+        snapshot_store: Optional[SnapshotRecorderProtocol] = None,
+        metrics: Optional[MetricsRecorderProtocol] = None
+    ) -> None:
         """
         Initialize the profile service.
         
         Args:
             api_client: Client for accessing the Instagram API
+            snapshot_store: Optional store recording every fetched profile
+            metrics: Optional registry receiving the latency and outcome
+                of every operation
         """
         self._api_client = api_client
+        self._snapshot_store = snapshot_store
+        self._metrics = metrics
         self._validator = ProfileValidator()
     
     def get_profile(self, username: str) -> tuple[Optional[Profile], Optional[str]]:
@@ -35,37 +114,245 @@ class ProfileService:
         Get a profile by username.
         
         Args:
-            username: The Instagram username to look up
+            username: The Instagram username, '@' handle or profile URL
             
         Returns:
             A tuple of (profile, error_message)
         """
+        start = time.perf_counter()
+        username = normalize_username(username)
         is_valid, error = self._validator.validate_username(username)
         if not is_valid:
+            self._observe('get_profile', start, 'invalid')
             return None, error
             
         try:
             profile = self._api_client.get_profile(username)
-            return profile, None
+            self._record([profile])
         except Exception as e:
+            self._observe('get_profile', start, 'error')
             return None, str(e)
+        self._observe('get_profile', start, 'ok', profiles=1)
+        return profile, None
     
     def search_profiles(self, query: str) -> tuple[Optional[List[Profile]], Optional[str]]:
         """
         Search for profiles matching the query.
         
         Args:
-            query: The search query
-            limit: Maximum number of results to return
+            query: Usernames separated by commas, semicolons or whitespace
             
         Returns:
-            A tuple of (profiles, error_message)
+            A tuple of (profiles, error_message); profiles follow the order
+            of the first occurrence of each unique username
         """
-        if not query:
-            return None, "Search query cannot be empty"
+        start = time.perf_counter()
+        usernames, error = _parse_query(query)
+        if error:
+            self._observe('search_profiles', start, 'invalid')
+            return None, error
+            
+        try:
+            result = self._api_client.search_profiles(','.join(usernames))
+            self._record(result.profiles)
+        except Exception as e:
+            self._observe('search_profiles', start, 'error')
+            return None, str(e)
+        self._observe('search_profiles', start, 'ok', profiles=len(result.profiles))
+        return result.profiles, None
+    
+    def load_engagement(self, profile: Profile) -> tuple[Optional[Profile], Optional[str]]:
+        """
+        Fill in the engagement statistics of a profile fetched without them.
+        
+        Args:
+            profile: The profile
             
+        Returns:
+            A tuple of (profile, error_message); the profile is returned
+            unchanged when it is private, already complete, or the client
+            cannot load engagement on its own. The profile's latest snapshot
+            gets the loaded statistics when a store is configured
+        """
+        fill = getattr(self._api_client, 'fill_engagement', None)
+        if fill is None or not profile.engagement_pending:
+            return profile, None
+        start = time.perf_counter()
         try:
-            result = self._api_client.search_profiles(query)
+            filled = fill(profile)
+            if self._snapshot_store is not None and filled.engagement_stats is not None:
+                self._snapshot_store.update_engagement([filled])
+        except Exception as e:
+            self._observe('load_engagement', start, 'error')
+            return None, str(e)
+        self._observe('load_engagement', start, 'ok')
+        return filled, None
+    
+    def lookup_profile(self, username: str) -> LookupOutcome:
+        """
+        Look up one username.
+        
+        Args:
+            username: The Instagram username, '@' handle or profile URL
+            
+        Returns:
+            The profile or the classified error
+        """
+        start = time.perf_counter()
+        username = normalize_username(username)
+        is_valid, error = self._validator.validate_username(username)
+        if not is_valid:
+            outcome = LookupOutcome(username=username, status=LOOKUP_INVALID, error=error)
+        else:
+            try:
+                profile = self._api_client.get_profile(username)
+            except Exception as e:
+                outcome = failed_outcome(username, e)
+            else:
+                outcome = LookupOutcome(username=username, status=LOOKUP_OK, profile=profile)
+                self._record([profile])
+        self._observe_lookups('lookup_profile', start, [outcome])
+        return outcome
+    
+    def lookup_profiles(self, usernames: Iterable[str]) -> List[LookupOutcome]:
+        """
+        Look up usernames, keeping the result of each one whatever the others do.
+        
+        Args:
+            usernames: Usernames, '@' handles or profile URLs
+            
+        Returns:
+            One outcome per unique username in input order; invalid names
+            get an 'invalid' outcome without reaching the API
+        """
+        start = time.perf_counter()
+        outcomes: dict[str, LookupOutcome] = {}
+        valid: List[str] = []
+        order: List[str] = []
+        seen: set[str] = set()
+        for raw in usernames:
+            username = normalize_username(raw)
+            if username in seen:
+                continue
+            seen.add(username)
+            order.append(username)
+            is_valid, error = self._validator.validate_username(username)
+            if is_valid:
+                valid.append(username)
+            else:
+                outcomes[username] = LookupOutcome(username=username, status=LOOKUP_INVALID, error=error)
+        
+        if valid:
+            try:
+                fetched = self._api_client.lookup_profiles(','.join(valid))
+            except Exception as e:
+                fetched = [failed_outcome(username, e) for username in valid]
+            outcomes.update((outcome.username.lower(), outcome) for outcome in fetched)
+            self._record([outcome.profile for outcome in fetched if outcome.ok and outcome.profile is not None])
+            for username in valid:
+                if username not in outcomes:
+                    outcomes[username] = LookupOutcome(
+                        username=username, status=LOOKUP_ERROR, error="The API returned no result for this username"
+                    )
+        
+        result = [outcomes[username] for username in order]
+        self._observe_lookups('lookup_profiles', start, result)
+        return result
+    
+    def retry_failed(
+        self,
+        outcomes: List[LookupOutcome],
+        statuses: frozenset = RETRYABLE_STATUSES
+    ) -> List[LookupOutcome]:
+        """
+        Look up again only the usernames whose failure may be temporary.
+        
+        Args:
+            outcomes: Outcomes of an earlier lookup_profiles call
+            statuses: Failure statuses to retry
+            
+        Returns:
+            The outcomes in their original order, retried ones replaced
+        """
+        failed = [outcome.username for outcome in outcomes if outcome.status in statuses]
+        if not failed:
+            return list(outcomes)
+        return merge_outcomes(outcomes, self.lookup_profiles(failed))
+    
+    def _record(self, profiles: List[Profile]) -> None:
+        """Append snapshots of fetched profiles when a store is configured."""
+        if self._snapshot_store is not None and profiles:
+            self._snapshot_store.record(profiles)
+    
+    def _observe_lookups(self, operation: str, start: float, outcomes: List[LookupOutcome]) -> None:
+        """Record a lookup's latency and the status of each outcome when a registry is configured."""
+        if self._metrics is None:
+            return
+        self._metrics.observe('service_request_seconds', time.perf_counter() - start, operation=operation)
+        for outcome in outcomes:
+            self._metrics.increment('service_lookups_total', status=outcome.status)
+    
+    def _observe(self, operation: str, start: float, outcome: str, profiles: int = 0) -> None:
+        """Record an operation's latency and outcome when a registry is configured."""
+        if self._metrics is None:
+            return
+        self._metrics.observe('service_request_seconds', time.perf_counter() - start, operation=operation)
+        self._metrics.increment('service_requests_total', operation=operation, outcome=outcome)
+        if profiles:
+            self._metrics.increment('service_profiles_total', profiles)
+
+
+class AsyncProfileService:
+    """Asyncio service for Instagram profile operations."""
+    
+    def __init__(self, api_client: AsyncApiClientProtocol) -> None:
+        """
+        Initialize the asyncio profile service.
+        
+        Args:
+            api_client: Asyncio client for accessing the Instagram API
+        """
+        self._api_client = api_client
+        self._validator = ProfileValidator()
+    
+    async def get_profile(self, username: str) -> tuple[Optional[Profile], Optional[str]]:
+        """
+        Get a profile by username.
+        
+        Args:
+            username: The Instagram username, '@' handle or profile URL
+            
+        Returns:
+            A tuple of (profile, error_message)
+        """
+        username = normalize_username(username)
+        is_valid, error = self._validator.validate_username(username)
+        if not is_valid:
+            return None, error
+            
+        try:
+            profile = await self._api_client.get_profile(username)
+            return profile, None
+        except Exception as e:
+            return None, str(e)
+    
+    async def search_profiles(self, query: str) -> tuple[Optional[List[Profile]], Optional[str]]:
+        """
+        Search for profiles matching the query.
+        
+        Args:
+            query: Usernames separated by commas, semicolons or whitespace
+            
+        Returns:
+            A tuple of (profiles, error_message); profiles follow the order
+            of the first occurrence of each unique username
+        """
+        usernames, error = _parse_query(query)
+        if error:
+            return None, error
+            
+        try:
+            result = await self._api_client.search_profiles(','.join(usernames))
             return result.profiles, None
         except Exception as e:
-            return None, str(e)
\ No newline at end of file
+            return None, str(e)
@@ -0,0 +1,172 @@
+"""Engagement metrics computed from a profile's recent media."""
+import math
+import operator
+from array import array
+from dataclasses import dataclass
+from itertools import compress, islice
+from typing import Any, Dict, Iterable
+
+from src.domain.models.profile import EngagementStatistics
+from src.domain.models.profile_table import ProfileTable
+
+
+@dataclass(frozen=True)
+class MediaColumns:
+    """
+    Columnar view of the metrics of a window of media items.
+
+    Each column only holds the values of the posts that report that metric,
+    so a missing count never drags an average down.
+    """
+    post_count: int
+    likes: array
+    comments: array
+    reshares: array
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]], window: int) -> "MediaColumns":
+        """
+        Build the columns in a single pass over at most window items.
+
+        Args:
+            items: Media items as returned by the API
+            window: Number of most recent posts to include
+
+        Returns:
+            The columnar view
+        """
+        likes = array('q')
+        comments = array('q')
+        reshares = array('q')
+        post_count = 0
+        for post in islice(items, window):
+            post_count += 1
+            if 'like_count' in post:
+                likes.append(post['like_count'])
+            if 'comment_count' in post:
+                comments.append(post['comment_count'])
+            if 'reshare_count' in post:
+                reshares.append(post['reshare_count'])
+        return cls(post_count=post_count, likes=likes, comments=comments, reshares=reshares)
+
+
+def mean(values: array) -> float:
+    """Arithmetic mean of a column, 0 when empty."""
+    return sum(values) / len(values) if values else 0.0
+
+
+def median(values: array) -> float:
+    """Median of a column, 0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return float(ordered[middle])
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def pstdev(values: array) -> float:
+    """Population standard deviation of a column, 0 when empty."""
+    if not values:
+        return 0.0
+    average = sum(values) / len(values)
+    variance = sum(map(operator.mul, values, values)) / len(values) - average * average
+    return math.sqrt(max(variance, 0.0))
+
+
+def engagement_rate(avg_likes: float, avg_comments: float, followers_count: int) -> float:
+    """Average interactions per post as a fraction of the follower count."""
+    if followers_count <= 0:
+        return 0.0
+    return (avg_likes + avg_comments) / followers_count
+
+
+def engagement_rates(table: ProfileTable) -> array:
+    """
+    Stored engagement rate of every profile table row with engagement statistics.
+
+    Reads the typed engagement_rate and has_engagement columns directly,
+    without materializing any profile, so the rates are the ones computed
+    from the media rather than rebuilt from the truncated integer averages.
+
+    Args:
+        table: The profile table
+
+    Returns:
+        The rates in row order, leaving out rows without engagement statistics
+    """
+    return array('d', compress(table.column('engagement_rate'), table.column('has_engagement')))
+
+
+class EngagementCalculator:
+    """Computes engagement statistics over a window of recent posts."""
+
+    def __init__(self, window: int = 5) -> None:
+        """
+        Initialize the calculator.
+
+        Args:
+            window: Number of most recent posts to analyse
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self._window = window
+
+    @property
+    def window(self) -> int:
+        """Number of most recent posts analysed."""
+        return self._window
+
+    def columns(self, items: Iterable[Dict[str, Any]]) -> MediaColumns:
+        """
+        Collect the metrics of the most recent posts of the window.
+
+        The columns do not depend on the follower count, so they can be
+        cached and summarized again when the count changes.
+
+        Args:
+            items: Media items, most recent first
+
+        Returns:
+            The columnar view of at most window posts
+        """
+        return MediaColumns.from_items(items, self._window)
+
+    def summarize(self, columns: MediaColumns, followers_count: int = 0) -> EngagementStatistics:
+        """
+        Compute engagement statistics from collected media metrics.
+
+        Args:
+            columns: Metrics of the recent posts
+            followers_count: Follower count used for the engagement rate
+
+        Returns:
+            The engagement statistics
+        """
+        avg_likes = mean(columns.likes)
+        avg_comments = mean(columns.comments)
+        return EngagementStatistics(
+            recent_avg_post_likes=int(avg_likes),
+            recent_avg_post_comments=int(avg_comments),
+            recent_avg_post_reshares=int(mean(columns.reshares)),
+            recent_post_count=columns.post_count,
+            median_post_likes=median(columns.likes),
+            median_post_comments=median(columns.comments),
+            stdev_post_likes=pstdev(columns.likes),
+            stdev_post_comments=pstdev(columns.comments),
+            engagement_rate=engagement_rate(avg_likes, avg_comments, followers_count)
+        )
+
+    def compute(self, items: Iterable[Dict[str, Any]], followers_count: int = 0) -> EngagementStatistics:
+        """
+        Compute engagement statistics for a profile's media items.
+
+        Args:
+            items: Media items, most recent first
+            followers_count: Follower count used for the engagement rate
+
+        Returns:
+            The engagement statistics
+        """
+        return self.summarize(self.columns(items), followers_count)
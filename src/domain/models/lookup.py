@@ -0,0 +1,76 @@
+"""Per-username outcomes of batch profile lookups."""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.models.profile import Profile
+
+
+LOOKUP_OK = 'ok'
+LOOKUP_NOT_FOUND = 'not_found'
+LOOKUP_PRIVATE = 'private'
+LOOKUP_RATE_LIMITED = 'rate_limited'
+LOOKUP_TRANSIENT = 'transient'
+LOOKUP_INVALID = 'invalid'
+LOOKUP_ERROR = 'error'
+
+# Failures that may succeed when the same lookup is repeated later
+RETRYABLE_STATUSES = frozenset({LOOKUP_RATE_LIMITED, LOOKUP_TRANSIENT})
+
+# Failures that a repeated lookup cannot fix
+PERMANENT_STATUSES = frozenset({LOOKUP_NOT_FOUND, LOOKUP_PRIVATE, LOOKUP_INVALID})
+
+
+@dataclass(frozen=True)
+class LookupOutcome:
+    """Result of looking up one username: a profile or a classified error."""
+    username: str
+    status: str
+    profile: Optional[Profile] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the lookup produced a profile."""
+        return self.status == LOOKUP_OK
+
+    @property
+    def retryable(self) -> bool:
+        """Whether repeating the lookup may succeed."""
+        return self.status in RETRYABLE_STATUSES
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Map a lookup exception to an outcome status.
+
+    API errors carry their status in a lookup_status attribute; anything
+    else is an unclassified error.
+
+    Args:
+        error: The exception raised by the lookup
+
+    Returns:
+        One of the LOOKUP_* statuses
+    """
+    return getattr(error, 'lookup_status', LOOKUP_ERROR)
+
+
+def failed_outcome(username: str, error: BaseException) -> LookupOutcome:
+    """Outcome of a lookup that raised error."""
+    return LookupOutcome(username=username, status=classify_error(error), error=str(error) or type(error).__name__)
+
+
+def merge_outcomes(outcomes: Iterable[LookupOutcome], retried: Iterable[LookupOutcome]) -> List[LookupOutcome]:
+    """
+    Replace outcomes with the results of retrying them.
+
+    Args:
+        outcomes: Outcomes of the original lookups
+        retried: Outcomes of looking some of the usernames up again
+
+    Returns:
+        The original outcomes in their order, with retried usernames
+        replaced by their new outcome
+    """
+    by_name: Dict[str, LookupOutcome] = {outcome.username.lower(): outcome for outcome in retried}
+    return [by_name.get(outcome.username.lower(), outcome) for outcome in outcomes]
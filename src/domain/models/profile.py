@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProfileStatistics:
     """Statistics for an Instagram profile."""
     followers_count: int
@@ -13,16 +13,21 @@ class ProfileStatistics:
     last_updated: datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EngagementStatistics:
     """Engagement statistics for an Instagram profile."""
     recent_avg_post_likes: int
     recent_avg_post_comments: int
     recent_avg_post_reshares: int
     recent_post_count: int
+    median_post_likes: float = 0.0
+    median_post_comments: float = 0.0
+    stdev_post_likes: float = 0.0
+    stdev_post_comments: float = 0.0
+    engagement_rate: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     """Instagram profile entity."""
     userid: str
@@ -33,10 +38,16 @@ class Profile:
     is_private: bool
     profile_pic_url: Optional[str]
     statistics: ProfileStatistics
-    engagement_stats: EngagementStatistics
+    # None until loaded; private accounts never have any
+    engagement_stats: Optional[EngagementStatistics]
 
+    @property
+    def engagement_pending(self) -> bool:
+        """Whether engagement statistics can still be loaded for this profile."""
+        return self.engagement_stats is None and not self.is_private
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ProfileSearchResult:
     """Result of a profile search operation."""
     profiles: List[Profile]
@@ -0,0 +1,319 @@
+"""Compact columnar container for large numbers of profiles."""
+from array import array
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union, overload
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+
+
+# Columns stored as 64-bit integers
+INT_COLUMNS = (
+    'followers_count', 'following_count', 'posts_count',
+    'recent_avg_post_likes', 'recent_avg_post_comments',
+    'recent_avg_post_reshares', 'recent_post_count',
+)
+
+# Columns stored as doubles; last_updated is kept as a POSIX timestamp
+FLOAT_COLUMNS = (
+    'median_post_likes', 'median_post_comments', 'stdev_post_likes',
+    'stdev_post_comments', 'engagement_rate', 'last_updated',
+)
+
+# Columns stored as one signed byte per row
+FLAG_COLUMNS = ('is_verified', 'is_private', 'has_engagement')
+
+# Columns of EngagementStatistics; they hold zeros and decode to None in
+# rows whose has_engagement flag is not set
+ENGAGEMENT_COLUMNS = (
+    'recent_avg_post_likes', 'recent_avg_post_comments', 'recent_avg_post_reshares',
+    'recent_post_count', 'median_post_likes', 'median_post_comments',
+    'stdev_post_likes', 'stdev_post_comments', 'engagement_rate',
+)
+
+# Columns stored as ids into the string pool
+STRING_COLUMNS = ('userid', 'username', 'full_name', 'bio', 'profile_pic_url')
+
+
+class StringPool:
+    """Interned strings addressed by integer id; -1 stands for None."""
+
+    __slots__ = ('_strings', '_ids')
+
+    def __init__(self) -> None:
+        """Create an empty pool."""
+        self._strings: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of distinct strings."""
+        return len(self._strings)
+
+    def intern(self, value: Optional[str]) -> int:
+        """Return the id of a string, adding it on first use."""
+        if value is None:
+            return -1
+        string_id = self._ids.get(value)
+        if string_id is None:
+            string_id = len(self._strings)
+            self._strings.append(value)
+            self._ids[value] = string_id
+        return string_id
+
+    def get(self, string_id: int) -> Optional[str]:
+        """Return the string with an id."""
+        return None if string_id < 0 else self._strings[string_id]
+
+
+class ProfileTable:
+    """
+    Profiles stored column by column in typed arrays.
+
+    Numbers and flags live in array.array columns and strings are interned
+    in a shared pool, so a row costs about 130 bytes plus its distinct
+    strings instead of four objects and a datetime. Indexing and iteration
+    yield ProfileRow views that read like Profile objects, so exporters and
+    other Profile consumers accept a table as is.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty table."""
+        self._strings = StringPool()
+        self._columns: Dict[str, array] = {}
+        for name in INT_COLUMNS:
+            self._columns[name] = array('q')
+        for name in FLOAT_COLUMNS:
+            self._columns[name] = array('d')
+        for name in FLAG_COLUMNS:
+            self._columns[name] = array('b')
+        for name in STRING_COLUMNS:
+            self._columns[name] = array('i')
+        self._size = 0
+
+    @classmethod
+    def from_profiles(cls, profiles: Iterable[Profile]) -> "ProfileTable":
+        """Build a table from any iterable of profiles."""
+        table = cls()
+        table.extend(profiles)
+        return table
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return self._size
+
+    @overload
+    def __getitem__(self, index: int) -> "ProfileRow": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List["ProfileRow"]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["ProfileRow", List["ProfileRow"]]:
+        """Return the row view at an index, or a list of views for a slice."""
+        if isinstance(index, slice):
+            return [ProfileRow(self, row) for row in range(*index.indices(self._size))]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ProfileTable index out of range")
+        return ProfileRow(self, index)
+
+    def __iter__(self) -> Iterator["ProfileRow"]:
+        """Iterate over row views."""
+        for row in range(self._size):
+            yield ProfileRow(self, row)
+
+    def append(self, profile: Profile) -> None:
+        """Add a profile as a new row."""
+        stats = profile.statistics
+        eng_stats = profile.engagement_stats
+        columns = self._columns
+        intern = self._strings.intern
+
+        columns['followers_count'].append(int(stats.followers_count))
+        columns['following_count'].append(int(stats.following_count))
+        columns['posts_count'].append(int(stats.posts_count))
+        if eng_stats is None:
+            for name in ENGAGEMENT_COLUMNS:
+                columns[name].append(0)
+        else:
+            columns['recent_avg_post_likes'].append(int(eng_stats.recent_avg_post_likes))
+            columns['recent_avg_post_comments'].append(int(eng_stats.recent_avg_post_comments))
+            columns['recent_avg_post_reshares'].append(int(eng_stats.recent_avg_post_reshares))
+            columns['recent_post_count'].append(int(eng_stats.recent_post_count))
+            columns['median_post_likes'].append(eng_stats.median_post_likes)
+            columns['median_post_comments'].append(eng_stats.median_post_comments)
+            columns['stdev_post_likes'].append(eng_stats.stdev_post_likes)
+            columns['stdev_post_comments'].append(eng_stats.stdev_post_comments)
+            columns['engagement_rate'].append(eng_stats.engagement_rate)
+        columns['last_updated'].append(stats.last_updated.timestamp())
+        columns['is_verified'].append(bool(profile.is_verified))
+        columns['is_private'].append(bool(profile.is_private))
+        columns['has_engagement'].append(eng_stats is not None)
+        for name in STRING_COLUMNS:
+            columns[name].append(intern(getattr(profile, name)))
+        self._size += 1
+
+    def extend(self, profiles: Iterable[Profile]) -> None:
+        """Add profiles as new rows."""
+        for profile in profiles:
+            self.append(profile)
+
+    def column(self, name: str) -> array:
+        """
+        Return the raw typed array of a numeric or flag column.
+
+        The array is shared with the table and must not be modified.
+        Engagement columns hold zeros where has_engagement is not set.
+
+        Args:
+            name: A name from INT_COLUMNS, FLOAT_COLUMNS or FLAG_COLUMNS
+
+        Raises:
+            KeyError: If the column does not exist or holds strings
+        """
+        if name in STRING_COLUMNS:
+            raise KeyError(f"{name} is a string column; use values()")
+        return self._columns[name]
+
+    def values(self, name: str, start: int = 0, stop: Optional[int] = None) -> List[Any]:
+        """
+        Decode a range of a column into Python values.
+
+        Strings come back as str or None, flags as bool and last_updated as
+        datetime; numbers are returned unchanged, except that engagement
+        columns give None for rows without engagement statistics.
+
+        Args:
+            name: Column name
+            start: First row
+            stop: Row after the last one, defaults to the end of the table
+
+        Returns:
+            The column values
+        """
+        raw = self._columns[name][start:stop]
+        if name in STRING_COLUMNS:
+            get = self._strings.get
+            return [get(string_id) for string_id in raw]
+        if name in FLAG_COLUMNS:
+            return [bool(flag) for flag in raw]
+        if name == 'last_updated':
+            return [datetime.fromtimestamp(timestamp) for timestamp in raw]
+        if name in ENGAGEMENT_COLUMNS:
+            loaded = self._columns['has_engagement'][start:stop]
+            return [number if flag else None for number, flag in zip(raw, loaded)]
+        return raw.tolist()
+
+    def value(self, name: str, row: int) -> Any:
+        """Decode a single cell; see values()."""
+        raw = self._columns[name][row]
+        if name in STRING_COLUMNS:
+            return self._strings.get(raw)
+        if name in FLAG_COLUMNS:
+            return bool(raw)
+        if name == 'last_updated':
+            return datetime.fromtimestamp(raw)
+        if name in ENGAGEMENT_COLUMNS and not self._columns['has_engagement'][row]:
+            return None
+        return raw
+
+    def to_profile(self, row: int) -> Profile:
+        """Materialize a row as a standalone Profile."""
+        return ProfileRow(self, row).to_profile()
+
+
+class ProfileRow:
+    """Read-only view of one ProfileTable row with the attributes of Profile."""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table: ProfileTable, row: int) -> None:
+        """View a row of a table."""
+        self._table = table
+        self._row = row
+
+    def __repr__(self) -> str:
+        """Row number and username."""
+        return f"ProfileRow(row={self._row}, username={self.username!r})"
+
+    @property
+    def userid(self) -> str:
+        """Instagram user id."""
+        return self._table.value('userid', self._row)
+
+    @property
+    def username(self) -> str:
+        """Instagram username."""
+        return self._table.value('username', self._row)
+
+    @property
+    def full_name(self) -> Optional[str]:
+        """Display name, or None."""
+        return self._table.value('full_name', self._row)
+
+    @property
+    def bio(self) -> Optional[str]:
+        """Profile biography, or None."""
+        return self._table.value('bio', self._row)
+
+    @property
+    def is_verified(self) -> bool:
+        """Whether the account is verified."""
+        return self._table.value('is_verified', self._row)
+
+    @property
+    def is_private(self) -> bool:
+        """Whether the account is private."""
+        return self._table.value('is_private', self._row)
+
+    @property
+    def profile_pic_url(self) -> Optional[str]:
+        """Profile picture URL, or None."""
+        return self._table.value('profile_pic_url', self._row)
+
+    @property
+    def statistics(self) -> ProfileStatistics:
+        """Statistics built from the row's columns on each access."""
+        value = self._table.value
+        return ProfileStatistics(
+            followers_count=value('followers_count', self._row),
+            following_count=value('following_count', self._row),
+            posts_count=value('posts_count', self._row),
+            last_updated=value('last_updated', self._row)
+        )
+
+    @property
+    def engagement_pending(self) -> bool:
+        """Whether engagement statistics are still to be loaded for a public account."""
+        return not self._table.value('has_engagement', self._row) and not self.is_private
+
+    @property
+    def engagement_stats(self) -> Optional[EngagementStatistics]:
+        """Engagement statistics built from the row's columns on each access, or None if not loaded."""
+        value = self._table.value
+        if not value('has_engagement', self._row):
+            return None
+        return EngagementStatistics(
+            recent_avg_post_likes=value('recent_avg_post_likes', self._row),
+            recent_avg_post_comments=value('recent_avg_post_comments', self._row),
+            recent_avg_post_reshares=value('recent_avg_post_reshares', self._row),
+            recent_post_count=value('recent_post_count', self._row),
+            median_post_likes=value('median_post_likes', self._row),
+            median_post_comments=value('median_post_comments', self._row),
+            stdev_post_likes=value('stdev_post_likes', self._row),
+            stdev_post_comments=value('stdev_post_comments', self._row),
+            engagement_rate=value('engagement_rate', self._row)
+        )
+
+    def to_profile(self) -> Profile:
+        """Materialize the row as a standalone Profile."""
+        return Profile(
+            userid=self.userid,
+            username=self.username,
+            full_name=self.full_name,
+            bio=self.bio,
+            is_verified=self.is_verified,
+            is_private=self.is_private,
+            profile_pic_url=self.profile_pic_url,
+            statistics=self.statistics,
+            engagement_stats=self.engagement_stats
+        )
@@ -0,0 +1,87 @@
+"""Conversion of profile domain models to and from plain dictionaries."""
+from datetime import datetime
+from typing import Any, Dict
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+
+
+def statistics_to_dict(statistics: ProfileStatistics) -> Dict[str, Any]:
+    """Convert profile statistics to a JSON-compatible dictionary."""
+    return {
+        'followers_count': statistics.followers_count,
+        'following_count': statistics.following_count,
+        'posts_count': statistics.posts_count,
+        'last_updated': statistics.last_updated.timestamp(),
+    }
+
+
+def statistics_from_dict(data: Dict[str, Any]) -> ProfileStatistics:
+    """Build profile statistics from a dictionary made by statistics_to_dict."""
+    return ProfileStatistics(
+        followers_count=data['followers_count'],
+        following_count=data['following_count'],
+        posts_count=data['posts_count'],
+        last_updated=datetime.fromtimestamp(data['last_updated'])
+    )
+
+
+def engagement_to_dict(engagement_stats: EngagementStatistics) -> Dict[str, Any]:
+    """Convert engagement statistics to a JSON-compatible dictionary."""
+    return {
+        'recent_avg_post_likes': engagement_stats.recent_avg_post_likes,
+        'recent_avg_post_comments': engagement_stats.recent_avg_post_comments,
+        'recent_avg_post_reshares': engagement_stats.recent_avg_post_reshares,
+        'recent_post_count': engagement_stats.recent_post_count,
+        'median_post_likes': engagement_stats.median_post_likes,
+        'median_post_comments': engagement_stats.median_post_comments,
+        'stdev_post_likes': engagement_stats.stdev_post_likes,
+        'stdev_post_comments': engagement_stats.stdev_post_comments,
+        'engagement_rate': engagement_stats.engagement_rate,
+    }
+
+
+def engagement_from_dict(data: Dict[str, Any]) -> EngagementStatistics:
+    """Build engagement statistics from a dictionary made by engagement_to_dict."""
+    return EngagementStatistics(
+        recent_avg_post_likes=data['recent_avg_post_likes'],
+        recent_avg_post_comments=data['recent_avg_post_comments'],
+        recent_avg_post_reshares=data['recent_avg_post_reshares'],
+        recent_post_count=data['recent_post_count'],
+        median_post_likes=data.get('median_post_likes', 0.0),
+        median_post_comments=data.get('median_post_comments', 0.0),
+        stdev_post_likes=data.get('stdev_post_likes', 0.0),
+        stdev_post_comments=data.get('stdev_post_comments', 0.0),
+        engagement_rate=data.get('engagement_rate', 0.0)
+    )
+
+
+def profile_to_dict(profile: Profile) -> Dict[str, Any]:
+    """Convert a profile, including its nested statistics, to a dictionary."""
+    return {
+        'userid': profile.userid,
+        'username': profile.username,
+        'full_name': profile.full_name,
+        'bio': profile.bio,
+        'is_verified': profile.is_verified,
+        'is_private': profile.is_private,
+        'profile_pic_url': profile.profile_pic_url,
+        'statistics': statistics_to_dict(profile.statistics),
+        'engagement_stats': (
+            engagement_to_dict(profile.engagement_stats) if profile.engagement_stats is not None else None
+        ),
+    }
+
+
+def profile_from_dict(data: Dict[str, Any]) -> Profile:
+    """Build a profile from a dictionary made by profile_to_dict."""
+    return Profile(
+        userid=data['userid'],
+        username=data['username'],
+        full_name=data.get('full_name'),
+        bio=data.get('bio'),
+        is_verified=data.get('is_verified', False),
+        is_private=data.get('is_private', False),
+        profile_pic_url=data.get('profile_pic_url'),
+        statistics=statistics_from_dict(data['statistics']),
+        engagement_stats=engagement_from_dict(data['engagement_stats']) if data.get('engagement_stats') else None
+    )
@@ -3,6 +3,11 @@ import re
 from typing import Optional, Tuple
 
 
+# Instagram usernames can contain letters, numbers, periods and underscores.
+# They cannot start with a period and are limited to 30 characters.
+USERNAME_PATTERN = re.compile(r'[a-zA-Z0-9_][a-zA-Z0-9_.]{0,29}')
+
+
 class ProfileValidator:
     """Validator for Instagram profile operations."""
     
@@ -20,11 +25,7 @@ class ProfileValidator:
         if not username:
             return False, "Username cannot be empty"
             
-        # Instagram usernames can contain letters, numbers, periods and underscores
-        # They cannot start with a period and are limited to 30 characters
-        pattern = r'^[a-zA-Z0-9_][a-zA-Z0-9_.]{0,29}$'
-        
-        if not re.match(pattern, username):
+        if not USERNAME_PATTERN.fullmatch(username):
             return False, "Invalid username format"
             
         return True, None
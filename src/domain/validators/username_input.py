@@ -0,0 +1,140 @@
+"""Parsing of bulk username input such as pasted lists, files and streams."""
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from src.domain.validators.profile_validator import ProfileValidator
+
+
+_SEPARATORS = re.compile(r'[\s,;]+')
+_PROFILE_URL = re.compile(r'(?:https?://)?(?:www\.|m\.)?instagram\.com/([^/?#]*)', re.IGNORECASE)
+
+# First path segments of instagram.com links that are not profiles
+NON_PROFILE_PATHS = frozenset({'accounts', 'direct', 'explore', 'p', 'reel', 'reels', 'stories', 'tv'})
+
+
+@dataclass(frozen=True)
+class UsernameBatch:
+    """Result of parsing bulk username input."""
+    valid: List[str]
+    rejected: Dict[str, str]
+    duplicates: int
+
+
+def normalize_username(token: str) -> str:
+    """
+    Reduce a username, '@' handle or profile URL to a lower-case username.
+
+    Args:
+        token: One entry of the input
+
+    Returns:
+        The normalized username; it is not validated
+    """
+    token = token.strip()
+    match = _PROFILE_URL.match(token)
+    if match:
+        token = match.group(1)
+    return token.lstrip('@').lower()
+
+
+class UsernameCollector:
+    """
+    Accumulates usernames from any number of text chunks.
+
+    Entries are normalized, validated once and deduplicated in input order,
+    so only clean, unique names reach the API.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty collector."""
+        self._valid: Dict[str, None] = {}
+        self._rejected: Dict[str, str] = {}
+        self._duplicates = 0
+
+    def add_text(self, text: str) -> None:
+        """Add every entry of text separated by commas, semicolons or whitespace."""
+        for token in _SEPARATORS.split(text):
+            if token:
+                self.add(token)
+
+    def add(self, token: str) -> None:
+        """Add one entry."""
+        username = normalize_username(token)
+        if username in self._valid or token in self._rejected:
+            self._duplicates += 1
+            return
+
+        match = _PROFILE_URL.match(token.strip())
+        if match and match.group(1).lower() in NON_PROFILE_PATHS:
+            self._rejected[token] = "Not a profile URL"
+            return
+
+        is_valid, error = ProfileValidator.validate_username(username)
+        if is_valid:
+            self._valid[username] = None
+        else:
+            self._rejected[token] = error or "Invalid username"
+
+    def result(self) -> UsernameBatch:
+        """Return the usernames collected so far."""
+        return UsernameBatch(
+            valid=list(self._valid),
+            rejected=dict(self._rejected),
+            duplicates=self._duplicates
+        )
+
+
+def parse_usernames(text: str) -> UsernameBatch:
+    """
+    Parse usernames separated by commas, semicolons or whitespace.
+
+    Args:
+        text: Raw text, e.g. pasted into the search box
+
+    Returns:
+        The valid usernames in input order and the rejected entries
+    """
+    collector = UsernameCollector()
+    collector.add_text(text)
+    return collector.result()
+
+
+def read_usernames(lines: Iterable[str]) -> UsernameBatch:
+    """
+    Parse usernames from a file or stream, one line at a time.
+
+    Args:
+        lines: Open text file, stdin or any iterable of lines
+
+    Returns:
+        The valid usernames in input order and the rejected entries
+    """
+    collector = UsernameCollector()
+    for line in lines:
+        collector.add_text(line)
+    return collector.result()
+
+
+def split_query(query: str) -> List[str]:
+    """
+    Split a comma separated query of API clients into usernames.
+
+    Order and repeats are kept so results line up with the query.
+
+    Args:
+        query: Comma separated usernames
+
+    Returns:
+        The stripped usernames
+
+    Raises:
+        ValueError: If an entry is empty or not a valid username
+    """
+    usernames = [user.strip() for user in query.split(',')]
+    if not all(usernames):
+        raise ValueError("Query cannot contain empty usernames")
+    invalid = [user for user in usernames if not ProfileValidator.validate_username(user)[0]]
+    if invalid:
+        raise ValueError(f"Invalid usernames in query: {', '.join(invalid[:10])}")
+    return usernames
@@ -0,0 +1,185 @@
+"""Asyncio client for the HikerAPI Instagram API."""
+import asyncio
+import time
+from typing import Any, Optional
+
+import hikerapi
+import httpx
+
+from src.domain.analytics.engagement import EngagementCalculator
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileSearchResult
+from src.domain.validators.username_input import split_query
+from src.infrastructure.api.errors import TransientApiError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.http_pool import AsyncHttpPool, PoolConfig
+from src.infrastructure.api.request_scheduler import AsyncRequestScheduler
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+
+
+class AsyncHikerApiClient:
+    """Asyncio client for interacting with the HikerAPI Instagram API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrency: int = 100,
+        engagement_window: int = 5,
+        http_pool: Optional[AsyncHttpPool] = None,
+        scheduler: Optional[AsyncRequestScheduler] = None,
+        metrics: Optional[MetricsRegistry] = None
+    ) -> None:
+        """
+        Initialize the asyncio HikerAPI client.
+
+        Args:
+            api_key: The API key for authentication
+            max_concurrency: Maximum number of requests in flight at once
+            engagement_window: Number of recent posts engagement is computed over
+            http_pool: Keep-alive connection pool shared with other clients;
+                when None the client gets its own pool sized for max_concurrency
+            scheduler: Rate limiter and retry policy every API call goes
+                through; share one instance to share its budget
+            metrics: Registry receiving per-endpoint latency, call, error
+                and retry counters; share one instance to aggregate
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._client = hikerapi.AsyncClient(token=api_key)
+        self._owns_pool = http_pool is None
+        self._http_pool = http_pool or AsyncHttpPool(PoolConfig.for_workers(max_concurrency))
+        if isinstance(getattr(self._client, '_client', None), httpx.AsyncClient):
+            response_hooks = self._http_pool.attach(self._client).event_hooks['response']
+            if self._check_status not in response_hooks:
+                response_hooks.append(self._check_status)
+        self._scheduler = scheduler or AsyncRequestScheduler()
+        self._metrics = metrics or MetricsRegistry()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._engagement = EngagementCalculator(window=engagement_window)
+
+    async def get_engagement_stats(self, userid: str, followers_count: int = 0) -> EngagementStatistics:
+        """
+        Fetch engagement statistics for a profile by user id.
+
+        Media pages are fetched until the engagement window is filled or
+        the account has no older posts.
+
+        Args:
+            userid: The Instagram id to look up
+            followers_count: Follower count used for the engagement rate
+
+        Returns:
+            Engagement statistics for the recent posts
+
+        Raises:
+            Exception: If the API request fails
+        """
+        response = await self._call('user_medias_v2', userid)
+        items = HikerApiClient._media_items(response)
+        page_id = response.get('next_page_id')
+        while items and len(items) < self._engagement.window and page_id:
+            page = await self._call('user_medias_v2', userid, page_id)
+            page_items = HikerApiClient._media_items(page)
+            if not page_items:
+                break
+            items.extend(page_items)
+            page_id = page.get('next_page_id')
+        return self._engagement.compute(items, followers_count)
+
+    async def get_profile(self, username: str) -> Profile:
+        """
+        Fetch a profile by username.
+
+        Args:
+            username: The Instagram username to look up
+
+        Returns:
+            The profile data; private profiles have no engagement statistics
+
+        Raises:
+            Exception: If the API request fails
+        """
+        response = await self._call('user_by_username_v1', username)
+        engagement_stats = None
+        # The media of private accounts cannot be read, so the call is skipped
+        if not response.get('is_private'):
+            engagement_stats = await self.get_engagement_stats(
+                response.get('pk', ''), followers_count=response.get('follower_count', 0)
+            )
+        return HikerApiClient._map_profile_response(stats=response, engagement_stats=engagement_stats)
+
+    async def search_profiles(self, query: str) -> ProfileSearchResult:
+        """
+        Search for profiles matching the query.
+
+        Args:
+            query: The search query, comma separated list of users
+
+        Returns:
+            The search results, in input order
+
+        Raises:
+            Exception: If any API request fails
+        """
+        start = time.perf_counter()
+        usernames = split_query(query)
+
+        # Names differing only in case are fetched once
+        unique = list(dict.fromkeys(username.lower() for username in usernames))
+        fetched = await asyncio.gather(*(self.get_profile(username) for username in unique))
+        by_name = dict(zip(unique, fetched))
+        profiles = [by_name[username.lower()] for username in usernames]
+
+        return ProfileSearchResult(
+            profiles=profiles,
+            total_count=len(profiles),
+            query_time_ms=round((time.perf_counter() - start) * 1000)
+        )
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Registry holding the client's call, error and retry counters."""
+        return self._metrics
+
+    async def _call(self, endpoint: str, *args: Any) -> Any:
+        """
+        Call a hikerapi endpoint through the request scheduler.
+
+        Every attempt is timed and counted and holds a semaphore slot;
+        attempts after the first count as retries.
+        """
+        metrics = self._metrics
+        attempts = 0
+
+        async def request() -> Any:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                metrics.increment('api_retries_total', endpoint=endpoint)
+            metrics.increment('api_requests_total', endpoint=endpoint)
+            start = time.perf_counter()
+            try:
+                async with self._semaphore:
+                    return await getattr(self._client, endpoint)(*args)
+            except httpx.TransportError as e:
+                metrics.increment('api_errors_total', endpoint=endpoint, error=type(e).__name__)
+                raise TransientApiError(f"{endpoint} failed: {e}") from e
+            except Exception as e:
+                metrics.increment('api_errors_total', endpoint=endpoint, error=type(e).__name__)
+                raise
+            finally:
+                metrics.observe('api_request_seconds', time.perf_counter() - start, endpoint=endpoint)
+
+        return await self._scheduler.call(request)
+
+    @staticmethod
+    async def _check_status(response: httpx.Response) -> None:
+        """Turn error responses into exceptions, as HikerApiClient._check_status."""
+        if response.status_code >= 400:
+            # Async hooks run before the body is read; error bodies are small
+            await response.aread()
+        HikerApiClient._check_status(response)
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections unless the pool was shared in by the caller."""
+        if self._owns_pool:
+            await self._http_pool.aclose()
@@ -0,0 +1,55 @@
+"""Errors raised by the HikerAPI clients."""
+from typing import Optional
+
+from src.domain.models.lookup import (
+    LOOKUP_ERROR,
+    LOOKUP_NOT_FOUND,
+    LOOKUP_PRIVATE,
+    LOOKUP_RATE_LIMITED,
+    LOOKUP_TRANSIENT,
+)
+
+
+class ApiError(Exception):
+    """Base class for errors returned by the HikerAPI service."""
+
+    lookup_status = LOOKUP_ERROR
+
+
+class NotFoundError(ApiError):
+    """The requested account does not exist (HTTP 404)."""
+
+    lookup_status = LOOKUP_NOT_FOUND
+
+
+class PrivateAccountError(ApiError):
+    """The account is private, so its media cannot be read."""
+
+    lookup_status = LOOKUP_PRIVATE
+
+
+class AuthError(ApiError):
+    """The API key was rejected (HTTP 401 or 403)."""
+
+
+class TransientApiError(ApiError):
+    """Temporary failure (network error, server error) worth retrying."""
+
+    lookup_status = LOOKUP_TRANSIENT
+
+
+class RateLimitError(TransientApiError):
+    """The service rejected the request because of rate limiting (HTTP 429)."""
+
+    lookup_status = LOOKUP_RATE_LIMITED
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            message: Description of the failure
+            retry_after: Seconds the service asked us to wait, if given
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
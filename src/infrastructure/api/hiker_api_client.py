@@ -1,82 +1,166 @@
 """Client for the HikerAPI Instagram API."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, replace
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, List, Optional
 
 import hikerapi
+import httpx
 
+from src.domain.analytics.engagement import EngagementCalculator, MediaColumns
+from src.domain.models.lookup import LOOKUP_OK, LookupOutcome, failed_outcome
 from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics, ProfileSearchResult
+from src.domain.validators.username_input import split_query
+from src.infrastructure.api.errors import (
+    ApiError,
+    AuthError,
+    NotFoundError,
+    PrivateAccountError,
+    RateLimitError,
+    TransientApiError,
+)
+from src.infrastructure.api.http_pool import HttpPool, PoolConfig
+from src.infrastructure.api.request_scheduler import RequestScheduler
+from src.infrastructure.cache.memory_cache import CacheStats, LruTtlCache
+from src.infrastructure.metrics.metrics_registry import MetricsRegistry
+from src.infrastructure.storage.response_archive import ResponseArchive
+
+
+def _cache_stat(cache: LruTtlCache[Any], name: str) -> float:
+    """One counter of a cache's current statistics."""
+    return getattr(cache.stats, name)
 
 
 class HikerApiClient:
     """Client for interacting with the HikerAPI Instagram API."""
     
-    def __init__(self, api_key: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        max_workers: int = 8,
+        cache_size: int = 1024,
+        cache_ttl: float = 300.0,
+        scheduler: Optional[RequestScheduler] = None,
+        engagement_window: int = 5,
+        metrics: Optional[MetricsRegistry] = None,
+        http_pool: Optional[HttpPool] = None,
+        load_engagement: bool = True,
+        archive: Optional[ResponseArchive] = None
+    ) -> None:
         """
         Initialize the HikerAPI client.
         
         Args:
             api_key: The API key for authentication
+            max_workers: Maximum number of profiles fetched concurrently
+                by search_profiles
+            cache_size: Maximum number of profiles and of engagement results
+                kept in memory; 0 disables caching but still coalesces
+                concurrent requests for the same account
+            cache_ttl: Seconds a cached result stays fresh
+            scheduler: Rate limiter and retry policy every API call goes
+                through; share one instance to share its budget
+            engagement_window: Number of recent posts engagement is computed over
+            metrics: Registry receiving per-endpoint latency, call, error,
+                retry and cache counters; share one instance to aggregate
+            http_pool: Keep-alive connection pool the requests go through;
+                share one instance between clients to share connections.
+                When None the client gets its own pool sized for max_workers
+            load_engagement: Whether profile lookups also fetch engagement
+                statistics; when False they only cost the profile request
+                and fill_engagement loads the statistics on demand
+            archive: Archive every raw profile and media response is
+                appended to, for replaying them offline later
         """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self._client = hikerapi.Client(token=api_key)
+        self._scheduler = scheduler or RequestScheduler()
+        self._owns_pool = http_pool is None
+        self._http_pool = http_pool or HttpPool(PoolConfig.for_workers(max_workers))
+        self._attach(self._client)
+        self._max_workers = max_workers
+        self._load_engagement = load_engagement
+        self._archive = archive
+        self._engagement = EngagementCalculator(window=engagement_window)
+        self._profile_cache: LruTtlCache[Profile] = LruTtlCache(max_size=cache_size, ttl=cache_ttl)
+        # Media metrics rather than statistics are cached, since the
+        # engagement rate depends on the follower count of each lookup
+        self._engagement_cache: LruTtlCache[MediaColumns] = LruTtlCache(
+            max_size=cache_size, ttl=cache_ttl
+        )
+        self._metrics = metrics or MetricsRegistry()
+        for cache_name, cache in (('profiles', self._profile_cache), ('engagement', self._engagement_cache)):
+            for field in fields(CacheStats):
+                if field.name != 'size':
+                    self._metrics.register_counter(
+                        f'cache_{field.name}_total',
+                        partial(_cache_stat, cache, field.name),
+                        cache=cache_name
+                    )
+    
+    def close(self) -> None:
+        """Close the connection pool unless it was shared in by the caller."""
+        if self._owns_pool:
+            self._http_pool.close()
+    
+    @property
+    def load_engagement(self) -> bool:
+        """Whether profile lookups also fetch engagement statistics."""
+        return self._load_engagement
+    
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Registry holding the client's call, error, retry and cache metrics."""
+        return self._metrics
+    
+    @property
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """Hit, miss and coalesce counters of the profile and engagement caches."""
+        return {
+            'profiles': self._profile_cache.stats,
+            'engagement': self._engagement_cache.stats,
+        }
+
+    def _attach(self, client: Any) -> Optional[httpx.Client]:
+        """
+        Route a hikerapi client through the connection pool.
+        
+        Args:
+            client: The hikerapi client
+            
+        Returns:
+            The pooled httpx client, or None if the client has no httpx client
+        """
+        if not isinstance(getattr(client, '_client', None), httpx.Client):
+            return None
+        http_client = self._http_pool.attach(client)
+        response_hooks = http_client.event_hooks['response']
+        if self._check_status not in response_hooks:
+            response_hooks.append(self._check_status)
+        return http_client
 
-    def get_engagement_stats(self, userid: str) -> Dict[str, Any]:
+    def get_engagement_stats(self, userid: str, followers_count: int = 0) -> EngagementStatistics:
         """
-        Fetch engagement statistics for a profile by username.
+        Fetch engagement statistics for a profile by user id.
+        
+        Media pages are fetched until the engagement window is filled or
+        the account has no older posts.
         
         Args:
-            id: The Instagram id to look up
+            userid: The Instagram id to look up
+            followers_count: Follower count used for the engagement rate
             
         Returns:
-            Engagement statistics as a dictionary
+            Engagement statistics for the recent posts
             
         Raises:
             Exception: If the API request fails
         """
-        response = self._client.user_medias_v2(userid)
-        result = {}
-        top_5_posts_avg_likes = 0
-        post_count = 0
-        response = response.get('response', {})
-        for ix, post in enumerate(response.get('items', [])):
-            if 'like_count' in post:
-                top_5_posts_avg_likes += post['like_count']
-                post_count += 1
-            if ix == 4:
-                break
-        if post_count > 0:
-            top_5_posts_avg_likes /= post_count
-        result['top_5_posts_avg_likes'] = top_5_posts_avg_likes
-
-        top_5_posts_avg_comments = 0
-        for ix, post in enumerate(response.get('items', [])):
-            if 'comment_count' in post:
-                top_5_posts_avg_comments += post['comment_count']
-            if ix == 4:
-                break
-        if post_count > 0:
-            top_5_posts_avg_comments /= post_count
-        result['top_5_posts_avg_comments'] = top_5_posts_avg_comments
-
-        top_5_posts_avg_reshares = 0
-        for ix, post in enumerate(response.get('items', [])):
-            if 'reshare_count' in post:
-                top_5_posts_avg_reshares += post['reshare_count']
-            if ix == 4:
-                break
-        if post_count > 0:
-            top_5_posts_avg_reshares /= post_count
-        result['top_5_posts_avg_reshares'] = top_5_posts_avg_reshares
-
-        result['recent_post_count'] = post_count
-
-        eng_stats = EngagementStatistics(
-            recent_avg_post_likes=int(result.get('top_5_posts_avg_likes', 0)),
-            recent_avg_post_comments=int(result.get('top_5_posts_avg_comments', 0)),
-            recent_avg_post_reshares=int(result.get('top_5_posts_avg_reshares', 0)),
-            recent_post_count=int(result.get('recent_post_count', 0))
-        )
-        
-        return eng_stats
+        columns = self._engagement_cache.get_or_load(userid, lambda: self._fetch_media(userid))
+        return self._engagement.summarize(columns, followers_count)
     
     def get_profile(self, username: str) -> Profile:
         """
@@ -91,18 +175,63 @@ class HikerApiClient:
         Raises:
             Exception: If the API request fails
         """
-        response = self._client.user_by_username_v1(username)
-        engagement_stats = self.get_engagement_stats(response.get('pk', ''))
-        mapped_response = self._map_profile_response(stats=response, engagement_stats=engagement_stats)
-        return mapped_response
+        return self._profile_cache.get_or_load(username.lower(), lambda: self._fetch_profile(username))
+    
+    def fill_engagement(self, profile: Profile) -> Profile:
+        """
+        Load the engagement statistics of a profile fetched without them.
+        
+        Args:
+            profile: The profile
+            
+        Returns:
+            A copy of the profile with engagement statistics, or the profile
+            itself if it already has them or is private
+            
+        Raises:
+            Exception: If the API request fails
+        """
+        if not profile.engagement_pending:
+            return profile
+        engagement_stats = self.get_engagement_stats(
+            profile.userid, followers_count=profile.statistics.followers_count
+        )
+        return replace(profile, engagement_stats=engagement_stats)
+    
+    def _fetch_media(self, userid: str) -> MediaColumns:
+        """Fetch media pages until the engagement window is filled."""
+        response = self._call('user_medias_v2', userid, archive=False)
+        items = self._media_items(response)
+        page_id = response.get('next_page_id')
+        while items and len(items) < self._engagement.window and page_id:
+            page = self._call('user_medias_v2', userid, page_id, archive=False)
+            page_items = self._media_items(page)
+            if not page_items:
+                break
+            items.extend(page_items)
+            page_id = page.get('next_page_id')
+        if self._archive is not None:
+            # One response per user, so a replay sees the same window
+            self._archive.append('user_medias_v2', userid, self._merge_media_pages(response, items, page_id))
+        return self._engagement.columns(items)
+    
+    def _fetch_profile(self, username: str) -> Profile:
+        """Fetch a profile and, unless it is private or loading is off, its engagement statistics."""
+        response = self._call('user_by_username_v1', username)
+        engagement_stats = None
+        # The media of private accounts cannot be read, so the call is skipped
+        if self._load_engagement and not response.get('is_private'):
+            engagement_stats = self.get_engagement_stats(
+                response.get('pk', ''), followers_count=response.get('follower_count', 0)
+            )
+        return self._map_profile_response(stats=response, engagement_stats=engagement_stats)
     
     def search_profiles(self, query: str) -> ProfileSearchResult:
         """
         Search for profiles matching the query.
         
         Args:
-            query: The search query, comma separated lsit of users
-            limit: Maximum number of results to return
+            query: The search query, comma separated list of users
             
         Returns:
             The search results
@@ -110,26 +239,147 @@ class HikerApiClient:
         Raises:
             Exception: If the API request fails
         """
-        response = {"users": [], "total_count": 0}
-        user_list = query.split(',')
-        for user in user_list:
-            if not user.strip():
-                raise ValueError("Query cannot contain empty usernames")
-            response["users"].append(self._client.user_by_username_v1(user.strip()))
-            response["total_count"] += 1
+        start = time.perf_counter()
+        usernames = split_query(query)
         
-        profiles = []
-        for user in response.get('users', []):
-            engagement_stats = self.get_engagement_stats(user.get('pk', ''))
-            profiles.append(self._map_profile_response(stats=user, engagement_stats=engagement_stats))
+        # Each worker runs the lookup and engagement calls for one profile, so
+        # the round-trips of different profiles overlap. map() keeps input order.
+        workers = min(self._max_workers, len(usernames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            profiles = list(executor.map(self.get_profile, usernames))
         
         return ProfileSearchResult(
             profiles=profiles,
-            total_count=response.get('total_count', 0),
-            query_time_ms=response.get('query_time_ms', 0)
+            total_count=len(profiles),
+            query_time_ms=round((time.perf_counter() - start) * 1000)
         )
     
-    def _map_profile_response(self, stats: Dict[str, Any], engagement_stats: Dict[str, Any]) -> Profile:
+    def lookup_profiles(self, query: str) -> List[LookupOutcome]:
+        """
+        Look up every username of the query, keeping going past failures.
+        
+        Args:
+            query: The search query, comma separated list of users
+            
+        Returns:
+            One outcome per username in input order, holding the profile or
+            the classified error
+            
+        Raises:
+            ValueError: If the query holds an empty or invalid username
+        """
+        usernames = split_query(query)
+        workers = min(self._max_workers, len(usernames))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._lookup, usernames))
+    
+    def _lookup(self, username: str) -> LookupOutcome:
+        """Fetch one profile, turning a failure into its outcome."""
+        try:
+            profile = self.get_profile(username)
+        except Exception as e:
+            return failed_outcome(username, e)
+        return LookupOutcome(username=username, status=LOOKUP_OK, profile=profile)
+    
+    def _call(self, endpoint: str, *args: Any, archive: bool = True) -> Any:
+        """
+        Call a hikerapi endpoint through the request scheduler.
+        
+        Every attempt is timed and counted; attempts after the first count
+        as retries. Successful responses are archived when an archive is set,
+        unless archive is False because the caller archives them itself.
+        """
+        metrics = self._metrics
+        attempts = 0
+        
+        def request() -> Any:
+            nonlocal attempts
+            attempts += 1
+            if attempts > 1:
+                metrics.increment('api_retries_total', endpoint=endpoint)
+            metrics.increment('api_requests_total', endpoint=endpoint)
+            start = time.perf_counter()
+            try:
+                response = self._request(endpoint, *args)
+            except httpx.TransportError as e:
+                metrics.increment('api_errors_total', endpoint=endpoint, error=type(e).__name__)
+                raise TransientApiError(f"{endpoint} failed: {e}") from e
+            except Exception as e:
+                metrics.increment('api_errors_total', endpoint=endpoint, error=type(e).__name__)
+                raise
+            finally:
+                metrics.observe('api_request_seconds', time.perf_counter() - start, endpoint=endpoint)
+            if archive and self._archive is not None:
+                self._archive.append(endpoint, args[0], response)
+            return response
+        
+        return self._scheduler.call(request)
+    
+    def _request(self, endpoint: str, *args: Any) -> Any:
+        """Make one attempt at a hikerapi endpoint call."""
+        return getattr(self._client, endpoint)(*args)
+    
+    @staticmethod
+    def _check_status(response: httpx.Response) -> None:
+        """
+        Turn error responses into exceptions.
+        
+        Rate limiting and server errors become retryable exceptions; missing
+        accounts, private accounts, rejected keys and other client errors
+        become their own ApiError subclasses.
+        """
+        status = response.status_code
+        if status < 400:
+            return
+        if status == 429:
+            retry_after = response.headers.get('retry-after')
+            raise RateLimitError(
+                "Rate limited by HikerAPI",
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None
+            )
+        if status >= 500:
+            raise TransientApiError(f"HikerAPI server error {status}")
+        
+        # Hooks run before the body is read; error bodies are small
+        response.read()
+        try:
+            detail = str(response.json().get('detail', ''))
+        except ValueError:
+            detail = response.text[:200]
+        if status == 404:
+            raise NotFoundError(detail or "Not found")
+        if status in (401, 403):
+            if 'private' in detail.lower():
+                raise PrivateAccountError(detail)
+            raise AuthError(f"HikerAPI rejected the API key ({status}): {detail}")
+        raise ApiError(f"HikerAPI error {status}: {detail}")
+    
+    @staticmethod
+    def _media_items(response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Media items of one user medias API response page."""
+        return list(response.get('response', {}).get('items', []))
+    
+    @staticmethod
+    def _merge_media_pages(
+        first: Dict[str, Any],
+        items: List[Dict[str, Any]],
+        next_page_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """A user medias API response holding the items of several pages."""
+        return {**first, 'response': {**first.get('response', {}), 'items': items}, 'next_page_id': next_page_id}
+    
+    @staticmethod
+    def _map_engagement_response(
+        response: Dict[str, Any],
+        calculator: EngagementCalculator,
+        followers_count: int = 0
+    ) -> EngagementStatistics:
+        """Map a user medias API response to engagement statistics."""
+        items = response.get('response', {}).get('items', [])
+        return calculator.compute(items, followers_count=followers_count)
+    
+    @staticmethod
+    def _map_profile_response(stats: Dict[str, Any], engagement_stats: Optional[EngagementStatistics]) -> Profile:
         """Map API response to domain model."""
         
         statistics = ProfileStatistics(
@@ -0,0 +1,219 @@
+"""Shared keep-alive HTTP connection pools for the hikerapi clients."""
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection limits and per-phase timeouts of a pool."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    write_timeout: float = 10.0
+    pool_timeout: float = 10.0
+    http2: bool = False
+
+    @classmethod
+    def for_workers(cls, workers: int, **overrides: Any) -> "PoolConfig":
+        """
+        Size a pool so that every worker keeps its connection alive.
+
+        Args:
+            workers: Number of requests in flight at once
+            **overrides: Other fields of the config
+
+        Returns:
+            A config with at least workers kept-alive connections
+        """
+        defaults = cls()
+        return cls(**{
+            'max_connections': max(defaults.max_connections, workers),
+            'max_keepalive_connections': max(defaults.max_keepalive_connections, workers),
+            **overrides,
+        })
+
+    def limits(self) -> httpx.Limits:
+        """Connection limits in httpx form."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        """Per-phase timeouts in httpx form."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout
+        )
+
+
+def _check_http2(config: PoolConfig) -> None:
+    """Make sure the h2 package is present when HTTP/2 is requested."""
+    if not config.http2:
+        return
+    try:
+        import h2  # noqa: F401
+    except ImportError as e:
+        raise ImportError("HTTP/2 requires the 'h2' package (pip install httpx[http2])") from e
+
+
+class _BasePool:
+    """Owns one lazily created httpx client shared by every attached api client."""
+
+    def __init__(self, config: Optional[PoolConfig] = None) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            config: Limits and timeouts; PoolConfig() when None
+
+        Raises:
+            ImportError: If HTTP/2 is requested without the h2 package
+        """
+        self._config = config or PoolConfig()
+        _check_http2(self._config)
+        self._lock = threading.Lock()
+        self._client: Any = None
+        self._base_url: Optional[str] = None
+
+    @property
+    def config(self) -> PoolConfig:
+        """Limits and timeouts of the pool."""
+        return self._config
+
+    def _attach(self, api: Any) -> Any:
+        """
+        Route a hikerapi client's requests through the pooled httpx client.
+
+        hikerapi sends its credentials as per-request headers, so clients
+        with different keys can share one pool as long as they talk to the
+        same host.
+
+        Args:
+            api: A hikerapi.Client or hikerapi.AsyncClient
+
+        Returns:
+            The httpx client the api client replaced, for the caller to close
+
+        Raises:
+            ValueError: If the api client talks to another host than the pool
+        """
+        with self._lock:
+            if self._client is None:
+                self._base_url = api._url
+                self._client = self._create(api._url)
+            elif api._url != self._base_url:
+                raise ValueError(f"Pool serves {self._base_url}, not {api._url}")
+            replaced, api._client = api._client, self._client
+            # hikerapi passes its timeout with every request; a Timeout
+            # object gives connect and read their own limits
+            api._timeout = self._config.timeout()
+        return replaced
+
+    def _create(self, base_url: str) -> Any:
+        """Create the pooled httpx client for base_url."""
+        raise NotImplementedError
+
+
+class HttpPool(_BasePool):
+    """
+    Keep-alive connection pool shared by hikerapi.Client instances.
+
+    httpx.Client is thread-safe, so one pool serves every worker thread of
+    every attached client and connections (and their TLS sessions) are
+    reused instead of being opened per request.
+    """
+
+    @property
+    def client(self) -> Optional[httpx.Client]:
+        """The pooled httpx client, None until a client is attached."""
+        return self._client
+
+    def attach(self, api: Any) -> httpx.Client:
+        """
+        Route a hikerapi.Client's requests through the pool.
+
+        Args:
+            api: The hikerapi.Client
+
+        Returns:
+            The pooled httpx client
+
+        Raises:
+            ValueError: If the client talks to another host than the pool
+        """
+        replaced = self._attach(api)
+        if isinstance(replaced, httpx.Client) and replaced is not self._client:
+            replaced.close()
+        return self._client
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    def _create(self, base_url: str) -> httpx.Client:
+        return httpx.Client(
+            base_url=base_url,
+            limits=self._config.limits(),
+            timeout=self._config.timeout(),
+            http2=self._config.http2
+        )
+
+
+class AsyncHttpPool(_BasePool):
+    """
+    Keep-alive connection pool shared by hikerapi.AsyncClient instances.
+
+    httpx.AsyncClient can be shared by any number of tasks of one event
+    loop; the connection limit also caps the requests in flight.
+    """
+
+    @property
+    def client(self) -> Optional[httpx.AsyncClient]:
+        """The pooled httpx client, None until a client is attached."""
+        return self._client
+
+    def attach(self, api: Any) -> httpx.AsyncClient:
+        """
+        Route a hikerapi.AsyncClient's requests through the pool.
+
+        The client's own httpx client is dropped; it has not opened any
+        connection yet, so there is nothing to close.
+
+        Args:
+            api: The hikerapi.AsyncClient
+
+        Returns:
+            The pooled httpx client
+
+        Raises:
+            ValueError: If the client talks to another host than the pool
+        """
+        self._attach(api)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _create(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url,
+            limits=self._config.limits(),
+            timeout=self._config.timeout(),
+            http2=self._config.http2
+        )
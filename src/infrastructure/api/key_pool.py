@@ -0,0 +1,268 @@
+"""Pool of HikerAPI keys with per-key load, quota and error tracking."""
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.domain.models.lookup import PERMANENT_STATUSES
+from src.infrastructure.api.errors import AuthError, RateLimitError
+
+if TYPE_CHECKING:
+    # Only needed for annotations; main.py reads KEYS_ENV_VAR before httpx is loaded
+    import httpx
+
+
+# Environment variable holding comma or whitespace separated keys
+KEYS_ENV_VAR = 'HIKERAPI_KEYS'
+
+# Response header some deployments use to report the requests left on a key
+QUOTA_HEADER = 'x-ratelimit-remaining'
+
+
+def parse_api_keys(text: str) -> Dict[str, Optional[int]]:
+    """
+    Parse API keys, one per line or separated by commas.
+
+    A key may be followed by whitespace and its remaining request quota;
+    blank lines and lines starting with '#' are ignored.
+
+    Args:
+        text: Contents of a keys file or environment variable
+
+    Returns:
+        Key to known quota (None if not given), in input order without duplicates
+
+    Raises:
+        ValueError: If a quota is not a non-negative integer
+    """
+    keys: Dict[str, Optional[int]] = {}
+    for line in text.replace(',', '\n').splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        key, *rest = line.split()
+        if rest and not rest[0].isdigit():
+            raise ValueError(f"Invalid quota for key ending in {key[-4:]}: {rest[0]}")
+        keys.setdefault(key, int(rest[0]) if rest else None)
+    return keys
+
+
+def load_api_keys(path: Optional[str] = None, environ: Mapping[str, str] = os.environ) -> Dict[str, Optional[int]]:
+    """
+    Read API keys from a file, or from the HIKERAPI_KEYS environment variable.
+
+    Args:
+        path: Keys file; the environment is used when None
+        environ: Environment to read the variable from
+
+    Returns:
+        Key to known quota, as parse_api_keys; empty if no keys are configured
+    """
+    if path is not None:
+        with open(path, encoding='utf-8') as keys_file:
+            return parse_api_keys(keys_file.read())
+    return parse_api_keys(environ.get(KEYS_ENV_VAR, ''))
+
+
+def mask_key(key: str) -> str:
+    """Short form of a key that is safe to log and show."""
+    return f'…{key[-4:]}'
+
+
+@dataclass(frozen=True)
+class KeyStats:
+    """Point-in-time state of one key of a pool."""
+    key: str
+    in_flight: int
+    requests: int
+    errors: int
+    error_rate: float
+    remaining_quota: Optional[int]
+    quarantined_for: float
+    quarantines: int
+
+
+class _KeyState:
+    """Mutable bookkeeping of one key; guarded by the pool's lock."""
+
+    __slots__ = (
+        'key', 'in_flight', 'requests', 'errors', 'recent', 'remaining',
+        'quarantined_until', 'strikes', 'quarantines',
+    )
+
+    def __init__(self, key: str, quota: Optional[int], window: int) -> None:
+        self.key = key
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.recent: Deque[bool] = deque(maxlen=window)
+        self.remaining = quota
+        self.quarantined_until = 0.0
+        self.strikes = 0
+        self.quarantines = 0
+
+    @property
+    def error_rate(self) -> float:
+        return sum(self.recent) / len(self.recent) if self.recent else 0.0
+
+
+class KeyPool:
+    """
+    Spreads requests over several API keys.
+
+    acquire() hands out the least loaded usable key: fewest requests in
+    flight, then lowest recent error rate, then most quota left. A key is
+    quarantined when it is rate limited (for the server's Retry-After, or
+    an interval doubling with each consecutive 429), when it is rejected
+    (for auth_quarantine seconds) and when its quota runs out. When every
+    key is quarantined, acquire() raises RateLimitError with the wait until
+    the first one returns, so the request scheduler backs off and retries.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        quotas: Optional[Mapping[str, Optional[int]]] = None,
+        quarantine: float = 60.0,
+        max_quarantine: float = 900.0,
+        auth_quarantine: float = 900.0,
+        error_window: int = 50,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            keys: API keys, at least one
+            quotas: Known remaining request quota per key
+            quarantine: Seconds a rate limited key rests without Retry-After
+            max_quarantine: Longest rest after consecutive rate limits
+            auth_quarantine: Seconds a rejected key rests
+            error_window: Number of recent requests the error rate covers
+            clock: Function returning the current time in seconds
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            raise ValueError("At least one API key is required")
+        quotas = quotas or {}
+        self._states = {key: _KeyState(key, quotas.get(key), error_window) for key in keys}
+        self._quarantine = quarantine
+        self._max_quarantine = max_quarantine
+        self._auth_quarantine = auth_quarantine
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> List[str]:
+        """The keys of the pool, in configuration order."""
+        return list(self._states)
+
+    def __len__(self) -> int:
+        """Number of keys."""
+        return len(self._states)
+
+    def acquire(self) -> str:
+        """
+        Take the least loaded usable key for one request.
+
+        Every acquire() must be followed by release().
+
+        Returns:
+            The key
+
+        Raises:
+            RateLimitError: If every key is quarantined or out of quota
+        """
+        with self._lock:
+            now = self._clock()
+            usable = [
+                state for state in self._states.values()
+                if state.quarantined_until <= now and state.remaining != 0
+            ]
+            if not usable:
+                wait = min(state.quarantined_until for state in self._states.values()) - now
+                raise RateLimitError("Every API key is quarantined or out of quota", retry_after=max(wait, 0.0) or None)
+            state = min(usable, key=self._load)
+            state.in_flight += 1
+            state.requests += 1
+            return state.key
+
+    def release(self, key: str, error: Optional[BaseException] = None) -> None:
+        """
+        Record the outcome of a request made with a key.
+
+        Failures specific to the account looked up, like a missing or
+        private profile, count as successes of the key.
+
+        Args:
+            key: The key returned by acquire()
+            error: The exception the request raised, None on success
+        """
+        with self._lock:
+            state = self._states[key]
+            state.in_flight -= 1
+            failed = error is not None and getattr(error, 'lookup_status', None) not in PERMANENT_STATUSES
+            state.recent.append(failed)
+            if not failed:
+                state.strikes = 0
+                if state.remaining:
+                    state.remaining -= 1
+                return
+            state.errors += 1
+            if isinstance(error, RateLimitError):
+                state.strikes += 1
+                rest = error.retry_after or min(self._max_quarantine, self._quarantine * 2 ** (state.strikes - 1))
+                self._quarantine_key(state, rest)
+            elif isinstance(error, AuthError):
+                self._quarantine_key(state, self._auth_quarantine)
+
+    def observe_response(self, response: 'httpx.Response') -> None:
+        """
+        Update a key's quota from the headers of a response sent with it.
+
+        Usable as an httpx response hook; responses of keys outside the
+        pool or without a quota header are ignored.
+        """
+        remaining = response.headers.get(QUOTA_HEADER)
+        key = response.request.headers.get('x-access-key')
+        if remaining is None or not remaining.isdigit() or key not in self._states:
+            return
+        with self._lock:
+            state = self._states[key]
+            state.remaining = int(remaining)
+            if state.remaining == 0:
+                self._quarantine_key(state, self._quarantine)
+
+    def stats(self) -> List[KeyStats]:
+        """Current state of every key, with masked key names."""
+        with self._lock:
+            now = self._clock()
+            return [
+                KeyStats(
+                    key=mask_key(state.key),
+                    in_flight=state.in_flight,
+                    requests=state.requests,
+                    errors=state.errors,
+                    error_rate=state.error_rate,
+                    remaining_quota=state.remaining,
+                    quarantined_for=max(0.0, state.quarantined_until - now),
+                    quarantines=state.quarantines
+                )
+                for state in self._states.values()
+            ]
+
+    def _quarantine_key(self, state: _KeyState, seconds: float) -> None:
+        """Take a key out of rotation for a number of seconds."""
+        state.quarantined_until = max(state.quarantined_until, self._clock() + seconds)
+        state.quarantines += 1
+        # A key whose quota ran out may be refilled by the time it returns
+        if state.remaining == 0:
+            state.remaining = None
+
+    @staticmethod
+    def _load(state: _KeyState) -> Tuple[int, float, float, int]:
+        """Sort key of the least loaded key."""
+        remaining = float('inf') if state.remaining is None else state.remaining
+        return state.in_flight, state.error_rate, -remaining, state.requests
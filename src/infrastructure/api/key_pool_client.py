@@ -0,0 +1,82 @@
+"""HikerAPI client spreading its requests over a pool of API keys."""
+from functools import partial
+from typing import Any, Dict
+
+import hikerapi
+
+from src.infrastructure.api.errors import AuthError, RateLimitError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.key_pool import KeyPool, mask_key
+
+
+def _key_stat(key_pool: KeyPool, ix: int, stat: str) -> float:
+    """One counter of the current statistics of a pool's key."""
+    return getattr(key_pool.stats()[ix], stat)
+
+
+class KeyPoolApiClient(HikerApiClient):
+    """
+    HikerApiClient making each request with the least loaded key of a pool.
+
+    All keys share the client's connection pool, caches, scheduler and
+    metrics; only the x-access-key header differs between requests. A
+    request rejected because of its key (rate limited or refused) is
+    retried at once on the next usable key; when none is left, the pool's
+    RateLimitError lets the scheduler back off until one returns.
+    """
+
+    def __init__(self, key_pool: KeyPool, **kwargs: Any) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            key_pool: Keys the requests are spread over
+            **kwargs: Options of HikerApiClient other than api_key; give a
+                scheduler whose rate limit covers every key
+        """
+        super().__init__(api_key=key_pool.keys[0], **kwargs)
+        self._key_pool = key_pool
+        self._clients: Dict[str, Any] = {key_pool.keys[0]: self._client}
+        for key in key_pool.keys:
+            if key not in self._clients:
+                self._clients[key] = hikerapi.Client(token=key)
+            http_client = self._attach(self._clients[key])
+            # Quota headers are read before _check_status turns errors into exceptions
+            if http_client is not None and key_pool.observe_response not in http_client.event_hooks['response']:
+                http_client.event_hooks['response'].insert(0, key_pool.observe_response)
+        for stat in ('requests', 'errors', 'quarantines'):
+            for ix, key in enumerate(key_pool.keys):
+                self._metrics.register_counter(
+                    f'api_key_{stat}_total',
+                    partial(_key_stat, key_pool, ix, stat),
+                    key=mask_key(key)
+                )
+
+    @property
+    def key_pool(self) -> KeyPool:
+        """The pool the requests are spread over."""
+        return self._key_pool
+
+    def _request(self, endpoint: str, *args: Any) -> Any:
+        """
+        Make one attempt with the least loaded key, recording its outcome.
+
+        Key failures quarantine the key and move the request to the next
+        one, trying each key of the pool at most once.
+        """
+        tries_left = len(self._key_pool)
+        while True:
+            key = self._key_pool.acquire()
+            try:
+                response = getattr(self._clients[key], endpoint)(*args)
+            except (AuthError, RateLimitError) as e:
+                self._key_pool.release(key, e)
+                tries_left -= 1
+                if not tries_left:
+                    raise
+            except Exception as e:
+                self._key_pool.release(key, e)
+                raise
+            else:
+                self._key_pool.release(key)
+                return response
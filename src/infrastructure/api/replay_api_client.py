@@ -0,0 +1,166 @@
+"""API client serving profiles from a raw response archive instead of the network."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Iterator, List, Optional
+
+from src.domain.analytics.engagement import EngagementCalculator
+from src.domain.models.lookup import LOOKUP_OK, LookupOutcome, failed_outcome
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileSearchResult
+from src.domain.validators.username_input import split_query
+from src.infrastructure.api.errors import NotFoundError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.storage.response_archive import ArchivedResponse, ResponseArchive
+
+
+class ReplayApiClient:
+    """
+    Offline client answering lookups from archived HikerAPI responses.
+
+    Profiles go through the same mapping as HikerApiClient, so a changed
+    mapping or engagement metric can be applied to everything fetched
+    before without calling the API again. Accounts missing from the archive
+    fail with NotFoundError.
+    """
+
+    def __init__(self, archive: ResponseArchive, engagement_window: int = 5, max_workers: int = 8) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            archive: Archive recorded by HikerApiClient
+            engagement_window: Number of recent posts engagement is computed over
+            max_workers: Number of lookups decoded concurrently by
+                search_profiles and lookup_profiles
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self._archive = archive
+        self._engagement = EngagementCalculator(window=engagement_window)
+        self._max_workers = max_workers
+
+    @property
+    def load_engagement(self) -> bool:
+        """Engagement is computed whenever its media response was archived."""
+        return True
+
+    def get_profile(self, username: str) -> Profile:
+        """
+        Build a profile from its archived response.
+
+        Args:
+            username: The Instagram username
+
+        Returns:
+            The profile, with engagement statistics if its media response
+            was archived too
+
+        Raises:
+            NotFoundError: If the username is not in the archive
+        """
+        archived = self._archive.user(username)
+        if archived is None:
+            raise NotFoundError(f"{username} is not in the archive")
+        return self._map(archived)
+
+    def get_engagement_stats(self, userid: str, followers_count: int = 0) -> EngagementStatistics:
+        """
+        Compute engagement statistics from an archived media response.
+
+        Args:
+            userid: The Instagram id
+            followers_count: Follower count used for the engagement rate
+
+        Returns:
+            The engagement statistics
+
+        Raises:
+            NotFoundError: If no media response of the user is archived
+        """
+        archived = self._archive.medias(userid)
+        if archived is None:
+            raise NotFoundError(f"No media of {userid} in the archive")
+        return HikerApiClient._map_engagement_response(archived.response, self._engagement, followers_count)
+
+    def fill_engagement(self, profile: Profile) -> Profile:
+        """Add engagement statistics to a profile if its media response was archived."""
+        if not profile.engagement_pending:
+            return profile
+        archived = self._archive.medias(profile.userid)
+        if archived is None:
+            return profile
+        return replace(profile, engagement_stats=HikerApiClient._map_engagement_response(
+            archived.response, self._engagement, profile.statistics.followers_count
+        ))
+
+    def search_profiles(self, query: str) -> ProfileSearchResult:
+        """
+        Build the profiles of a query from the archive.
+
+        Args:
+            query: The search query, comma separated list of users
+
+        Returns:
+            The search results, in input order
+
+        Raises:
+            NotFoundError: If a username is not in the archive
+        """
+        start = time.perf_counter()
+        usernames = split_query(query)
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(usernames))) as executor:
+            profiles = list(executor.map(self.get_profile, usernames))
+        return ProfileSearchResult(
+            profiles=profiles,
+            total_count=len(profiles),
+            query_time_ms=round((time.perf_counter() - start) * 1000)
+        )
+
+    def lookup_profiles(self, query: str) -> List[LookupOutcome]:
+        """
+        Look up every username of the query in the archive.
+
+        Args:
+            query: The search query, comma separated list of users
+
+        Returns:
+            One outcome per username in input order; archived accounts are
+            'ok' and the others 'not_found'
+        """
+        usernames = split_query(query)
+        with ThreadPoolExecutor(max_workers=min(self._max_workers, len(usernames))) as executor:
+            return list(executor.map(self._lookup, usernames))
+
+    def profiles(self) -> Iterator[Profile]:
+        """
+        Rebuild every archived profile, reading the archive in order.
+
+        Accounts fetched several times yield their latest response once.
+
+        Returns:
+            The profiles in order of first appearance
+        """
+        for username in self._archive.usernames():
+            archived = self._archive.user(username)
+            if archived is not None:
+                yield self._map(archived)
+
+    def _lookup(self, username: str) -> LookupOutcome:
+        """Build one profile, turning a miss into its outcome."""
+        try:
+            profile = self.get_profile(username)
+        except Exception as e:
+            return failed_outcome(username, e)
+        return LookupOutcome(username=username, status=LOOKUP_OK, profile=profile)
+
+    def _map(self, archived: ArchivedResponse) -> Profile:
+        """Map an archived profile response, adding engagement from its media response."""
+        response = archived.response
+        engagement_stats: Optional[EngagementStatistics] = None
+        if not response.get('is_private'):
+            medias = self._archive.medias(str(response.get('pk', '')))
+            if medias is not None:
+                engagement_stats = HikerApiClient._map_engagement_response(
+                    medias.response, self._engagement, response.get('follower_count', 0)
+                )
+        return HikerApiClient._map_profile_response(stats=response, engagement_stats=engagement_stats)
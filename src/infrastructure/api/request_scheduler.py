@@ -0,0 +1,342 @@
+"""Rate limiting, adaptive concurrency and retry for outbound API calls."""
+import asyncio
+import random
+import threading
+import time
+from typing import Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+from src.infrastructure.api.errors import RateLimitError, TransientApiError
+
+
+T = TypeVar('T')
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the request rate."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ) -> None:
+        """
+        Initialize the bucket, initially full.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+            clock: Function returning the current time in seconds
+            sleep: Function used to wait for tokens
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        while True:
+            wait = self.try_acquire()
+            if not wait:
+                return
+            self._sleep(wait)
+
+    def try_acquire(self) -> float:
+        """
+        Take one token if one is available, without waiting.
+
+        Returns:
+            0 if a token was taken, else the seconds until one is available
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self._rate
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limit adjusted with additive increase, multiplicative decrease.
+
+    Each successful call under the latency threshold raises the limit by
+    about one per window of calls; each error or slow call multiplies it by
+    the decrease factor.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 5.0
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of calls allowed in flight
+            min_limit: Lowest limit the decrease can reach
+            max_limit: Highest limit the increase can reach
+            decrease_factor: Multiplier applied on an error or slow call
+            latency_threshold: Seconds above which a call counts as slow
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._decrease_factor = decrease_factor
+        self._latency_threshold = latency_threshold
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Number of calls currently allowed in flight."""
+        with self._condition:
+            return int(self._limit)
+
+    def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """
+        Free a slot and adapt the limit.
+
+        Args:
+            latency: Seconds the call took
+            overloaded: Whether the call failed in a way that signals overload
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded or latency > self._latency_threshold:
+                self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+            else:
+                self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+
+class RequestScheduler:
+    """
+    Gate every outbound API call through a rate limit, an adaptive
+    concurrency limit and jittered exponential retry.
+
+    One scheduler can be shared by several clients so that together they
+    stay under the same budget.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        burst: int = 20,
+        initial_concurrency: int = 8,
+        max_concurrency: int = 64,
+        latency_threshold: float = 5.0,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_on: Tuple[Type[BaseException], ...] = (TransientApiError,),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Requests per second allowed on average
+            burst: Requests allowed back to back before the rate applies
+            initial_concurrency: Starting number of requests in flight
+            max_concurrency: Highest number of requests in flight
+            latency_threshold: Seconds above which a request counts as slow
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Backoff ceiling in seconds for the first retry
+            max_delay: Largest backoff ceiling in seconds
+            retry_on: Exception types that are retried
+            clock: Function returning the current time in seconds
+            sleep: Function used for waiting
+            rng: Random generator used for jitter
+        """
+        self._bucket = TokenBucket(rate=rate, burst=burst, clock=clock, sleep=sleep)
+        self._limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=min(initial_concurrency, max_concurrency),
+            max_limit=max_concurrency,
+            latency_threshold=latency_threshold
+        )
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._retry_on = retry_on
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._retries = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Number of requests currently allowed in flight."""
+        return self._limiter.limit
+
+    @property
+    def retry_count(self) -> int:
+        """Total number of retries performed so far."""
+        with self._lock:
+            return self._retries
+
+    def call(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run func under the rate and concurrency limits, retrying transient errors.
+
+        Args:
+            func: The API call to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any
+                non-retryable error immediately
+        """
+        attempt = 0
+        while True:
+            self._bucket.acquire()
+            self._limiter.acquire()
+            start = self._clock()
+            try:
+                result = func(*args, **kwargs)
+            except self._retry_on as e:
+                self._limiter.release(self._clock() - start, overloaded=True)
+                if attempt >= self._max_retries:
+                    raise
+                delay = self._backoff(attempt, e)
+                attempt += 1
+                with self._lock:
+                    self._retries += 1
+                self._sleep(delay)
+            except BaseException:
+                self._limiter.release(self._clock() - start, overloaded=False)
+                raise
+            else:
+                self._limiter.release(self._clock() - start, overloaded=False)
+                return result
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """Full-jitter exponential delay, at least the server's Retry-After."""
+        return _backoff_delay(attempt, error, self._base_delay, self._max_delay, self._rng)
+
+
+class AsyncRequestScheduler:
+    """
+    Asyncio counterpart of RequestScheduler: a rate limit and jittered
+    exponential retry for calls made from an event loop.
+
+    The number of calls in flight is left to the client's semaphore.
+    """
+
+    def __init__(
+        self,
+        rate: float = 20.0,
+        burst: int = 20,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        retry_on: Tuple[Type[BaseException], ...] = (TransientApiError,),
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: Optional[random.Random] = None
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Requests per second allowed on average
+            burst: Requests allowed back to back before the rate applies
+            max_retries: Retries after the first attempt before giving up
+            base_delay: Backoff ceiling in seconds for the first retry
+            max_delay: Largest backoff ceiling in seconds
+            retry_on: Exception types that are retried
+            clock: Function returning the current time in seconds
+            sleep: Coroutine function used for waiting
+            rng: Random generator used for jitter
+        """
+        self._bucket = TokenBucket(rate=rate, burst=burst, clock=clock)
+        self._max_retries = max_retries
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._retry_on = retry_on
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._retries = 0
+
+    @property
+    def retry_count(self) -> int:
+        """Total number of retries performed so far."""
+        return self._retries
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Await func under the rate limit, retrying transient errors.
+
+        Args:
+            func: Coroutine function making the API call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any
+                non-retryable error immediately
+        """
+        attempt = 0
+        while True:
+            wait = self._bucket.try_acquire()
+            while wait:
+                await self._sleep(wait)
+                wait = self._bucket.try_acquire()
+            try:
+                return await func(*args, **kwargs)
+            except self._retry_on as e:
+                if attempt >= self._max_retries:
+                    raise
+                delay = _backoff_delay(attempt, e, self._base_delay, self._max_delay, self._rng)
+                attempt += 1
+                self._retries += 1
+                await self._sleep(delay)
+
+
+def _backoff_delay(
+    attempt: int,
+    error: BaseException,
+    base_delay: float,
+    max_delay: float,
+    rng: random.Random
+) -> float:
+    """Full-jitter exponential delay, at least the server's Retry-After."""
+    ceiling = min(max_delay, base_delay * (2 ** attempt))
+    delay = rng.uniform(0, ceiling)
+    if isinstance(error, RateLimitError) and error.retry_after is not None:
+        delay = max(delay, min(error.retry_after, max_delay))
+    return delay
@@ -0,0 +1,148 @@
+"""In-process LRU cache with TTL expiry and single-flight loading."""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of cache counters."""
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    size: int
+
+
+class _InFlightCall:
+    """Outstanding load shared by every caller of the same key."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class LruTtlCache(Generic[T]):
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time to live.
+
+    Concurrent misses for the same key are coalesced: the first caller runs
+    the loader and the others wait for its result instead of loading again.
+    Failed loads are not cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of stored entries; 0 keeps only the
+                single-flight coalescing
+            ttl: Seconds an entry stays fresh
+            clock: Function returning the current time in seconds
+        """
+        if max_size < 0:
+            raise ValueError("max_size cannot be negative")
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, T]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, _InFlightCall] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Args:
+            key: The cache key
+            loader: Function producing the value when it is not cached
+
+        Returns:
+            The cached or freshly loaded value
+
+        Raises:
+            Exception: Whatever the loader raised, for every coalesced caller
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if self._clock() < entry[0]:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+                del self._entries[key]
+
+            pending = self._in_flight.get(key)
+            if pending is None:
+                self._misses += 1
+                call = self._in_flight[key] = _InFlightCall()
+            else:
+                self._coalesced += 1
+
+        if pending is not None:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            call.value = loader()
+        except BaseException as e:
+            call.error = e
+            raise
+        else:
+            with self._lock:
+                self._store(key, call.value)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if it is cached."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Current hit, miss, coalesce and eviction counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                size=len(self._entries)
+            )
+
+    def _store(self, key: Hashable, value: T) -> None:
+        """Insert an entry and evict the least recently used beyond max_size."""
+        if self._max_size == 0:
+            return
+        self._entries[key] = (self._clock() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
@@ -0,0 +1,318 @@
+"""Persistent SQLite cache in front of a profile API client."""
+import json
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.application.profile_service import ApiClientProtocol
+from src.domain.models.lookup import LOOKUP_ERROR, LOOKUP_OK, LookupOutcome
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileSearchResult
+from src.domain.models.serialization import (
+    engagement_to_dict,
+    profile_from_dict,
+    profile_to_dict,
+)
+from src.domain.validators.username_input import split_query
+from src.infrastructure.api.errors import ApiError
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    username TEXT PRIMARY KEY,
+    userid TEXT NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_profiles_userid ON profiles (userid);
+CREATE INDEX IF NOT EXISTS idx_profiles_accessed_at ON profiles (accessed_at);
+CREATE TABLE IF NOT EXISTS engagement (
+    userid TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class SqliteProfileCache:
+    """
+    API client wrapper that caches mapped profiles in a SQLite database.
+
+    Profile statistics are keyed by username and engagement statistics by
+    userid, each with its own time to live. When the number of cached
+    profiles exceeds max_entries, the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        api_client: ApiClientProtocol,
+        db_path: str,
+        profile_ttl: float = 24 * 3600,
+        engagement_ttl: float = 6 * 3600,
+        max_entries: int = 100_000,
+        clock: Callable[[], float] = time.time
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            api_client: Client used when the cache has no fresh entry
+            db_path: Path of the SQLite database file (":memory:" for tests)
+            profile_ttl: Seconds a cached profile stays fresh
+            engagement_ttl: Seconds cached engagement statistics stay fresh
+            max_entries: Maximum number of cached profiles
+            clock: Function returning the current time in seconds
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self._api_client = api_client
+        self._profile_ttl = profile_ttl
+        self._engagement_ttl = engagement_ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def get_profile(self, username: str) -> Profile:
+        """
+        Fetch a profile by username, using the cache when it is fresh.
+
+        Args:
+            username: The Instagram username to look up
+
+        Returns:
+            The profile data
+
+        Raises:
+            Exception: If the wrapped client fails
+        """
+        profile = self._lookup(username)
+        if profile is None:
+            profile = self._api_client.get_profile(username)
+            self._store([profile])
+        return profile
+
+    def search_profiles(self, query: str) -> ProfileSearchResult:
+        """
+        Search for profiles, fetching only the cache misses in one batch.
+
+        Args:
+            query: The search query, comma separated list of users
+
+        Returns:
+            The search results, in input order
+
+        Raises:
+            ApiError: If the wrapped client returns no profile for a username
+            Exception: If the wrapped client fails
+        """
+        start = time.perf_counter()
+        usernames = split_query(query)
+
+        found: Dict[str, Profile] = {}
+        misses: List[str] = []
+        for username in dict.fromkeys(username.lower() for username in usernames):
+            profile = self._lookup(username)
+            if profile is None:
+                misses.append(username)
+            else:
+                found[username.lower()] = profile
+
+        if misses:
+            result = self._api_client.search_profiles(','.join(misses))
+            self._store(result.profiles)
+            # Matched by name, so a client returning fewer or reordered
+            # profiles cannot attach one account's data to another name
+            found.update((profile.username.lower(), profile) for profile in result.profiles)
+            missing = [username for username in misses if username not in found]
+            if missing:
+                raise ApiError(f"No profile returned for: {', '.join(missing)}")
+
+        profiles = [found[username.lower()] for username in usernames]
+        return ProfileSearchResult(
+            profiles=profiles,
+            total_count=len(profiles),
+            query_time_ms=round((time.perf_counter() - start) * 1000)
+        )
+
+    def lookup_profiles(self, query: str) -> List[LookupOutcome]:
+        """
+        Look up every username, fetching only the cache misses and keeping
+        going past failures.
+
+        Args:
+            query: The search query, comma separated list of users
+
+        Returns:
+            One outcome per username in input order
+
+        Raises:
+            ValueError: If the query holds an empty or invalid username
+        """
+        usernames = split_query(query)
+
+        found: Dict[str, LookupOutcome] = {}
+        misses: List[str] = []
+        for username in dict.fromkeys(username.lower() for username in usernames):
+            profile = self._lookup(username)
+            if profile is None:
+                misses.append(username)
+            else:
+                found[username] = LookupOutcome(username=username, status=LOOKUP_OK, profile=profile)
+
+        if misses:
+            outcomes = self._api_client.lookup_profiles(','.join(misses))
+            self._store([outcome.profile for outcome in outcomes if outcome.ok and outcome.profile is not None])
+            found.update((outcome.username.lower(), outcome) for outcome in outcomes)
+            for username in misses:
+                if username not in found:
+                    found[username] = LookupOutcome(
+                        username=username, status=LOOKUP_ERROR, error="The API returned no result for this username"
+                    )
+
+        return [found[username.lower()] for username in usernames]
+
+    def fill_engagement(self, profile: Profile) -> Profile:
+        """
+        Load the engagement statistics of a profile through the wrapped client and cache them.
+
+        Args:
+            profile: A profile fetched without engagement statistics
+
+        Returns:
+            The profile with engagement statistics, or unchanged if the
+            wrapped client cannot load them
+        """
+        fill = getattr(self._api_client, 'fill_engagement', None)
+        if fill is None:
+            return profile
+        filled = fill(profile)
+        if filled.engagement_stats is not None and profile.engagement_stats is None:
+            self._store_engagement(str(filled.userid), filled.engagement_stats)
+        return filled
+
+    def get_cached_by_userid(self, userid: str) -> Optional[Profile]:
+        """
+        Return a fresh cached profile by userid without calling the API.
+
+        Args:
+            userid: The Instagram id to look up
+
+        Returns:
+            The cached profile, or None if it is missing or stale
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT username FROM profiles WHERE userid = ?", (str(userid),)
+            ).fetchone()
+        if row is None:
+            return None
+        return self._lookup(row[0], refresh_engagement=False)
+
+    def clear(self) -> None:
+        """Remove every cached record."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM profiles")
+            self._conn.execute("DELETE FROM engagement")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _lookup(self, username: str, refresh_engagement: bool = True) -> Optional[Profile]:
+        """
+        Build a profile from the cache.
+
+        Stale engagement statistics on a fresh profile are refreshed on their
+        own when the wrapped client supports it, which costs one API call
+        instead of two. Private profiles, and every profile when the wrapped
+        client does not load engagement, are returned without them.
+
+        Returns:
+            The profile, or None if it has to be fetched from the API
+        """
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT userid, data, fetched_at FROM profiles WHERE username = ?",
+                (username.lower(),)
+            ).fetchone()
+            if row is None or now - row[2] >= self._profile_ttl:
+                return None
+            userid, data, _ = row
+            engagement_row = self._conn.execute(
+                "SELECT data, fetched_at FROM engagement WHERE userid = ?", (userid,)
+            ).fetchone()
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE profiles SET accessed_at = ? WHERE username = ?",
+                    (now, username.lower())
+                )
+
+        profile_data = json.loads(data)
+        if engagement_row is not None and now - engagement_row[1] < self._engagement_ttl:
+            profile_data['engagement_stats'] = json.loads(engagement_row[0])
+            return profile_from_dict(profile_data)
+
+        if profile_data.get('is_private') or not getattr(self._api_client, 'load_engagement', True):
+            profile_data['engagement_stats'] = None
+            return profile_from_dict(profile_data)
+
+        fetch_engagement = getattr(self._api_client, 'get_engagement_stats', None)
+        if not refresh_engagement or fetch_engagement is None:
+            return None
+        engagement_stats: EngagementStatistics = fetch_engagement(
+            profile_data['userid'], followers_count=profile_data['statistics']['followers_count']
+        )
+        self._store_engagement(userid, engagement_stats)
+        profile_data['engagement_stats'] = engagement_to_dict(engagement_stats)
+        return profile_from_dict(profile_data)
+
+    def _store(self, profiles: List[Profile]) -> None:
+        """Insert or refresh cached profiles, then evict if over capacity."""
+        now = self._clock()
+        rows = []
+        engagement_rows = []
+        for profile in profiles:
+            data = profile_to_dict(profile)
+            engagement = data.pop('engagement_stats')
+            userid = str(profile.userid)
+            rows.append((profile.username.lower(), userid, json.dumps(data), now, now))
+            if engagement is not None:
+                engagement_rows.append((userid, json.dumps(engagement), now))
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?)", rows
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO engagement VALUES (?, ?, ?)", engagement_rows
+            )
+            self._evict()
+
+    def _store_engagement(self, userid: str, engagement_stats: EngagementStatistics) -> None:
+        """Insert or refresh cached engagement statistics."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO engagement VALUES (?, ?, ?)",
+                (userid, json.dumps(engagement_to_dict(engagement_stats)), self._clock())
+            )
+
+    def _evict(self) -> None:
+        """Delete the least recently used profiles beyond max_entries."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()
+        excess = count - self._max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM profiles WHERE username IN ("
+            "SELECT username FROM profiles ORDER BY accessed_at LIMIT ?)",
+            (excess,)
+        )
+        self._conn.execute(
+            "DELETE FROM engagement WHERE userid NOT IN (SELECT userid FROM profiles)"
+        )
@@ -1,53 +1,131 @@
 """CSV export functionality."""
 import csv
-from datetime import datetime
-from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, TextIO
 
-from src.domain.models.profile import Profile
+from src.domain.models.profile import EngagementStatistics, Profile
+
+
+# Columns taken from EngagementStatistics
+_ENGAGEMENT_FIELDNAMES = (
+    'avg_post_likes', 'avg_post_comments', 'avg_post_reshares',
+    'recent_posts_count', 'median_post_likes', 'median_post_comments',
+    'stdev_post_likes', 'stdev_post_comments', 'engagement_rate',
+)
 
 
 class CsvExporter:
     """Exports profile data to CSV format."""
-    
+
+    fieldnames = [
+        'username', 'full_name', 'is_verified', 'is_private',
+        'followers_count', 'following_count',
+        'avg_post_likes', 'avg_post_comments', 'avg_post_reshares',
+        'recent_posts_count', 'median_post_likes', 'median_post_comments',
+        'stdev_post_likes', 'stdev_post_comments', 'engagement_rate',
+        'posts_count', 'last_updated'
+    ]
+
     def export_profiles(self, profiles: List[Profile], filepath: str) -> None:
         """
         Export profiles to a CSV file.
-        
+
         Args:
             profiles: List of profiles to export
             filepath: Path to save the CSV file
-            
+
         Raises:
             IOError: If the file cannot be written
         """
         if not profiles:
             raise ValueError("No profiles to export")
-            
-        fieldnames = [
-            'username', 'full_name', 'is_verified', 'is_private',
-            'followers_count', 'following_count',
-            'avg_post_likes','avg_post_comments', 'avg_post_reshares', 'posts_count',
-            'last_updated'
-        ]
-        
-        rows = []
-        for profile in profiles:
-            rows.append({
-                'username': profile.username,
-                'full_name': profile.full_name or '',
-                'is_verified': profile.is_verified,
-                'is_private': profile.is_private,
-                'followers_count': profile.statistics.followers_count,
-                'following_count': profile.statistics.following_count,
-                'avg_post_likes': profile.engagement_stats.recent_avg_post_likes,
-                'avg_post_comments': profile.engagement_stats.recent_avg_post_comments,
-                'avg_post_reshares': profile.engagement_stats.recent_avg_post_reshares,
-                'recent_posts_count': profile.engagement_stats.recent_post_count,
-                'last_updated': profile.statistics.last_updated.strftime('%Y-%m-%d %H:%M:%S')
-            })
-        
+
+        self.export_stream(profiles, filepath)
+
+    def export_stream(self, profiles: Iterable[Profile], filepath: str) -> int:
+        """
+        Write profiles to a CSV file as they are produced.
+
+        Each row is flushed as soon as it is written, so rows already
+        exported survive if the producer fails part way through.
+
+        Args:
+            profiles: Any iterable of profiles, e.g. a generator of lookups
+            filepath: Path to save the CSV file
+
+        Returns:
+            The number of rows written
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        count = 0
+        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = self._start(csvfile)
+            for profile in profiles:
+                writer.writerow(self._profile_to_row(profile))
+                csvfile.flush()
+                count += 1
+        return count
+
+    async def export_stream_async(self, profiles: AsyncIterable[Profile], filepath: str) -> int:
+        """
+        Write profiles from an async iterable to a CSV file as they arrive.
+
+        Args:
+            profiles: Any async iterable of profiles
+            filepath: Path to save the CSV file
+
+        Returns:
+            The number of rows written
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        count = 0
         with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+            writer = self._start(csvfile)
+            async for profile in profiles:
+                writer.writerow(self._profile_to_row(profile))
+                csvfile.flush()
+                count += 1
+        return count
+
+    def _start(self, csvfile: TextIO) -> csv.DictWriter:
+        """Create a writer on an open file and write the header."""
+        writer = csv.DictWriter(csvfile, fieldnames=self.fieldnames)
+        writer.writeheader()
+        csvfile.flush()
+        return writer
+
+    @staticmethod
+    def _profile_to_row(profile: Profile) -> Dict[str, Any]:
+        """Flatten a profile into a CSV row."""
+        stats = profile.statistics
+        return {
+            'username': profile.username,
+            'full_name': profile.full_name or '',
+            'is_verified': profile.is_verified,
+            'is_private': profile.is_private,
+            'followers_count': stats.followers_count,
+            'following_count': stats.following_count,
+            **_engagement_to_row(profile.engagement_stats),
+            'posts_count': stats.posts_count,
+            'last_updated': stats.last_updated.strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+
+def _engagement_to_row(eng_stats: Optional[EngagementStatistics]) -> Dict[str, Any]:
+    """Flatten engagement statistics into CSV cells, left blank when they were not loaded."""
+    if eng_stats is None:
+        return dict.fromkeys(_ENGAGEMENT_FIELDNAMES, '')
+    return {
+        'avg_post_likes': eng_stats.recent_avg_post_likes,
+        'avg_post_comments': eng_stats.recent_avg_post_comments,
+        'avg_post_reshares': eng_stats.recent_avg_post_reshares,
+        'recent_posts_count': eng_stats.recent_post_count,
+        'median_post_likes': eng_stats.median_post_likes,
+        'median_post_comments': eng_stats.median_post_comments,
+        'stdev_post_likes': round(eng_stats.stdev_post_likes, 2),
+        'stdev_post_comments': round(eng_stats.stdev_post_comments, 2),
+        'engagement_rate': round(eng_stats.engagement_rate, 6),
+    }
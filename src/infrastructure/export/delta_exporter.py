@@ -0,0 +1,253 @@
+"""Incremental export of the accounts that changed since the previous run."""
+import csv
+import gzip
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from src.domain.models.profile import Profile
+from src.infrastructure.export.records import ENGAGEMENT_FIELDS, PROFILE_FIELDS, profile_to_record
+
+
+CHANGE_NEW = 'new'
+CHANGE_CHANGED = 'changed'
+CHANGE_REMOVED = 'removed'
+
+# Fetch time changes on every run, so it is left out of the content hash
+_UNHASHED_FIELDS = ('last_updated',)
+
+# Fields of the content hash; engagement fields get a hash of their own
+_HASHED_FIELDS = tuple(
+    name for name, _ in PROFILE_FIELDS if name not in _UNHASHED_FIELDS and name not in ENGAGEMENT_FIELDS
+)
+
+# Manifest entry of an account: username, content hash, engagement hash
+_ManifestEntry = Tuple[str, str, Optional[str]]
+
+
+@dataclass(frozen=True)
+class DeltaSummary:
+    """Counts of one delta export."""
+    new: int
+    changed: int
+    removed: int
+    unchanged: int
+
+
+def record_hash(record: Dict[str, Any]) -> str:
+    """
+    Content hash of an export record, without its engagement fields.
+
+    Args:
+        record: A record made by profile_to_record
+
+    Returns:
+        A 16 character hex digest
+    """
+    return _digest([record[name] for name in _HASHED_FIELDS])
+
+
+def engagement_hash(record: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash of the engagement fields of an export record.
+
+    Args:
+        record: A record made by profile_to_record
+
+    Returns:
+        A 16 character hex digest, None when the engagement statistics
+        were not loaded
+    """
+    values = [record[name] for name in ENGAGEMENT_FIELDS]
+    if all(value is None for value in values):
+        return None
+    return _digest(values)
+
+
+def _digest(values: List[Any]) -> str:
+    """Short hex digest of JSON serializable values."""
+    payload = json.dumps(values, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class DeltaExporter:
+    """
+    Writes only new, changed and removed accounts, keyed by userid.
+
+    The previous run is described by a manifest of userid, username,
+    content hash and engagement hash per account. Each export compares the
+    fetched profiles against that manifest, writes the differences to the
+    delta file, and replaces the manifest atomically once the stream is
+    complete. Profiles fetched without engagement statistics keep their
+    previous engagement hash, so a run that skips engagement only reports
+    changes to the other fields. The delta is CSV when its path ends in
+    .csv and JSON lines (gzip for .gz) otherwise.
+    """
+
+    def __init__(self, manifest_path: str) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            manifest_path: Path of the manifest read and rewritten by each run
+        """
+        self._manifest_path = manifest_path
+        self._failed: Set[str] = set()
+        self._summary: Optional[DeltaSummary] = None
+
+    @property
+    def summary(self) -> Optional[DeltaSummary]:
+        """Counts of the last export, None before the first one."""
+        return self._summary
+
+    def mark_failed(self, username: str) -> None:
+        """
+        Keep an account whose lookup failed out of the removed set.
+
+        Its previous manifest entry is carried over unchanged.
+
+        Args:
+            username: Username whose lookup failed in this run
+        """
+        self._failed.add(username.lower())
+
+    def export_profiles(self, profiles: List[Profile], filepath: str) -> None:
+        """
+        Export the changes among profiles to a delta file.
+
+        Args:
+            profiles: List of profiles to compare
+            filepath: Path of the delta file
+
+        Raises:
+            IOError: If a file cannot be written
+        """
+        if not profiles:
+            raise ValueError("No profiles to export")
+
+        self.export_stream(profiles, filepath)
+
+    def export_stream(self, profiles: Iterable[Profile], filepath: str) -> int:
+        """
+        Compare profiles against the manifest as they arrive.
+
+        New and changed accounts are written immediately. Removed accounts,
+        those in the manifest that were neither fetched nor marked failed,
+        are written once the stream ends, followed by the new manifest.
+
+        Args:
+            profiles: Any iterable of profiles
+            filepath: Path of the delta file
+
+        Returns:
+            The number of profiles processed; see summary for the changes
+
+        Raises:
+            IOError: If a file cannot be written
+        """
+        previous = self._load_manifest()
+        manifest: Dict[str, _ManifestEntry] = {}
+        new = changed = unchanged = 0
+
+        with _DeltaWriter(filepath) as writer:
+            for profile in profiles:
+                record = profile_to_record(profile)
+                digest = record_hash(record)
+                engagement = engagement_hash(record)
+                userid = record['userid']
+                old = previous.get(userid)
+                if engagement is None and old is not None:
+                    engagement = old[2]
+                manifest[userid] = (record['username'], digest, engagement)
+                if old is None:
+                    writer.write(CHANGE_NEW, record)
+                    new += 1
+                elif old[1:] != (digest, engagement):
+                    writer.write(CHANGE_CHANGED, record)
+                    changed += 1
+                else:
+                    unchanged += 1
+
+            removed = 0
+            for userid, entry in previous.items():
+                if userid in manifest:
+                    continue
+                username = entry[0]
+                if username.lower() in self._failed:
+                    manifest[userid] = entry
+                else:
+                    writer.write(CHANGE_REMOVED, {'userid': userid, 'username': username})
+                    removed += 1
+
+        self._save_manifest(manifest)
+        self._summary = DeltaSummary(new=new, changed=changed, removed=removed, unchanged=unchanged)
+        return new + changed + unchanged
+
+    def _load_manifest(self) -> Dict[str, _ManifestEntry]:
+        """Read the previous manifest, empty on the first run."""
+        manifest: Dict[str, _ManifestEntry] = {}
+        if not os.path.exists(self._manifest_path):
+            return manifest
+        with open(self._manifest_path, encoding='utf-8') as manifest_file:
+            for line in manifest_file:
+                if line.strip():
+                    entry = json.loads(line)
+                    manifest[entry['userid']] = (entry['username'], entry['hash'], entry.get('engagement_hash'))
+        return manifest
+
+    def _save_manifest(self, manifest: Dict[str, _ManifestEntry]) -> None:
+        """Replace the manifest atomically, so a crash keeps the old one."""
+        directory = os.path.dirname(self._manifest_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self._manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as manifest_file:
+            for userid, (username, digest, engagement) in manifest.items():
+                manifest_file.write(json.dumps(
+                    {'userid': userid, 'username': username, 'hash': digest, 'engagement_hash': engagement}
+                ) + '\n')
+        os.replace(temp_path, self._manifest_path)
+
+
+class _DeltaWriter:
+    """Writes delta rows as CSV or JSON lines depending on the file name."""
+
+    fieldnames = ['change'] + [name for name, _ in PROFILE_FIELDS]
+
+    def __init__(self, filepath: str) -> None:
+        self._filepath = filepath
+        self._csv = filepath.lower().endswith('.csv')
+        self._file: Optional[IO[str]] = None
+        self._writer: Optional[csv.DictWriter] = None
+
+    def __enter__(self) -> "_DeltaWriter":
+        if self._csv:
+            self._file = open(self._filepath, 'w', newline='', encoding='utf-8')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+            self._writer.writeheader()
+        elif self._filepath.lower().endswith('.gz'):
+            self._file = gzip.open(self._filepath, 'wt', encoding='utf-8')
+        else:
+            self._file = open(self._filepath, 'w', encoding='utf-8')
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._require_file().close()
+
+    def write(self, change: str, record: Dict[str, Any]) -> None:
+        """Write one changed account."""
+        row = {'change': change, **record}
+        if 'last_updated' in row:
+            row['last_updated'] = row['last_updated'].isoformat()
+        if self._writer is not None:
+            self._writer.writerow(row)
+        else:
+            self._require_file().write(json.dumps(row, ensure_ascii=False) + '\n')
+
+    def _require_file(self) -> IO[str]:
+        """The open delta file, which only exists inside a with block."""
+        if self._file is None:
+            raise RuntimeError("_DeltaWriter used outside a with block")
+        return self._file
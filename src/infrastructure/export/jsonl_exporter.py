@@ -0,0 +1,85 @@
+"""Compressed JSON-lines export functionality."""
+import gzip
+import json
+from typing import IO, Iterable, List, Optional
+
+from src.domain.models.profile import Profile
+from src.infrastructure.export.records import profile_to_record
+
+
+COMPRESSIONS = ('gzip', 'zstd', None)
+
+
+class JsonlExporter:
+    """Exports profile data as one JSON object per line, optionally compressed."""
+
+    def __init__(self, compression: Optional[str] = 'gzip', batch_size: int = 1000) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            compression: 'gzip', 'zstd' (requires the zstandard package) or None
+            batch_size: Number of lines buffered before each flush
+        """
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self._compression = compression
+        self._batch_size = batch_size
+
+    def export_profiles(self, profiles: List[Profile], filepath: str) -> None:
+        """
+        Export profiles to a JSON-lines file.
+
+        Args:
+            profiles: List of profiles to export
+            filepath: Path to save the file
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        if not profiles:
+            raise ValueError("No profiles to export")
+
+        self.export_stream(profiles, filepath)
+
+    def export_stream(self, profiles: Iterable[Profile], filepath: str) -> int:
+        """
+        Write profiles to a JSON-lines file as they are produced.
+
+        Lines are flushed through the compressor every batch_size profiles,
+        which keeps compression effective while bounding what a crash loses.
+
+        Args:
+            profiles: Any iterable of profiles
+            filepath: Path to save the file
+
+        Returns:
+            The number of lines written
+
+        Raises:
+            IOError: If the file cannot be written
+        """
+        count = 0
+        with self._open(filepath) as output:
+            for profile in profiles:
+                record = profile_to_record(profile)
+                record['last_updated'] = record['last_updated'].isoformat()
+                output.write(json.dumps(record, ensure_ascii=False) + '\n')
+                count += 1
+                if count % self._batch_size == 0:
+                    output.flush()
+        return count
+
+    def _open(self, filepath: str) -> IO[str]:
+        """Open the output file for text writing with the chosen compression."""
+        if self._compression == 'gzip':
+            return gzip.open(filepath, 'wt', encoding='utf-8')
+        if self._compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError("zstd compression requires the 'zstandard' package") from e
+            return zstandard.open(filepath, 'wt', encoding='utf-8')
+        return open(filepath, 'w', encoding='utf-8')
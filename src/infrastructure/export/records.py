@@ -0,0 +1,114 @@
+"""Flat, typed export records shared by the structured exporters."""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.domain.models.profile import EngagementStatistics, Profile
+from src.domain.models.profile_table import ProfileTable
+
+
+# Field name and Python type of every exported column, in output order.
+# Columns from ProfileStatistics and EngagementStatistics are flattened.
+PROFILE_FIELDS: List[Tuple[str, type]] = [
+    ('userid', str),
+    ('username', str),
+    ('full_name', str),
+    ('bio', str),
+    ('is_verified', bool),
+    ('is_private', bool),
+    ('profile_pic_url', str),
+    ('followers_count', int),
+    ('following_count', int),
+    ('posts_count', int),
+    ('last_updated', datetime),
+    ('avg_post_likes', int),
+    ('avg_post_comments', int),
+    ('avg_post_reshares', int),
+    ('recent_posts_count', int),
+    ('median_post_likes', float),
+    ('median_post_comments', float),
+    ('stdev_post_likes', float),
+    ('stdev_post_comments', float),
+    ('engagement_rate', float),
+]
+
+
+# Fields taken from EngagementStatistics; None for profiles without them
+ENGAGEMENT_FIELDS = (
+    'avg_post_likes', 'avg_post_comments', 'avg_post_reshares', 'recent_posts_count',
+    'median_post_likes', 'median_post_comments', 'stdev_post_likes',
+    'stdev_post_comments', 'engagement_rate',
+)
+
+
+# Table column holding each exported field whose name differs
+_TABLE_COLUMNS = {
+    'avg_post_likes': 'recent_avg_post_likes',
+    'avg_post_comments': 'recent_avg_post_comments',
+    'avg_post_reshares': 'recent_avg_post_reshares',
+    'recent_posts_count': 'recent_post_count',
+}
+
+
+def table_to_columns(table: ProfileTable, start: int = 0, stop: Optional[int] = None) -> Dict[str, List[Any]]:
+    """
+    Read a range of table rows as columns of PROFILE_FIELDS.
+
+    This skips building a record per row, so columnar writers can take
+    whole columns straight from the table's arrays.
+
+    Args:
+        table: The profile table
+        start: First row
+        stop: Row after the last one, defaults to the end of the table
+
+    Returns:
+        Column name to list of native Python values
+    """
+    return {
+        name: table.values(_TABLE_COLUMNS.get(name, name), start, stop)
+        for name, _ in PROFILE_FIELDS
+    }
+
+
+def profile_to_record(profile: Profile) -> Dict[str, Any]:
+    """
+    Flatten a profile into a record with the columns of PROFILE_FIELDS.
+
+    Args:
+        profile: The profile to flatten
+
+    Returns:
+        The record, with native Python values
+    """
+    stats = profile.statistics
+    return {
+        'userid': str(profile.userid),
+        'username': profile.username,
+        'full_name': profile.full_name,
+        'bio': profile.bio,
+        'is_verified': bool(profile.is_verified),
+        'is_private': bool(profile.is_private),
+        'profile_pic_url': profile.profile_pic_url,
+        'followers_count': stats.followers_count,
+        'following_count': stats.following_count,
+        'posts_count': stats.posts_count,
+        'last_updated': stats.last_updated,
+        **_engagement_record(profile.engagement_stats),
+    }
+
+
+def _engagement_record(eng_stats: Optional[EngagementStatistics]) -> Dict[str, Any]:
+    """Flatten engagement statistics; every field is None when they were not loaded."""
+    if eng_stats is None:
+        return dict.fromkeys(ENGAGEMENT_FIELDS)
+    return {
+        'avg_post_likes': eng_stats.recent_avg_post_likes,
+        'avg_post_comments': eng_stats.recent_avg_post_comments,
+        'avg_post_reshares': eng_stats.recent_avg_post_reshares,
+        'recent_posts_count': eng_stats.recent_post_count,
+        'median_post_likes': float(eng_stats.median_post_likes),
+        'median_post_comments': float(eng_stats.median_post_comments),
+        'stdev_post_likes': float(eng_stats.stdev_post_likes),
+        'stdev_post_comments': float(eng_stats.stdev_post_comments),
+        'engagement_rate': float(eng_stats.engagement_rate),
+    }
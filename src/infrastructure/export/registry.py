@@ -0,0 +1,116 @@
+"""Registry of the available export formats."""
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Tuple
+
+from src.domain.models.profile import Profile
+from src.infrastructure.export.arrow_exporter import ArrowExporter
+from src.infrastructure.export.csv_exporter import CsvExporter
+from src.infrastructure.export.jsonl_exporter import JsonlExporter
+
+
+class ProfileExporter(Protocol):
+    """Interface of the exporter of every format."""
+
+    def export_profiles(self, profiles: List[Profile], filepath: str) -> None:
+        """Export profiles to a file."""
+        ...
+
+    def export_stream(self, profiles: Iterable[Profile], filepath: str) -> int:
+        """Write profiles to a file as they arrive and return their number."""
+        ...
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """An export format selectable by name or file extension."""
+    name: str
+    extension: str
+    description: str
+    factory: Callable[[], ProfileExporter]
+
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    export_format.name: export_format
+    for export_format in (
+        ExportFormat('csv', '.csv', 'CSV files', CsvExporter),
+        ExportFormat('parquet', '.parquet', 'Parquet files', lambda: ArrowExporter('parquet')),
+        ExportFormat('arrow', '.arrow', 'Arrow IPC files', lambda: ArrowExporter('arrow')),
+        ExportFormat('jsonl.gz', '.jsonl.gz', 'Gzip JSON lines', lambda: JsonlExporter('gzip')),
+        ExportFormat('jsonl.zst', '.jsonl.zst', 'Zstandard JSON lines', lambda: JsonlExporter('zstd')),
+        ExportFormat('jsonl', '.jsonl', 'JSON lines', lambda: JsonlExporter(None)),
+    )
+}
+
+
+def format_for_path(filepath: str) -> Optional[ExportFormat]:
+    """
+    Find the export format matching a file name's extension.
+
+    Args:
+        filepath: Path of the output file
+
+    Returns:
+        The matching format, or None if the extension is unknown
+    """
+    lowered = filepath.lower()
+    matches = [f for f in EXPORT_FORMATS.values() if lowered.endswith(f.extension)]
+    # Prefer the longest match so '.jsonl.gz' wins over a shorter suffix
+    return max(matches, key=lambda f: len(f.extension), default=None)
+
+
+def create_exporter(name: str) -> ProfileExporter:
+    """
+    Create the exporter of a format.
+
+    Args:
+        name: Format name, one of EXPORT_FORMATS
+
+    Returns:
+        A new exporter instance
+
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If the format's optional dependency is missing
+    """
+    if name not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {name}")
+    return EXPORT_FORMATS[name].factory()
+
+
+class MultiFormatExporter:
+    """Exporter choosing the format from the output file's extension."""
+
+    def __init__(self, default_format: str = 'csv') -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            default_format: Format used when the extension is not recognised
+        """
+        if default_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format: {default_format}")
+        self._default_format = default_format
+
+    @property
+    def filetypes(self) -> List[Tuple[str, str]]:
+        """File dialog filters, default format first."""
+        ordered = sorted(EXPORT_FORMATS.values(), key=lambda f: f.name != self._default_format)
+        return [(f.description, f"*{f.extension}") for f in ordered] + [("All files", "*.*")]
+
+    @property
+    def default_extension(self) -> str:
+        """Extension of the default format."""
+        return EXPORT_FORMATS[self._default_format].extension
+
+    def export_profiles(self, profiles: List[Profile], filepath: str) -> None:
+        """Export profiles in the format matching filepath."""
+        self._exporter_for(filepath).export_profiles(profiles, filepath)
+
+    def export_stream(self, profiles: Iterable[Profile], filepath: str) -> int:
+        """Stream profiles in the format matching filepath."""
+        return self._exporter_for(filepath).export_stream(profiles, filepath)
+
+    def _exporter_for(self, filepath: str) -> ProfileExporter:
+        """Create the exporter for a file path."""
+        export_format = format_for_path(filepath)
+        return create_exporter(export_format.name if export_format else self._default_format)
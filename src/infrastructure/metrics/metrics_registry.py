@@ -0,0 +1,234 @@
+"""In-process counters and latency histograms with JSON and Prometheus output."""
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Seconds; upper bounds of the histogram buckets, +Inf is implicit
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    """Canonical, hashable form of a label set."""
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class Histogram:
+    """Bucketed distribution of observed values."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize an empty histogram.
+
+        Args:
+            buckets: Increasing upper bounds of the buckets
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add one value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile by interpolating within its bucket.
+
+        Args:
+            fraction: The quantile, between 0 and 1
+
+        Returns:
+            The estimate, 0 when empty; values past the last bucket are
+            reported as its bound
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for ix, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                if ix == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[ix - 1] if ix else 0.0
+                return lower + (self.buckets[ix] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of labelled counters and histograms.
+
+    Counters and histograms are created on first use. Counters kept
+    elsewhere, such as cache statistics, are read through callbacks
+    registered with register_counter whenever the registry is dumped.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize an empty registry.
+
+        Args:
+            buckets: Bucket bounds of every histogram
+        """
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._callbacks: List[Tuple[str, Labels, Callable[[], float]]] = []
+
+    def increment(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name
+            amount: Value added
+            **labels: Label values identifying the series
+        """
+        key = _labels(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """
+        Record a value in a histogram.
+
+        Args:
+            name: Histogram name
+            value: Observed value, in seconds for latencies
+            **labels: Label values identifying the series
+        """
+        key = _labels(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self._buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observe the seconds spent in the with block, also when it raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def register_counter(self, name: str, read: Callable[[], float], **labels: Any) -> None:
+        """
+        Expose a counter maintained elsewhere.
+
+        Args:
+            name: Counter name
+            read: Function returning the current value
+            **labels: Label values identifying the series
+        """
+        with self._lock:
+            self._callbacks.append((name, _labels(labels), read))
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """Current value of a counter series, 0 if never incremented."""
+        key = _labels(labels)
+        with self._lock:
+            value = self._counters.get(name, {}).get(key)
+            if value is not None:
+                return value
+            callbacks = [read for n, k, read in self._callbacks if n == name and k == key]
+        return callbacks[0]() if callbacks else 0
+
+    def histogram(self, name: str, **labels: Any) -> Optional[Histogram]:
+        """Copy of a histogram series, None if nothing was observed."""
+        with self._lock:
+            histogram = self._histograms.get(name, {}).get(_labels(labels))
+            if histogram is None:
+                return None
+            copy = Histogram(histogram.buckets)
+            copy.counts = list(histogram.counts)
+            copy.count = histogram.count
+            copy.sum = histogram.sum
+            return copy
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current values of every series.
+
+        Returns:
+            A JSON-serializable dict with 'counters' and 'histograms', each
+            a list of series holding the name, labels and values
+        """
+        with self._lock:
+            counters = [
+                (name, key, value)
+                for name, series in self._counters.items()
+                for key, value in series.items()
+            ]
+            callbacks = list(self._callbacks)
+            histograms = [
+                {
+                    'name': name,
+                    'labels': dict(key),
+                    'count': histogram.count,
+                    'sum': histogram.sum,
+                    'p50': histogram.quantile(0.5),
+                    'p99': histogram.quantile(0.99),
+                    'buckets': dict(zip([*map(str, histogram.buckets), '+Inf'], histogram.counts)),
+                }
+                for name, series in self._histograms.items()
+                for key, histogram in series.items()
+            ]
+        counters.extend((name, key, read()) for name, key, read in callbacks)
+        return {
+            'counters': [{'name': name, 'labels': dict(key), 'value': value} for name, key, value in counters],
+            'histograms': histograms,
+        }
+
+    def to_json(self) -> str:
+        """The snapshot as indented JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """The snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        typed = set()
+        for counter in sorted(snapshot['counters'], key=lambda c: c['name']):
+            if counter['name'] not in typed:
+                typed.add(counter['name'])
+                lines.append(f"# TYPE {counter['name']} counter")
+            lines.append(f"{counter['name']}{_format_labels(counter['labels'])} {counter['value']}")
+        for histogram in sorted(snapshot['histograms'], key=lambda h: h['name']):
+            name = histogram['name']
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in histogram['buckets'].items():
+                cumulative += count
+                labels = _format_labels({**histogram['labels'], 'le': bound})
+                lines.append(f"{name}_bucket{labels} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(histogram['labels'])} {histogram['sum']}")
+            lines.append(f"{name}_count{_format_labels(histogram['labels'])} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """Prometheus label set, empty when there are no labels."""
+    if not labels:
+        return ''
+    pairs = (
+        name + '="' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+        for name, value in labels.items()
+    )
+    return '{' + ','.join(pairs) + '}'
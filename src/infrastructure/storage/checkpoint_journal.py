@@ -0,0 +1,128 @@
+"""Append-only checkpoint journal for resumable batch jobs."""
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from src.domain.models.profile import Profile
+from src.domain.models.serialization import profile_from_dict, profile_to_dict
+
+
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """Outcome recorded for one username."""
+    username: str
+    status: str
+    profile: Optional[Profile]
+    error: Optional[str]
+    reason: Optional[str] = None
+
+
+class CheckpointJournal:
+    """
+    JSON-lines journal recording the outcome of each username of a job.
+
+    Records are only ever appended and flushed one by one, so a killed
+    process loses at most the record being written. When a username
+    appears several times, the last record wins.
+    """
+
+    def __init__(self, path: str, fsync: bool = False) -> None:
+        """
+        Initialize the journal, creating its directory if needed.
+
+        Args:
+            path: Path of the journal file
+            fsync: Whether to fsync after every record, trading speed for
+                durability across power loss
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._path = path
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._needs_newline = self._ends_mid_line()
+
+    @property
+    def path(self) -> str:
+        """Path of the journal file."""
+        return self._path
+
+    def record_done(self, username: str, profile: Profile) -> None:
+        """Append a successful lookup."""
+        self._append({
+            'username': username,
+            'status': STATUS_DONE,
+            'profile': profile_to_dict(profile),
+            'error': None,
+            'recorded_at': time.time(),
+        })
+
+    def record_failed(self, username: str, error: str, reason: Optional[str] = None) -> None:
+        """Append a failed lookup, with the failure classification if known."""
+        self._append({
+            'username': username,
+            'status': STATUS_FAILED,
+            'profile': None,
+            'error': error,
+            'reason': reason,
+            'recorded_at': time.time(),
+        })
+
+    def load(self) -> Dict[str, JournalEntry]:
+        """
+        Read the latest entry of every username in the journal.
+
+        A truncated final line, left by a crash mid-write, is ignored.
+
+        Returns:
+            Entries keyed by lower-cased username
+        """
+        entries: Dict[str, JournalEntry] = {}
+        if not os.path.exists(self._path):
+            return entries
+
+        with open(self._path, encoding='utf-8') as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                profile_data = record.get('profile')
+                entries[record['username'].lower()] = JournalEntry(
+                    username=record['username'],
+                    status=record['status'],
+                    profile=profile_from_dict(profile_data) if profile_data else None,
+                    error=record.get('error'),
+                    reason=record.get('reason')
+                )
+        return entries
+
+    def _append(self, record: Dict) -> None:
+        """Write one record as a single line and flush it."""
+        line = json.dumps(record) + '\n'
+        with self._lock:
+            if self._needs_newline:
+                # Terminate a line truncated by a crash so it cannot swallow this record
+                line = '\n' + line
+                self._needs_newline = False
+            with open(self._path, 'a', encoding='utf-8') as journal_file:
+                journal_file.write(line)
+                journal_file.flush()
+                if self._fsync:
+                    os.fsync(journal_file.fileno())
+
+    def _ends_mid_line(self) -> bool:
+        """Whether an existing journal file lacks its final newline."""
+        if not os.path.exists(self._path) or os.path.getsize(self._path) == 0:
+            return False
+        with open(self._path, 'rb') as journal_file:
+            journal_file.seek(-1, os.SEEK_END)
+            return journal_file.read(1) != b'\n'
@@ -0,0 +1,461 @@
+"""Append-only archive of raw HikerAPI responses with a memory-mapped key index."""
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Endpoints archived, each in its own stream of chunk files
+STREAMS: Dict[str, str] = {
+    'user_by_username_v1': 'users',
+    'user_medias_v2': 'medias',
+}
+_STREAM_IDS = {name: ix for ix, name in enumerate(STREAMS.values())}
+_STREAM_NAMES = list(STREAMS.values())
+
+# Keys a response can be looked up by
+KEY_USERNAME = 'username'
+KEY_PK = 'pk'
+KEY_MEDIAS = 'medias'
+
+COMPRESSIONS = ('gzip', 'zstd')
+_EXTENSIONS = {'gzip': '.jsonl.gz', 'zstd': '.jsonl.zst'}
+
+# Index entry: key hash, stream, chunk, frame offset, frame length, line in frame
+_ENTRY = struct.Struct('<QBIQII')
+_INDEX_FILE = 'index.bin'
+
+_CHUNK_NAME = re.compile(r'^(?P<stream>[a-z]+)-(?P<chunk>\d{6})\.jsonl\.(?:gz|zst)$')
+
+
+@dataclass(frozen=True)
+class ArchivedResponse:
+    """One raw API response as it was received."""
+    endpoint: str
+    key: str
+    fetched_at: float
+    response: Dict[str, Any]
+
+
+def key_hash(kind: str, key: str) -> int:
+    """64-bit hash of a lookup key, as stored in the index."""
+    digest = hashlib.blake2b(f'{kind}:{key}'.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def _record_keys(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """The (kind, key) pairs a record is indexed under."""
+    if record['endpoint'] == 'user_by_username_v1':
+        keys = [(KEY_USERNAME, record['key'].lower())]
+        pk = (record['response'] or {}).get('pk')
+        if pk:
+            keys.append((KEY_PK, str(pk)))
+        return keys
+    return [(KEY_MEDIAS, record['key'])]
+
+
+class _Codec:
+    """Compresses frames so that a chunk file is a concatenation of complete streams."""
+
+    def __init__(self, compression: str) -> None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        self.name = compression
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError("zstd compression requires the 'zstandard' package") from e
+            self._zstd = zstandard
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress data into one complete, independently readable stream."""
+        if self.name == 'gzip':
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        return self._zstd.ZstdCompressor(level=3).compress(data)
+
+    def decompressobj(self) -> Any:
+        """A fresh decompressor for one stream; its eof is set at the stream's end."""
+        if self.name == 'gzip':
+            return zlib.decompressobj(wbits=31)
+        return self._zstd.ZstdDecompressor().decompressobj()
+
+
+class ResponseArchive:
+    """
+    Raw API responses in compressed, chunked JSON-lines files.
+
+    Each endpoint has its own stream of chunk files, e.g.
+    users-000003.jsonl.gz. Records are buffered into frames that are
+    compressed independently and appended back to back, so a chunk is still
+    a valid .jsonl.gz (or .jsonl.zst) file while any frame can be read on
+    its own. Every open starts new chunks, which keeps a frame truncated by
+    a crash from corrupting later ones.
+
+    index.bin maps usernames and pks to the frame and line of their latest
+    response. Its fixed-width entries are sorted by key hash and read
+    through mmap with a binary search, so a lookup in an archive of any size
+    decompresses only one frame. The index is rewritten by flush() and
+    close(). An archive whose chunks were written after its index, as after
+    a crash, is reindexed when it is opened.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        compression: str = 'gzip',
+        frame_records: int = 256,
+        chunk_bytes: int = 64 * 1024 * 1024,
+        clock: Any = time.time
+    ) -> None:
+        """
+        Open an archive, creating its directory if needed.
+
+        Args:
+            directory: Directory holding the chunks and the index
+            compression: 'gzip' or 'zstd' (requires the zstandard package)
+                for new chunks; existing chunks are read whatever theirs is
+            frame_records: Records compressed together; bigger frames
+                compress better but make each lookup decompress more
+            chunk_bytes: Size after which a stream starts a new chunk file
+            clock: Function returning the current time in seconds
+        """
+        if frame_records < 1:
+            raise ValueError("frame_records must be at least 1")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._codec = _Codec(compression)
+        self._frame_records = frame_records
+        self._chunk_bytes = chunk_bytes
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._chunks = self._scan_chunks()
+        self._writers: Dict[str, Tuple[int, IO[bytes]]] = {}
+        self._pending: Dict[str, List[Tuple[bytes, List[Tuple[str, str]]]]] = {name: [] for name in _STREAM_NAMES}
+        self._new_entries: Dict[int, Tuple[int, int, int, int, int]] = {}
+        self._readers: Dict[Tuple[int, int], IO[bytes]] = {}
+        self._frames: "OrderedDict[Tuple[int, int, int], List[bytes]]" = OrderedDict()
+        self._index: Optional[mmap.mmap] = None
+        self._index_size = 0
+        self._map_index()
+        if self._index_is_stale():
+            self.reindex()
+
+    def __enter__(self) -> "ResponseArchive":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def directory(self) -> str:
+        """Directory holding the chunks and the index."""
+        return self._directory
+
+    def __len__(self) -> int:
+        """Number of indexed keys."""
+        with self._lock:
+            return self._index_size + sum(
+                1 for key in self._new_entries if self._index_position(key) is None
+            )
+
+    def append(self, endpoint: str, key: str, response: Dict[str, Any]) -> None:
+        """
+        Archive one raw response.
+
+        Responses of endpoints outside STREAMS are ignored.
+
+        Args:
+            endpoint: hikerapi method that returned the response
+            key: The argument it was called with, a username or user id
+            response: The decoded JSON response
+        """
+        stream = STREAMS.get(endpoint)
+        if stream is None:
+            return
+        record = {'endpoint': endpoint, 'key': str(key), 'fetched_at': self._clock(), 'response': response}
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        with self._lock:
+            pending = self._pending[stream]
+            pending.append((line, _record_keys(record)))
+            if len(pending) >= self._frame_records:
+                self._write_frame(stream)
+
+    def get(self, kind: str, key: str) -> Optional[ArchivedResponse]:
+        """
+        Return the latest archived response for a key.
+
+        Args:
+            kind: KEY_USERNAME or KEY_PK for profile responses, KEY_MEDIAS
+                for the media of a user id
+            key: The username or user id
+
+        Returns:
+            The response, or None if it is not archived or its frame has not
+            been written yet
+        """
+        key = key.lower() if kind == KEY_USERNAME else str(key)
+        with self._lock:
+            entry = self._find(key_hash(kind, key))
+        if entry is None:
+            return None
+        stream, chunk, offset, length, line = entry
+        record = json.loads(self._read_frame(stream, chunk, offset, length)[line])
+        # Hashes can collide; a record for another key counts as a miss
+        if (kind, key) not in _record_keys(record):
+            return None
+        return ArchivedResponse(**record)
+
+    def user(self, username: str) -> Optional[ArchivedResponse]:
+        """Latest user_by_username_v1 response for a username."""
+        return self.get(KEY_USERNAME, username)
+
+    def user_by_pk(self, pk: str) -> Optional[ArchivedResponse]:
+        """Latest user_by_username_v1 response for a user id."""
+        return self.get(KEY_PK, pk)
+
+    def medias(self, pk: str) -> Optional[ArchivedResponse]:
+        """Latest user_medias_v2 response for a user id."""
+        return self.get(KEY_MEDIAS, pk)
+
+    def records(self, endpoint: str = 'user_by_username_v1') -> Iterator[ArchivedResponse]:
+        """
+        Stream every written response of an endpoint in archive order.
+
+        Args:
+            endpoint: One of STREAMS
+
+        Returns:
+            The responses, oldest chunk first, including superseded ones
+        """
+        stream = STREAMS[endpoint]
+        for chunk in self._chunk_numbers(stream):
+            for _, _, lines in self._scan_frames(stream, chunk):
+                for line in lines:
+                    yield ArchivedResponse(**json.loads(line))
+
+    def usernames(self) -> List[str]:
+        """Every archived username, lower-cased, in order of first appearance."""
+        return list(dict.fromkeys(record.key.lower() for record in self.records('user_by_username_v1')))
+
+    def flush(self) -> None:
+        """Write buffered records and update the index."""
+        with self._lock:
+            for stream in _STREAM_NAMES:
+                if self._pending[stream]:
+                    self._write_frame(stream)
+            if self._new_entries:
+                self._write_index(self._merged_entries())
+
+    def reindex(self) -> int:
+        """
+        Rebuild the index from the chunk files.
+
+        Frames left truncated by a crash are skipped.
+
+        Returns:
+            The number of indexed keys
+        """
+        with self._lock:
+            self.flush()
+            entries: Dict[int, Tuple[int, int, int, int, int]] = {}
+            for stream in _STREAM_NAMES:
+                stream_id = _STREAM_IDS[stream]
+                for chunk in self._chunk_numbers(stream):
+                    for offset, length, lines in self._scan_frames(stream, chunk):
+                        for line_no, line in enumerate(lines):
+                            for kind, key in _record_keys(json.loads(line)):
+                                entries[key_hash(kind, key)] = (stream_id, chunk, offset, length, line_no)
+            self._new_entries.clear()
+            self._write_index(entries)
+            return len(entries)
+
+    def close(self) -> None:
+        """Flush, then close every file."""
+        with self._lock:
+            self.flush()
+            for _, handle in self._writers.values():
+                handle.close()
+            for handle in self._readers.values():
+                handle.close()
+            self._writers.clear()
+            self._readers.clear()
+            self._frames.clear()
+            if self._index is not None:
+                self._index.close()
+                self._index = None
+
+    def _index_is_stale(self) -> bool:
+        """Whether any chunk file was modified after the index was last written."""
+        filenames = [filename for chunks in self._chunks.values() for filename in chunks.values()]
+        if not filenames:
+            return False
+        path = os.path.join(self._directory, _INDEX_FILE)
+        if not os.path.exists(path):
+            return True
+        index_mtime = os.stat(path).st_mtime_ns
+        return any(
+            os.stat(os.path.join(self._directory, filename)).st_mtime_ns > index_mtime for filename in filenames
+        )
+
+    def _scan_chunks(self) -> Dict[str, Dict[int, str]]:
+        """Chunk file names by stream and chunk number."""
+        chunks: Dict[str, Dict[int, str]] = {name: {} for name in _STREAM_NAMES}
+        for filename in os.listdir(self._directory):
+            match = _CHUNK_NAME.match(filename)
+            if match and match['stream'] in chunks:
+                chunks[match['stream']][int(match['chunk'])] = filename
+        return chunks
+
+    def _chunk_numbers(self, stream: str) -> List[int]:
+        with self._lock:
+            return sorted(self._chunks[stream])
+
+    def _codec_for(self, filename: str) -> _Codec:
+        return self._codec if filename.endswith(_EXTENSIONS[self._codec.name]) else _Codec(
+            'gzip' if filename.endswith('.gz') else 'zstd'
+        )
+
+    def _write_frame(self, stream: str) -> None:
+        """Compress the buffered records of a stream and append them as one frame."""
+        pending, self._pending[stream] = self._pending[stream], []
+        chunk, handle = self._writer(stream)
+        offset = handle.tell()
+        frame = self._codec.compress(b''.join(line for line, _ in pending))
+        handle.write(frame)
+        handle.flush()
+        stream_id = _STREAM_IDS[stream]
+        for line_no, (_, keys) in enumerate(pending):
+            for kind, key in keys:
+                self._new_entries[key_hash(kind, key)] = (stream_id, chunk, offset, len(frame), line_no)
+        if handle.tell() >= self._chunk_bytes:
+            handle.close()
+            del self._writers[stream]
+
+    def _writer(self, stream: str) -> Tuple[int, IO[bytes]]:
+        """The chunk file new frames of a stream go to, opening the next one if needed."""
+        if stream not in self._writers:
+            chunk = max(self._chunks[stream], default=-1) + 1
+            filename = f'{stream}-{chunk:06d}{_EXTENSIONS[self._codec.name]}'
+            self._chunks[stream][chunk] = filename
+            self._writers[stream] = (chunk, open(os.path.join(self._directory, filename), 'wb'))
+        return self._writers[stream]
+
+    def _read_frame(self, stream_id: int, chunk: int, offset: int, length: int) -> List[bytes]:
+        """Decompressed lines of one frame, from a small cache of recent frames."""
+        cache_key = (stream_id, chunk, offset)
+        with self._lock:
+            lines = self._frames.get(cache_key)
+            if lines is not None:
+                self._frames.move_to_end(cache_key)
+                return lines
+            filename = self._chunks[_STREAM_NAMES[stream_id]][chunk]
+            handle = self._readers.get((stream_id, chunk))
+            if handle is None:
+                handle = open(os.path.join(self._directory, filename), 'rb')
+                self._readers[(stream_id, chunk)] = handle
+            handle.seek(offset)
+            frame = handle.read(length)
+
+        decompressor = self._codec_for(filename).decompressobj()
+        lines = decompressor.decompress(frame).splitlines()
+        with self._lock:
+            self._frames[cache_key] = lines
+            if len(self._frames) > 16:
+                self._frames.popitem(last=False)
+        return lines
+
+    def _scan_frames(self, stream: str, chunk: int) -> Iterator[Tuple[int, int, List[bytes]]]:
+        """Offset, length and lines of every complete frame of a chunk file."""
+        filename = self._chunks[stream][chunk]
+        codec = self._codec_for(filename)
+        with open(os.path.join(self._directory, filename), 'rb') as chunk_file:
+            data = chunk_file.read()
+        view = memoryview(data)
+        offset = 0
+        while offset < len(data):
+            # Feed the frame in pieces so finding its end never copies the rest of the chunk
+            decompressor = codec.decompressobj()
+            parts = []
+            position = offset
+            while not decompressor.eof and position < len(data):
+                piece = view[position:position + 65536]
+                parts.append(decompressor.decompress(piece))
+                position += len(piece)
+            if not decompressor.eof:
+                return
+            end = position - len(decompressor.unused_data)
+            yield offset, end - offset, b''.join(parts).splitlines()
+            offset = end
+
+    def _map_index(self) -> None:
+        """Memory-map the index file, if there is one."""
+        if self._index is not None:
+            self._index.close()
+            self._index = None
+        self._index_size = 0
+        path = os.path.join(self._directory, _INDEX_FILE)
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            return
+        with open(path, 'rb') as index_file:
+            self._index = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._index_size = len(self._index) // _ENTRY.size
+
+    def _index_position(self, hashed: int) -> Optional[int]:
+        """Position of a key hash in the mapped index, by binary search."""
+        index, low, high = self._index, 0, self._index_size
+        if index is None:
+            return None
+        while low < high:
+            middle = (low + high) // 2
+            (value,) = struct.unpack_from('<Q', index, middle * _ENTRY.size)
+            if value < hashed:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._index_size and struct.unpack_from('<Q', index, low * _ENTRY.size)[0] == hashed:
+            return low
+        return None
+
+    def _find(self, hashed: int) -> Optional[Tuple[int, int, int, int, int]]:
+        """Location of the latest response for a key hash."""
+        entry = self._new_entries.get(hashed)
+        if entry is not None:
+            return entry
+        index = self._index
+        position = self._index_position(hashed)
+        if index is None or position is None:
+            return None
+        return _ENTRY.unpack_from(index, position * _ENTRY.size)[1:]
+
+    def _merged_entries(self) -> Dict[int, Tuple[int, int, int, int, int]]:
+        """The mapped index with the entries written since, which take precedence."""
+        entries: Dict[int, Tuple[int, int, int, int, int]] = {}
+        if self._index is not None:
+            for hashed, *location in _ENTRY.iter_unpack(self._index[:self._index_size * _ENTRY.size]):
+                entries[hashed] = tuple(location)
+        entries.update(self._new_entries)
+        return entries
+
+    def _write_index(self, entries: Dict[int, Tuple[int, int, int, int, int]]) -> None:
+        """Replace the index file atomically and map the new one."""
+        path = os.path.join(self._directory, _INDEX_FILE)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as index_file:
+            index_file.write(b''.join(_ENTRY.pack(hashed, *entries[hashed]) for hashed in sorted(entries)))
+        if self._index is not None:
+            # Windows cannot replace a file that is still mapped
+            self._index.close()
+            self._index = None
+        os.replace(tmp_path, path)
+        self._new_entries.clear()
+        self._map_index()
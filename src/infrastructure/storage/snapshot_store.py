@@ -0,0 +1,327 @@
+"""Time series of profile statistics stored in SQLite."""
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from src.domain.models.profile import EngagementStatistics, Profile
+
+
+DAY = 24 * 3600
+
+# Columns that growth and top mover queries can rank by
+METRICS = (
+    'followers_count', 'following_count', 'posts_count',
+    'avg_post_likes', 'avg_post_comments', 'engagement_rate',
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    userid TEXT NOT NULL,
+    taken_at REAL NOT NULL,
+    username TEXT NOT NULL,
+    followers_count INTEGER NOT NULL,
+    following_count INTEGER NOT NULL,
+    posts_count INTEGER NOT NULL,
+    avg_post_likes REAL,
+    avg_post_comments REAL,
+    engagement_rate REAL,
+    PRIMARY KEY (userid, taken_at)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_snapshots_taken_at ON snapshots (taken_at);
+"""
+
+
+def _engagement_metrics(
+    eng_stats: Optional[EngagementStatistics]
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """Engagement columns of a snapshot, NULL when the statistics were not loaded."""
+    if eng_stats is None:
+        return None, None, None
+    return eng_stats.recent_avg_post_likes, eng_stats.recent_avg_post_comments, eng_stats.engagement_rate
+
+
+_COLUMNS = 'userid, taken_at, username, ' + ', '.join(METRICS)
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSnapshot:
+    """Statistics of one profile at one point in time."""
+    userid: str
+    taken_at: float
+    username: str
+    followers_count: int
+    following_count: int
+    posts_count: int
+    avg_post_likes: Optional[float]
+    avg_post_comments: Optional[float]
+    engagement_rate: Optional[float]
+
+
+@dataclass(frozen=True, slots=True)
+class Growth:
+    """Change of a metric between the first and last snapshot of a range."""
+    userid: str
+    username: str
+    metric: str
+    start_at: float
+    end_at: float
+    start_value: float
+    end_value: float
+
+    @property
+    def delta(self) -> float:
+        """Absolute change."""
+        return self.end_value - self.start_value
+
+    @property
+    def ratio(self) -> Optional[float]:
+        """Relative change, None when the start value is 0."""
+        return self.delta / self.start_value if self.start_value else None
+
+
+class SnapshotStore:
+    """
+    Append-only store of timestamped profile statistics.
+
+    Every recorded profile adds one row keyed by (userid, taken_at), so
+    per-account history and range queries are index scans. Old rows can be
+    downsampled to one per bucket to keep the database bounded when
+    thousands of accounts are tracked daily. Engagement metrics are NULL
+    until loaded and NULL rows are left out of growth and mover queries.
+    """
+
+    def __init__(self, db_path: str, clock: Callable[[], float] = time.time) -> None:
+        """
+        Open the store, creating its tables if needed.
+
+        Args:
+            db_path: Path of the SQLite database file (":memory:" for tests)
+            clock: Function returning the current time in seconds
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def record(self, profiles: Iterable[Profile], taken_at: Optional[float] = None) -> int:
+        """
+        Append a snapshot of each profile.
+
+        Profiles without engagement statistics, like private accounts or
+        lookups that skip them, record NULL engagement metrics;
+        update_engagement fills them in once loaded.
+
+        Args:
+            profiles: Profiles just fetched
+            taken_at: Snapshot time in seconds, defaults to now
+
+        Returns:
+            The number of snapshots written
+        """
+        taken_at = self._clock() if taken_at is None else taken_at
+        rows = [
+            (
+                str(profile.userid),
+                taken_at,
+                profile.username,
+                profile.statistics.followers_count,
+                profile.statistics.following_count,
+                profile.statistics.posts_count,
+                *_engagement_metrics(profile.engagement_stats),
+            )
+            for profile in profiles
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO snapshots ({_COLUMNS}) VALUES ({', '.join('?' * 9)})",
+                rows
+            )
+        return len(rows)
+
+    def update_engagement(self, profiles: Iterable[Profile]) -> int:
+        """
+        Set the engagement metrics of each profile's latest snapshot.
+
+        Args:
+            profiles: Profiles whose engagement statistics were loaded after
+                they were recorded; those still without statistics are skipped
+
+        Returns:
+            The number of snapshots updated
+        """
+        rows = [
+            (*_engagement_metrics(profile.engagement_stats), str(profile.userid), str(profile.userid))
+            for profile in profiles
+            if profile.engagement_stats is not None
+        ]
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                "UPDATE snapshots SET avg_post_likes = ?, avg_post_comments = ?, engagement_rate = ? "
+                "WHERE userid = ? AND taken_at = (SELECT MAX(taken_at) FROM snapshots WHERE userid = ?)",
+                rows
+            )
+        return cursor.rowcount
+
+    def history(self, userid: str, since: Optional[float] = None, until: Optional[float] = None) -> List[ProfileSnapshot]:
+        """
+        Return the snapshots of one account, oldest first.
+
+        Args:
+            userid: Instagram id of the account
+            since: Earliest snapshot time, unbounded if None
+            until: Latest snapshot time, unbounded if None
+
+        Returns:
+            The snapshots in time order
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM snapshots "
+                "WHERE userid = ? AND taken_at >= ? AND taken_at <= ? ORDER BY taken_at",
+                (userid, *self._range(since, until))
+            ).fetchall()
+        return [ProfileSnapshot(*row) for row in rows]
+
+    def growth(self, userid: str, days: float = 30, metric: str = 'followers_count') -> Optional[Growth]:
+        """
+        Change of a metric of one account over the last days.
+
+        Args:
+            userid: Instagram id of the account
+            days: Length of the range ending now
+            metric: One of METRICS
+
+        Returns:
+            The change, or None if the account has no snapshot in the range
+            with the metric set
+        """
+        movers = self._movers(metric, self._clock() - days * DAY, None, "AND userid = ?", (userid,), 1)
+        return movers[0] if movers else None
+
+    def top_movers(
+        self,
+        days: float = 30,
+        metric: str = 'followers_count',
+        limit: int = 10,
+        relative: bool = False,
+        ascending: bool = False
+    ) -> List[Growth]:
+        """
+        Accounts whose metric changed most over the last days.
+
+        Only accounts with at least two snapshots in the range are ranked.
+
+        Args:
+            days: Length of the range ending now
+            metric: One of METRICS
+            limit: Maximum number of accounts returned
+            relative: Rank by relative instead of absolute change
+            ascending: Return the biggest losers instead of gainers
+
+        Returns:
+            The accounts, biggest movers first
+        """
+        change = "(l.value - f.value) * 1.0 / NULLIF(f.value, 0)" if relative else "l.value - f.value"
+        order = f"{change} IS NULL, {change} {'ASC' if ascending else 'DESC'}"
+        return self._movers(metric, self._clock() - days * DAY, order, "", (), limit, min_snapshots=2)
+
+    def downsample(self, older_than_days: float, bucket_days: float = 1) -> int:
+        """
+        Keep only the latest snapshot per account and bucket for old rows.
+
+        Args:
+            older_than_days: Only rows older than this many days are thinned
+            bucket_days: Bucket length, e.g. 1 for daily or 7 for weekly
+
+        Returns:
+            The number of snapshots deleted
+        """
+        if bucket_days <= 0:
+            raise ValueError("bucket_days must be positive")
+        cutoff = self._clock() - older_than_days * DAY
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM snapshots WHERE taken_at < :cutoff AND (userid, taken_at) NOT IN ("
+                "SELECT userid, MAX(taken_at) FROM snapshots WHERE taken_at < :cutoff "
+                "GROUP BY userid, CAST(taken_at / :bucket AS INTEGER))",
+                {'cutoff': cutoff, 'bucket': bucket_days * DAY}
+            )
+        return cursor.rowcount
+
+    def purge(self, older_than_days: float) -> int:
+        """
+        Delete snapshots older than a number of days.
+
+        Returns:
+            The number of snapshots deleted
+        """
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM snapshots WHERE taken_at < ?", (self._clock() - older_than_days * DAY,)
+            )
+        return cursor.rowcount
+
+    def compact(self, daily_after_days: float = 7, weekly_after_days: float = 90, purge_after_days: Optional[float] = None) -> int:
+        """
+        Apply the default retention policy.
+
+        Rows are kept as recorded for daily_after_days, then thinned to one
+        per day, then to one per week after weekly_after_days, and dropped
+        after purge_after_days if given.
+
+        Returns:
+            The number of snapshots deleted
+        """
+        deleted = self.downsample(daily_after_days, bucket_days=1)
+        deleted += self.downsample(weekly_after_days, bucket_days=7)
+        if purge_after_days is not None:
+            deleted += self.purge(purge_after_days)
+        return deleted
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _movers(
+        self,
+        metric: str,
+        since: float,
+        order: Optional[str],
+        condition: str,
+        params: tuple,
+        limit: int,
+        min_snapshots: int = 1
+    ) -> List[Growth]:
+        """Compare the first and last snapshot of each account in a range."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        query = (
+            "WITH ranged AS ("
+            f"SELECT userid, username, taken_at, {metric} AS value, "
+            "ROW_NUMBER() OVER (PARTITION BY userid ORDER BY taken_at) AS first_rank, "
+            "ROW_NUMBER() OVER (PARTITION BY userid ORDER BY taken_at DESC) AS last_rank, "
+            "COUNT(*) OVER (PARTITION BY userid) AS snapshot_count "
+            f"FROM snapshots WHERE taken_at >= ? AND {metric} IS NOT NULL {condition}) "
+            "SELECT f.userid, l.username, f.taken_at, l.taken_at, f.value, l.value "
+            "FROM ranged f JOIN ranged l ON l.userid = f.userid AND l.last_rank = 1 "
+            "WHERE f.first_rank = 1 AND f.snapshot_count >= ? "
+            f"{'ORDER BY ' + order if order else ''} LIMIT ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, (since, *params, min_snapshots, limit)).fetchall()
+        return [
+            Growth(userid, username, metric, start_at, end_at, start_value, end_value)
+            for userid, username, start_at, end_at, start_value, end_value in rows
+        ]
+
+    @staticmethod
+    def _range(since: Optional[float], until: Optional[float]) -> tuple:
+        """Bounds of a time range with None meaning unbounded."""
+        return (
+            float('-inf') if since is None else since,
+            float('inf') if until is None else until,
+        )
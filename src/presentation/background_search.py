@@ -0,0 +1,111 @@
+"""Profile lookups on worker threads with results handed over through a queue."""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple
+
+from src.domain.models.profile import Profile
+
+
+class LookupServiceProtocol(Protocol):
+    """Protocol for the profile service used by background searches."""
+
+    def get_profile(self, username: str) -> Tuple[Optional[Profile], Optional[str]]:
+        """Get a profile by username."""
+        ...
+
+
+@dataclass(frozen=True)
+class LookupResult:
+    """Outcome of one username lookup."""
+    username: str
+    profile: Optional[Profile]
+    error: Optional[str]
+
+
+class BackgroundSearch:
+    """
+    Runs one lookup per username on a worker pool.
+
+    Results are put on a thread-safe queue in completion order, so the UI
+    thread can drain them with poll() without ever blocking on the network.
+    """
+
+    def __init__(self, profile_service: LookupServiceProtocol, usernames: List[str], max_workers: int = 8) -> None:
+        """
+        Start looking up the usernames.
+
+        Args:
+            profile_service: Service used for the lookups
+            usernames: Usernames to look up
+            max_workers: Number of lookups in flight
+        """
+        self._profile_service = profile_service
+        self._results: "queue.Queue[LookupResult]" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._total = len(usernames)
+        self._received = 0
+        self._executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, self._total)))
+        self._futures: List[Future] = [
+            self._executor.submit(self._lookup, username) for username in usernames
+        ]
+        self._executor.shutdown(wait=False)
+
+    @property
+    def total(self) -> int:
+        """Number of usernames in the search."""
+        return self._total
+
+    @property
+    def received(self) -> int:
+        """Number of results handed out by poll() so far."""
+        return self._received
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancel() was called."""
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self) -> bool:
+        """Whether no more results will arrive."""
+        if self.cancelled:
+            return self._results.empty() and all(f.done() for f in self._futures)
+        return self._received == self._total
+
+    def poll(self, max_results: int = 100) -> List[LookupResult]:
+        """
+        Take the results that are ready without blocking.
+
+        Args:
+            max_results: Maximum number of results returned per call
+
+        Returns:
+            Results in completion order
+        """
+        results: List[LookupResult] = []
+        while len(results) < max_results:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        self._received += len(results)
+        return results
+
+    def cancel(self) -> None:
+        """Drop the lookups that have not started; running ones finish silently."""
+        self._cancelled.set()
+        for future in self._futures:
+            future.cancel()
+
+    def _lookup(self, username: str) -> None:
+        """Run one lookup on a worker thread and queue its result."""
+        if self._cancelled.is_set():
+            return
+        try:
+            profile, error = self._profile_service.get_profile(username)
+        except Exception as e:
+            profile, error = None, str(e)
+        if not self._cancelled.is_set():
+            self._results.put(LookupResult(username=username, profile=profile, error=error))
@@ -0,0 +1,219 @@
+"""Headless command line batch mode."""
+import sys
+from collections import deque
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional, Protocol, TextIO, Tuple
+
+from src.application.batch_job import BatchJob, BatchProfileServiceProtocol
+from src.domain.models.lookup import LOOKUP_NOT_FOUND, LookupOutcome
+from src.domain.models.profile import Profile
+from src.domain.validators import username_input
+
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_PARTIAL = 2
+
+
+class StreamingExporterProtocol(Protocol):
+    """Protocol for exporters that write profiles as they arrive."""
+
+    def export_stream(self, profiles: Iterator[Profile], filepath: str) -> int:
+        """Write profiles to a file and return the number written."""
+        ...
+
+
+def read_usernames(stream: TextIO, progress: Optional[TextIO] = None) -> List[str]:
+    """
+    Read usernames separated by commas, spaces or newlines.
+
+    Args:
+        stream: Text stream to read line by line, e.g. an open file or stdin
+        progress: Stream where rejected entries are reported, None for silence
+
+    Returns:
+        The valid usernames in input order, lower-cased and without duplicates
+    """
+    batch = username_input.read_usernames(stream)
+    for token, reason in batch.rejected.items():
+        _report(progress, f"Skipping {token!r}: {reason}")
+    return batch.valid
+
+
+def run_batch(
+    profile_service: BatchProfileServiceProtocol,
+    exporter: StreamingExporterProtocol,
+    usernames: List[str],
+    output: str,
+    concurrency: int = 8,
+    progress: Optional[TextIO] = sys.stderr,
+    retry_rounds: int = 1
+) -> int:
+    """
+    Look up usernames concurrently and stream the found profiles to a file.
+
+    A failed lookup never stops the batch. Usernames that failed for a
+    temporary reason (rate limiting, server or network errors) are looked
+    up again once every other username was tried.
+
+    Args:
+        profile_service: Service used for the lookups
+        exporter: Exporter writing each profile as it resolves
+        usernames: Usernames to look up
+        output: Path of the output file
+        concurrency: Number of lookups in flight; at most twice as many
+            are queued, so a long input is not submitted all at once
+        progress: Stream for progress and failure messages, None for silence
+        retry_rounds: Number of times temporary failures are looked up again
+
+    Returns:
+        EXIT_OK if every lookup succeeded, EXIT_PARTIAL if some failed,
+        EXIT_FAILED if none succeeded
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    failures: List[LookupOutcome] = []
+    total = len(usernames)
+
+    def found_profiles() -> Iterator[Profile]:
+        retry: List[str] = []
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = _bounded_map(executor, profile_service.lookup_profile, usernames, 2 * concurrency)
+            for done, (username, outcome) in enumerate(outcomes, 1):
+                if outcome.ok and outcome.profile is not None:
+                    _report(progress, f"[{done}/{total}] {username}: ok")
+                    yield outcome.profile
+                elif outcome.retryable and retry_rounds:
+                    retry.append(username)
+                    _report(progress, f"[{done}/{total}] {username}: {outcome.status}, will retry ({outcome.error})")
+                else:
+                    failures.append(outcome)
+                    _report(progress, f"[{done}/{total}] {username}: FAILED {_describe(outcome)}")
+
+            for round_number in range(1, retry_rounds + 1):
+                if not retry:
+                    break
+                _report(progress, f"Retrying {len(retry)} temporary failures (round {round_number})")
+                current, retry = retry, []
+                for username, outcome in _bounded_map(executor, profile_service.lookup_profile, current, 2 * concurrency):
+                    if outcome.ok and outcome.profile is not None:
+                        _report(progress, f"{username}: ok")
+                        yield outcome.profile
+                    elif outcome.retryable and round_number < retry_rounds:
+                        retry.append(username)
+                    else:
+                        failures.append(outcome)
+                        _report(progress, f"{username}: FAILED {_describe(outcome)}")
+
+        for outcome in failures:
+            _mark_failed(exporter, outcome)
+
+    written = exporter.export_stream(found_profiles(), output)
+    _report(progress, f"Exported {written} of {total} profiles to {output}, {len(failures)} failed")
+
+    if not failures:
+        return EXIT_OK
+    return EXIT_PARTIAL if written else EXIT_FAILED
+
+
+def run_job(
+    job: BatchJob,
+    exporter: StreamingExporterProtocol,
+    usernames: List[str],
+    output: str,
+    progress: Optional[TextIO] = sys.stderr
+) -> int:
+    """
+    Run or resume a journaled batch job and export its results.
+
+    The export is built from the journal, so it includes profiles fetched
+    by earlier, interrupted runs of the same job.
+
+    Args:
+        job: The resumable job
+        exporter: Exporter writing the final results
+        usernames: All usernames of the job
+        output: Path of the output file
+        progress: Stream for progress and failure messages, None for silence
+
+    Returns:
+        EXIT_OK if every username is done, EXIT_PARTIAL if some failed,
+        EXIT_FAILED if none is done
+    """
+    summary = job.run(
+        usernames,
+        on_progress=lambda processed, pending: _report(progress, f"[{processed}/{pending}] processed")
+    )
+    _report(
+        progress,
+        f"Job finished: {summary.skipped} already finished, {summary.done} fetched, "
+        f"{summary.failed} failed, {summary.retried} retried"
+    )
+
+    failures = job.failures(usernames)
+    for outcome in failures:
+        _report(progress, f"{outcome.username}: FAILED {_describe(outcome)}")
+        _mark_failed(exporter, outcome)
+
+    written = exporter.export_stream(job.results(usernames), output)
+    _report(progress, f"Exported {written} of {summary.total} profiles to {output}")
+
+    if not failures:
+        return EXIT_OK
+    return EXIT_PARTIAL if written else EXIT_FAILED
+
+
+def _bounded_map(
+    executor: Executor,
+    lookup: Callable[[str], LookupOutcome],
+    usernames: Iterable[str],
+    limit: int
+) -> Iterator[Tuple[str, LookupOutcome]]:
+    """
+    Look up usernames on an executor, in input order, with a bounded queue.
+
+    Unlike Executor.map, which submits every call up front, at most limit
+    lookups are submitted but not yet consumed at any time.
+
+    Args:
+        executor: Executor running the lookups
+        lookup: Function looking up one username
+        usernames: Usernames to look up
+        limit: Maximum number of submitted lookups
+
+    Returns:
+        (username, outcome) pairs in input order
+    """
+    pending: Deque[Tuple[str, Future]] = deque()
+    for username in usernames:
+        if len(pending) >= limit:
+            oldest, future = pending.popleft()
+            yield oldest, future.result()
+        pending.append((username, executor.submit(lookup, username)))
+    while pending:
+        oldest, future = pending.popleft()
+        yield oldest, future.result()
+
+
+def _describe(outcome: LookupOutcome) -> str:
+    """Failure classification and message of an outcome."""
+    return f"[{outcome.status}] ({outcome.error})"
+
+
+def _mark_failed(exporter: StreamingExporterProtocol, outcome: LookupOutcome) -> None:
+    """
+    Tell exporters that track failed lookups, such as delta exports, about one.
+
+    Accounts that were not found are left out: for a delta export they are
+    genuinely removed, not merely unknown in this run.
+    """
+    mark_failed = getattr(exporter, "mark_failed", None)
+    if mark_failed is not None and outcome.status != LOOKUP_NOT_FOUND:
+        mark_failed(outcome.username)
+
+
+def _report(progress: Optional[TextIO], message: str) -> None:
+    """Write a progress line if progress output is enabled."""
+    if progress is not None:
+        print(message, file=progress, flush=True)
@@ -0,0 +1,168 @@
+"""Engagement statistics loaded on worker threads, selected profiles first."""
+import itertools
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Tuple
+
+from src.domain.models.profile import Profile
+
+
+# Queue priorities; lower values are served first
+URGENT = 0
+BACKGROUND = 1
+_STOP = -1
+
+
+class EngagementServiceProtocol(Protocol):
+    """Protocol for the profile service used by the loader."""
+
+    def load_engagement(self, profile: Profile) -> Tuple[Optional[Profile], Optional[str]]:
+        """Fill in the engagement statistics of a profile."""
+        ...
+
+
+@dataclass(frozen=True)
+class EngagementResult:
+    """Outcome of loading the engagement statistics of one profile."""
+    username: str
+    profile: Optional[Profile]
+    error: Optional[str]
+
+
+class EngagementLoader:
+    """
+    Fills in the engagement statistics of profiles shown without them.
+
+    Requests go to a priority queue served by daemon worker threads, so
+    profiles the user selects jump ahead of the background backlog. Each
+    profile is loaded at most once per reset(); results are handed to the UI
+    thread through poll(), as with BackgroundSearch.
+    """
+
+    def __init__(self, profile_service: EngagementServiceProtocol, max_workers: int = 4) -> None:
+        """
+        Start the worker threads.
+
+        Args:
+            profile_service: Service used to load the statistics
+            max_workers: Number of loads in flight
+        """
+        self._profile_service = profile_service
+        self._requests: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+        self._results: "queue.Queue[EngagementResult]" = queue.Queue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._queued: Dict[str, int] = {}
+        self._in_flight: Set[str] = set()
+        self._loaded: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._workers = [
+            threading.Thread(target=self._work, name=f"engagement-{ix}", daemon=True)
+            for ix in range(max(1, max_workers))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def pending(self) -> int:
+        """Number of profiles queued, being loaded, or loaded but not polled yet."""
+        with self._lock:
+            return len(self._queued) + len(self._in_flight) + self._results.qsize()
+
+    def request(self, profiles: Iterable[Profile], urgent: bool = False) -> int:
+        """
+        Queue the profiles that still need engagement statistics.
+
+        Profiles already loaded, queued or in flight are skipped, except
+        that an urgent request moves a queued profile ahead and retries one
+        that failed before.
+
+        Args:
+            profiles: Profiles shown in the results
+            urgent: Whether to load them before the background backlog
+
+        Returns:
+            The number of profiles queued
+        """
+        priority = URGENT if urgent else BACKGROUND
+        count = 0
+        with self._lock:
+            for profile in profiles:
+                if not profile.engagement_pending:
+                    continue
+                key = profile.username.lower()
+                if key in self._loaded or key in self._in_flight:
+                    continue
+                if key in self._failed and not urgent:
+                    continue
+                queued = self._queued.get(key)
+                if queued is not None and queued <= priority:
+                    continue
+                self._failed.discard(key)
+                self._queued[key] = priority
+                self._requests.put((priority, next(self._sequence), self._generation, profile))
+                count += 1
+        return count
+
+    def poll(self, max_results: int = 100) -> List[EngagementResult]:
+        """
+        Take the results that are ready without blocking.
+
+        Args:
+            max_results: Maximum number of results returned per call
+
+        Returns:
+            Results in completion order
+        """
+        results: List[EngagementResult] = []
+        while len(results) < max_results:
+            try:
+                results.append(self._results.get_nowait())
+            except queue.Empty:
+                break
+        return results
+
+    def reset(self) -> None:
+        """Drop queued requests and forget every profile, e.g. for a new search."""
+        with self._lock:
+            self._generation += 1
+            self._queued.clear()
+            self._in_flight.clear()
+            self._loaded.clear()
+            self._failed.clear()
+        self.poll(max_results=self._results.qsize() + 1)
+
+    def close(self) -> None:
+        """Stop the workers once their current load finishes."""
+        self.reset()
+        for _ in self._workers:
+            self._requests.put((_STOP, next(self._sequence), 0, None))
+
+    def _work(self) -> None:
+        """Serve requests on a worker thread until close() is called."""
+        while True:
+            priority, _, generation, profile = self._requests.get()
+            if profile is None:
+                return
+            key = profile.username.lower()
+            with self._lock:
+                # Requests from before a reset, or superseded by an urgent
+                # copy of the same profile, are dropped
+                if generation != self._generation or self._queued.get(key) != priority:
+                    continue
+                del self._queued[key]
+                self._in_flight.add(key)
+
+            try:
+                filled, error = self._profile_service.load_engagement(profile)
+            except Exception as e:
+                filled, error = None, str(e)
+
+            with self._lock:
+                if generation != self._generation:
+                    continue
+                self._in_flight.discard(key)
+                (self._loaded if filled is not None else self._failed).add(key)
+                self._results.put(EngagementResult(username=profile.username, profile=filled, error=error))
@@ -1,9 +1,125 @@
 """Main application window."""
 import tkinter as tk
+from functools import partial
 from tkinter import ttk, filedialog, messagebox
-from typing import List, Optional, Protocol, Callable
+from typing import Any, Dict, List, Optional, Protocol
 
 from src.domain.models.profile import Profile
+from src.domain.validators.username_input import parse_usernames
+from src.presentation.background_search import BackgroundSearch
+from src.presentation.engagement_loader import EngagementLoader
+from src.presentation.result_store import ResultFilter, ResultStore, parse_filter
+from src.presentation.virtual_tree import VirtualTreeView
+
+
+# Milliseconds between two drains of the background result queue
+POLL_INTERVAL_MS = 50
+
+# Milliseconds between two refreshes of the API stats panel
+STATS_INTERVAL_MS = 1000
+
+
+# Shown in engagement cells still loading, and in those of private accounts
+ENGAGEMENT_PENDING = "…"
+ENGAGEMENT_UNAVAILABLE = "–"
+
+
+def profile_row_values(profile: Profile) -> tuple:
+    """Format a profile as the values of one result row."""
+    stats = profile.statistics
+    eng_stats = profile.engagement_stats
+    if eng_stats is None:
+        placeholder = ENGAGEMENT_PENDING if profile.engagement_pending else ENGAGEMENT_UNAVAILABLE
+        engagement = (placeholder,) * 4
+    else:
+        engagement = (
+            f"{eng_stats.recent_avg_post_likes:.1f}",
+            f"{eng_stats.recent_avg_post_comments:.1f}",
+            f"{eng_stats.recent_avg_post_reshares:.1f}",
+            f"{eng_stats.recent_post_count}",
+        )
+    return (
+        profile.username,
+        profile.full_name or "",
+        f"{stats.followers_count:,}",
+        f"{stats.following_count:,}",
+        *engagement,
+        "✓" if profile.is_verified else "✗"
+    )
+
+
+def profile_details(profile: Profile, engagement_error: Optional[str] = None) -> str:
+    """
+    Describe a profile for the details panel.
+    
+    Args:
+        profile: The selected profile
+        engagement_error: Why its engagement statistics failed to load, if they did
+        
+    Returns:
+        The details text
+    """
+    stats = profile.statistics
+    eng_stats = profile.engagement_stats
+    if eng_stats is not None:
+        engagement = (
+            f"Engagements: {eng_stats.recent_avg_post_likes:.1f} avg likes, "
+            f"{eng_stats.recent_avg_post_comments:.1f} avg comments, "
+            f"{eng_stats.recent_post_count:,} posts recently\n"
+            f"Median likes: {eng_stats.median_post_likes:.1f}, "
+            f"Engagement rate: {eng_stats.engagement_rate:.2%}"
+        )
+    elif profile.is_private:
+        engagement = "Engagements: not available for private accounts"
+    elif engagement_error:
+        engagement = f"Engagements: failed to load ({engagement_error})"
+    else:
+        engagement = "Engagements: loading…"
+    return (
+        f"Username: @{profile.username}\n"
+        f"Name: {profile.full_name or 'N/A'}\n"
+        f"Bio: {profile.bio or 'N/A'}\n"
+        f"Account: {'Private' if profile.is_private else 'Public'}"
+        f"{', Verified' if profile.is_verified else ''}\n"
+        f"Stats: {stats.followers_count:,} followers, {stats.following_count:,} following, "
+        f"{engagement}"
+    )
+
+
+def format_metrics(snapshot: Dict[str, Any]) -> str:
+    """
+    Summarize a metrics snapshot for the stats panel.
+    
+    Args:
+        snapshot: A snapshot made by MetricsRegistry.snapshot
+        
+    Returns:
+        One line per API endpoint with its call count, latency and errors,
+        followed by a line of retry and cache totals
+    """
+    totals: Dict[str, float] = {}
+    errors: Dict[str, float] = {}
+    for counter in snapshot['counters']:
+        totals[counter['name']] = totals.get(counter['name'], 0) + counter['value']
+        if counter['name'] == 'api_errors_total':
+            endpoint = counter['labels'].get('endpoint', '')
+            errors[endpoint] = errors.get(endpoint, 0) + counter['value']
+    
+    lines = []
+    for histogram in sorted(snapshot['histograms'], key=lambda h: h['labels'].get('endpoint', '')):
+        if histogram['name'] != 'api_request_seconds':
+            continue
+        endpoint = histogram['labels'].get('endpoint', '')
+        lines.append(
+            f"{endpoint}: {histogram['count']:,} calls, p50 {histogram['p50'] * 1000:.0f} ms, "
+            f"p99 {histogram['p99'] * 1000:.0f} ms, {errors.get(endpoint, 0):,.0f} errors"
+        )
+    lines.append(
+        f"Retries: {totals.get('api_retries_total', 0):,.0f}   "
+        f"Cache: {totals.get('cache_hits_total', 0):,.0f} hits, "
+        f"{totals.get('cache_misses_total', 0):,.0f} misses"
+    )
+    return "\n".join(lines)
 
 
 class ProfileServiceProtocol(Protocol):
@@ -16,6 +132,10 @@ class ProfileServiceProtocol(Protocol):
     def search_profiles(self, query: str) -> tuple[Optional[List[Profile]], Optional[str]]:
         """Search for profiles matching the query."""
         ...
+    
+    def load_engagement(self, profile: Profile) -> tuple[Optional[Profile], Optional[str]]:
+        """Fill in the engagement statistics of a profile fetched without them."""
+        ...
 
 
 class ExporterProtocol(Protocol):
@@ -26,6 +146,14 @@ class ExporterProtocol(Protocol):
         ...
 
 
+class MetricsSourceProtocol(Protocol):
+    """Protocol for metrics registries."""
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Current values of every metric."""
+        ...
+
+
 class MainWindow(ttk.Frame):
     """Main application window."""
     
@@ -33,7 +161,9 @@ class MainWindow(ttk.Frame):
         self,
         master: tk.Tk,
         profile_service: ProfileServiceProtocol,
-        exporter: ExporterProtocol
+        exporter: ExporterProtocol,
+        max_workers: int = 8,
+        metrics: Optional[MetricsSourceProtocol] = None
     ) -> None:
         """
         Initialize the main window.
@@ -42,15 +172,31 @@ class MainWindow(ttk.Frame):
             master: The root Tkinter window
             profile_service: Service for profile operations
             exporter: Service for exporting data
+            max_workers: Number of lookups, and of engagement loads, run in
+                the background at once
+            metrics: Registry shown in the API stats panel, which is
+                omitted when None
         """
         super().__init__(master)
         self.master = master
         self._profile_service = profile_service
         self._exporter = exporter
-        self._profiles: List[Profile] = []
+        self._max_workers = max_workers
+        self._metrics = metrics
+        self._store = ResultStore(VirtualTreeView.row_id_for_iid)
+        self._filter = ResultFilter()
+        self._search: Optional[BackgroundSearch] = None
+        self._failures: List[str] = []
+        self._sort_column: Optional[str] = None
+        self._sort_reverse = False
+        self._engagement = EngagementLoader(profile_service, max_workers=max_workers)
+        self._engagement_errors: Dict[str, str] = {}
+        self._polling_engagement = False
         
         self.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         self._create_widgets()
+        if metrics is not None:
+            self._refresh_stats()
     
     def _create_widgets(self) -> None:
         """Create and arrange UI widgets."""
@@ -65,16 +211,42 @@ class MainWindow(ttk.Frame):
         username_entry.grid(row=0, column=1, padx=5, pady=5)
         username_entry.bind("<Return>", lambda e: self._search_profile())
         
-        ttk.Button(
+        self._search_button = ttk.Button(
             search_frame,
             text="Search",
             command=self._search_profile
-        ).grid(row=0, column=2, padx=5, pady=5)
+        )
+        self._search_button.grid(row=0, column=2, padx=5, pady=5)
+        
+        self._cancel_button = ttk.Button(
+            search_frame,
+            text="Cancel",
+            command=self._cancel_search,
+            state=tk.DISABLED
+        )
+        self._cancel_button.grid(row=0, column=3, padx=5, pady=5)
+        
+        self._progress = ttk.Progressbar(search_frame, mode="determinate", length=200)
+        self._progress.grid(row=0, column=4, padx=5, pady=5)
+        
+        self._status_var = tk.StringVar()
+        ttk.Label(search_frame, textvariable=self._status_var).grid(row=0, column=5, padx=5, pady=5)
         
         # Results frame
         results_frame = ttk.LabelFrame(self, text="Profile Results")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
+        filter_frame = ttk.Frame(results_frame)
+        filter_frame.pack(side=tk.TOP, fill=tk.X)
+        ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT, padx=5, pady=5)
+        self._filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self._filter_var, width=40)
+        filter_entry.pack(side=tk.LEFT, padx=5, pady=5)
+        filter_entry.bind("<Return>", lambda e: self._apply_filter())
+        ttk.Button(filter_frame, text="Apply", command=self._apply_filter).pack(side=tk.LEFT, padx=5)
+        self._filter_status_var = tk.StringVar(value="e.g. followers > 10k, verified")
+        ttk.Label(filter_frame, textvariable=self._filter_status_var).pack(side=tk.LEFT, padx=5)
+        
         # Create treeview for results
         columns = (
             "username", "full_name", "followers", "following", "avg_post_likes",
@@ -97,7 +269,8 @@ class MainWindow(ttk.Frame):
         self._results_tree.heading("recent_posts", text="Recent Posts")
         self._results_tree.heading("verified", text="Verified")
         self._results_tree.heading("full_name", text="Full Name")
-
+        for column in columns:
+            self._results_tree.heading(column, command=partial(self._sort_by_column, column))
         
         # Define columns
         self._results_tree.column("username", width=80)
@@ -110,9 +283,11 @@ class MainWindow(ttk.Frame):
         self._results_tree.column("verified", width=60, anchor=tk.CENTER)
         self._results_tree.column("full_name", width=120)
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self._results_tree.yview)
-        self._results_tree.configure(yscrollcommand=scrollbar.set)
+        # Add scrollbar; the view maps it onto the full result set
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL)
+        self._results_view: VirtualTreeView[Profile] = VirtualTreeView(
+            self._results_tree, scrollbar, profile_row_values
+        )
         
         # Pack treeview and scrollbar
         self._results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -126,8 +301,17 @@ class MainWindow(ttk.Frame):
         self._details_text.pack(fill=tk.X, padx=5, pady=5)
         self._details_text.config(state=tk.DISABLED)
         
-        # Bind selection event
-        self._results_tree.bind("<<TreeviewSelect>>", self._on_profile_selected)
+        # Bind selection event after the view's own selection tracking
+        self._results_tree.bind("<<TreeviewSelect>>", self._on_profile_selected, add="+")
+        
+        # API stats frame
+        if self._metrics is not None:
+            stats_frame = ttk.LabelFrame(self, text="API Stats")
+            stats_frame.pack(fill=tk.X, pady=5)
+            self._stats_var = tk.StringVar()
+            ttk.Label(stats_frame, textvariable=self._stats_var, justify=tk.LEFT).pack(
+                anchor=tk.W, padx=5, pady=5
+            )
         
         # Actions frame
         actions_frame = ttk.Frame(self)
@@ -135,128 +319,209 @@ class MainWindow(ttk.Frame):
         
         ttk.Button(
             actions_frame,
-            text="Export to CSV",
-            command=self._export_to_csv
+            text="Export...",
+            command=self._export_profiles
         ).pack(side=tk.RIGHT, padx=5)
     
     def _search_profile(self) -> None:
-        """Search for a profile by username."""
-        username = self._username_var.get().strip()
+        """Start looking up the entered usernames in the background."""
+        batch = parse_usernames(self._username_var.get())
+        usernames = batch.valid
         
-        if not username:
-            messagebox.showerror("Error", "Please enter a username")
+        if not usernames:
+            messagebox.showerror("Error", "\n".join(
+                f"{token}: {reason}" for token, reason in list(batch.rejected.items())[:10]
+            ) or "Please enter a username")
             return
         
+        self._cancel_search()
+        
         # Clear existing results
-        for item in self._results_tree.get_children():
-            self._results_tree.delete(item)
+        self._results_view.clear()
+        self._store.clear()
+        self._engagement.reset()
+        self._engagement_errors.clear()
         
-        self._profiles = []
+        self._failures = [f"{token}: {reason}" for token, reason in batch.rejected.items()]
         self._details_text.config(state=tk.NORMAL)
         self._details_text.delete(1.0, tk.END)
         self._details_text.config(state=tk.DISABLED)
         
-        # Show loading indicator
+        self._search = BackgroundSearch(self._profile_service, usernames, max_workers=self._max_workers)
+        self._progress.config(maximum=len(usernames), value=0)
+        self._search_button.config(state=tk.DISABLED)
+        self._cancel_button.config(state=tk.NORMAL)
         self.master.config(cursor="watch")
-        self.update()
+        self._update_status()
+        self.after(POLL_INTERVAL_MS, self._poll_search, self._search)
+    
+    def _poll_search(self, search: BackgroundSearch) -> None:
+        """Show the results that arrived since the last poll, then reschedule."""
+        if search is not self._search:
+            return
         
-        try:
-            # Try exact match first
-            profile, error = self._profile_service.get_profile(username)
-            
-            if profile:
-                self._profiles = [profile]
-                self._display_profiles([profile])
-            elif error:
-                # If exact match fails, try search
-                profiles, search_error = self._profile_service.search_profiles(username)
-                
-                if profiles:
-                    self._profiles = profiles
-                    self._display_profiles(profiles)
-                else:
-                    messagebox.showerror("Error", search_error or "No profiles found")
-            
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
-        finally:
-            # Reset cursor
-            self.master.config(cursor="")
+        profiles = []
+        for result in search.poll():
+            if result.profile is not None:
+                profiles.append(result.profile)
+            else:
+                self._failures.append(f"{result.username}: {result.error or 'Profile not found'}")
+        
+        if profiles:
+            self._display_profiles(profiles)
+        self._progress.config(value=search.received)
+        self._update_status()
+        
+        if search.finished:
+            self._finish_search()
+        else:
+            self.after(POLL_INTERVAL_MS, self._poll_search, search)
+    
+    def _cancel_search(self) -> None:
+        """Stop the pending lookups of the running search."""
+        if self._search is None:
+            return
+        self._search.cancel()
+        self._finish_search()
+    
+    def _finish_search(self) -> None:
+        """Reset the controls once a search completes or is cancelled."""
+        search = self._search
+        self._search = None
+        self._search_button.config(state=tk.NORMAL)
+        self._cancel_button.config(state=tk.DISABLED)
+        self.master.config(cursor="")
+        self._update_status(cancelled=search is not None and search.cancelled)
+        
+        if search is not None and not search.cancelled and not self._store:
+            messagebox.showerror("Error", "\n".join(self._failures[:10]) or "No profiles found")
+    
+    def _update_status(self, cancelled: bool = False) -> None:
+        """Show how many lookups have resolved."""
+        total = int(self._progress.cget("maximum"))
+        status = f"{len(self._store)}/{total} loaded"
+        if self._failures:
+            status += f", {len(self._failures)} failed"
+        if cancelled:
+            status += " (cancelled)"
+        self._status_var.set(status)
+    
+    def _refresh_stats(self) -> None:
+        """Show the current metrics and schedule the next refresh."""
+        if self._metrics is None:
+            return
+        self._stats_var.set(format_metrics(self._metrics.snapshot()))
+        self.after(STATS_INTERVAL_MS, self._refresh_stats)
     
     def _display_profiles(self, profiles: List[Profile]) -> None:
-        """Display profiles in the treeview."""
-        for profile in profiles:
-            stats = profile.statistics
-            eng_stats = profile.engagement_stats
-            
-            self._results_tree.insert(
-                "",
-                tk.END,
-                values=(
-                    profile.username,
-                    profile.full_name or "",
-                    f"{stats.followers_count:,}",
-                    f"{stats.following_count:,}",
-                    f"{eng_stats.recent_avg_post_likes:.1f}",
-                    f"{eng_stats.recent_avg_post_comments:.1f}",
-                    f"{eng_stats.recent_avg_post_reshares:.1f}",
-                    f"{eng_stats.recent_post_count}",
-                    "✓" if profile.is_verified else "✗"
-                )
-            )
+        """Add profiles to the results and queue loading their engagement; only rows in view are rendered."""
+        self._store.add(profiles)
+        self._refresh_results(keep_position=True)
+        self._request_engagement(profiles)
+    
+    def _request_engagement(self, profiles: List[Profile], urgent: bool = False) -> None:
+        """Queue engagement loads and make sure their results are polled."""
+        if self._engagement.request(profiles, urgent=urgent) and not self._polling_engagement:
+            self._polling_engagement = True
+            self.after(POLL_INTERVAL_MS, self._poll_engagement)
+    
+    def _poll_engagement(self) -> None:
+        """Show the engagement statistics loaded since the last poll, then reschedule while loads remain."""
+        updated = []
+        changed = set()
+        for result in self._engagement.poll():
+            changed.add(result.username.lower())
+            # A load may finish after a new search cleared the store
+            if result.profile is None:
+                self._engagement_errors[result.username.lower()] = result.error or "unknown error"
+            elif self._store.get_by_username(result.username) is not None:
+                updated.append(result.profile)
+        
+        if updated:
+            self._store.add(updated)
+            self._refresh_results(keep_position=True)
+        selected = self._selected_profile()
+        if selected is not None and selected.username.lower() in changed:
+            self._show_selected_details()
+        
+        if self._engagement.pending:
+            self.after(POLL_INTERVAL_MS, self._poll_engagement)
+        else:
+            self._polling_engagement = False
+    
+    def _refresh_results(self, keep_position: bool = False) -> None:
+        """Show the stored profiles matching the filter in the sort order."""
+        order = self._store.query(self._filter, self._sort_column, self._sort_reverse)
+        self._results_view.show(self._store.rows, order, keep_position=keep_position)
+        if not self._filter.empty:
+            self._filter_status_var.set(f"{len(order)} of {len(self._store)} shown")
+    
+    def _sort_by_column(self, column: str) -> None:
+        """Sort all results by a column, reversing on a repeated click."""
+        self._sort_reverse = column == self._sort_column and not self._sort_reverse
+        self._sort_column = column
+        self._refresh_results()
+    
+    def _apply_filter(self) -> None:
+        """Parse the filter box and show the matching results."""
+        try:
+            self._filter = parse_filter(self._filter_var.get())
+        except ValueError as e:
+            self._filter_status_var.set(str(e))
+            return
+        if self._filter.empty:
+            self._filter_status_var.set("")
+        self._refresh_results()
     
     def _on_profile_selected(self, event) -> None:
-        """Handle profile selection event."""
+        """Show the selected profile, loading its engagement statistics first if still missing."""
+        profile = self._selected_profile()
+        if profile is None:
+            return
+        if profile.engagement_pending:
+            self._engagement_errors.pop(profile.username.lower(), None)
+            self._request_engagement([profile], urgent=True)
+        self._show_selected_details()
+    
+    def _selected_profile(self) -> Optional[Profile]:
+        """Return the profile of the first selected row."""
         selection = self._results_tree.selection()
         if not selection:
+            return None
+        return self._store.get_by_iid(selection[0])
+    
+    def _show_selected_details(self) -> None:
+        """Show the details of the selected profile."""
+        profile = self._selected_profile()
+        if profile is None:
             return
-            
-        # Get the selected item
-        item = selection[0]
-        username = self._results_tree.item(item, "values")[0]
         
-        # Find the profile
-        profile = next((p for p in self._profiles if p.username == username), None)
-        if not profile:
-            return
-            
-        # Update details text
         self._details_text.config(state=tk.NORMAL)
         self._details_text.delete(1.0, tk.END)
-        
-        stats = profile.statistics
-        eng_stats = profile.engagement_stats
-        details = (
-            f"Username: @{profile.username}\n"
-            f"Name: {profile.full_name or 'N/A'}\n"
-            f"Bio: {profile.bio or 'N/A'}\n"
-            f"Account: {'Private' if profile.is_private else 'Public'}"
-            f"{', Verified' if profile.is_verified else ''}\n"
-            f"Stats: {stats.followers_count:,} followers, {stats.following_count:,} following, "
-            f"Engagements: {eng_stats.recent_avg_post_likes:.1f} avg likes, {eng_stats.recent_avg_post_comments:.1f} avg comments, "
-            f"{eng_stats.recent_post_count:,} posts recently\n"
-            f"Avg comments: {stats.avg_comments:.1f}"
+        self._details_text.insert(
+            tk.END, profile_details(profile, self._engagement_errors.get(profile.username.lower()))
         )
-        
-        self._details_text.insert(tk.END, details)
         self._details_text.config(state=tk.DISABLED)
     
-    def _export_to_csv(self) -> None:
-        """Export profiles to CSV file."""
-        if not self._profiles:
+    def _export_profiles(self) -> None:
+        """Export profiles to a file whose format follows the chosen extension."""
+        if not self._store:
             messagebox.showerror("Error", "No profiles to export")
             return
             
         filepath = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            defaultextension=getattr(self._exporter, "default_extension", ".csv"),
+            filetypes=getattr(
+                self._exporter, "filetypes", [("CSV files", "*.csv"), ("All files", "*.*")]
+            )
         )
         
         if not filepath:
             return
             
         try:
-            self._exporter.export_profiles(self._profiles, filepath)
-            messagebox.showinfo("Success", f"Exported {len(self._profiles)} profiles to {filepath}")
+            profiles = list(self._store.rows)
+            self._exporter.export_profiles(profiles, filepath)
+            messagebox.showinfo("Success", f"Exported {len(profiles)} profiles to {filepath}")
         except Exception as e:
             messagebox.showerror("Export Error", str(e))
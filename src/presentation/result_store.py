@@ -0,0 +1,366 @@
+"""Indexed store of the profiles shown in the results view."""
+import math
+import re
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from src.domain.models.profile import Profile
+
+
+def _engagement(attribute: str) -> Callable[[Profile], float]:
+    """Sort key of an engagement column; profiles not loaded yet sort as 0."""
+    def key(profile: Profile) -> float:
+        eng_stats = profile.engagement_stats
+        return getattr(eng_stats, attribute) if eng_stats is not None else 0
+    return key
+
+
+# Numeric columns kept presorted as profiles arrive
+NUMERIC_COLUMNS: Dict[str, Callable[[Profile], float]] = {
+    "followers": lambda p: p.statistics.followers_count,
+    "following": lambda p: p.statistics.following_count,
+    "avg_post_likes": _engagement("recent_avg_post_likes"),
+    "avg_post_comments": _engagement("recent_avg_post_comments"),
+    "avg_post_reshares": _engagement("recent_avg_post_reshares"),
+    "recent_posts": _engagement("recent_post_count"),
+    "engagement_rate": _engagement("engagement_rate"),
+}
+
+# Text and flag columns, sorted on demand and cached until the next change
+OTHER_COLUMNS: Dict[str, Callable[[Profile], Any]] = {
+    "username": lambda p: p.username.lower(),
+    "full_name": lambda p: (p.full_name or "").lower(),
+    "verified": lambda p: p.is_verified,
+}
+
+# Names accepted in filter expressions
+COLUMN_ALIASES = {
+    "likes": "avg_post_likes",
+    "comments": "avg_post_comments",
+    "reshares": "avg_post_reshares",
+    "posts": "recent_posts",
+    "engagement": "engagement_rate",
+}
+
+FLAGS: Dict[str, Callable[[Profile], bool]] = {
+    "verified": lambda p: p.is_verified,
+    "unverified": lambda p: not p.is_verified,
+    "private": lambda p: p.is_private,
+    "public": lambda p: not p.is_private,
+}
+
+
+def _mentions(word: str, profile: Profile) -> bool:
+    """Whether a lower-cased word occurs in a profile's username or full name."""
+    return word in profile.username.lower() or word in (profile.full_name or "").lower()
+
+
+_COMPARISON = re.compile(r"^([a-z_]+)\s*(>=|<=|==|=|>|<)\s*(\d+(?:\.\d+)?)\s*([km%]?)$")
+_SUFFIXES = {"": 1, "k": 1_000, "m": 1_000_000, "%": 0.01}
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """A numeric filter clause such as 'followers > 10k'."""
+    column: str
+    operator: str
+    value: float
+
+
+@dataclass(frozen=True)
+class ResultFilter:
+    """Parsed filter expression."""
+    comparisons: Tuple[Comparison, ...] = ()
+    flags: Tuple[str, ...] = ()
+    text: Tuple[str, ...] = ()
+
+    @property
+    def empty(self) -> bool:
+        """Whether the filter accepts every profile."""
+        return not (self.comparisons or self.flags or self.text)
+
+
+def parse_filter(expression: str) -> ResultFilter:
+    """
+    Parse a comma separated filter expression.
+
+    Clauses are numeric comparisons ('followers > 10k', 'likes >= 1.5k',
+    'engagement > 2%'), flags ('verified', 'private', 'public',
+    'unverified') or plain words matched against usernames and full names.
+
+    Args:
+        expression: The filter text entered by the user
+
+    Returns:
+        The parsed filter
+
+    Raises:
+        ValueError: If a comparison names an unknown column
+    """
+    comparisons, flags, text = [], [], []
+    for clause in expression.lower().split(","):
+        clause = clause.strip()
+        if not clause:
+            continue
+        match = _COMPARISON.match(clause)
+        if match:
+            name, operator, number, suffix = match.groups()
+            column = COLUMN_ALIASES.get(name, name)
+            if column not in NUMERIC_COLUMNS:
+                raise ValueError(f"Unknown filter column: {name}")
+            comparisons.append(Comparison(column, "==" if operator == "=" else operator, float(number) * _SUFFIXES[suffix]))
+        elif clause in FLAGS:
+            flags.append(clause)
+        elif any(op in clause for op in "<>="):
+            raise ValueError(f"Invalid filter: {clause}")
+        else:
+            text.append(clause)
+    return ResultFilter(tuple(comparisons), tuple(flags), tuple(text))
+
+
+class _SortedIndex:
+    """
+    Row ids ordered by (key, row_id), kept in buckets of bounded size.
+
+    Rows with equal keys stay in row id order, i.e. arrival order. A row is
+    found again with a bisect however many rows share its key, e.g. the
+    many rows whose engagement is still loading, and inserting or removing
+    one only shifts the entries of its bucket. The flat orders the queries
+    read are rebuilt on the first read after a change.
+    """
+
+    # Buckets are split when they grow past twice this size
+    LOAD = 512
+
+    def __init__(self) -> None:
+        self._buckets: List[List[Tuple[float, int]]] = []
+        self._maxes: List[Tuple[float, int]] = []
+        self._entries: Optional[List[Tuple[float, int]]] = []
+        self._row_ids: Optional[List[int]] = []
+
+    @property
+    def entries(self) -> List[Tuple[float, int]]:
+        """(key, row_id) pairs in order."""
+        if self._entries is None:
+            self._entries = [entry for bucket in self._buckets for entry in bucket]
+        return self._entries
+
+    @property
+    def row_ids(self) -> List[int]:
+        """Row ids in key order."""
+        if self._row_ids is None:
+            self._row_ids = [row_id for _, row_id in self.entries]
+        return self._row_ids
+
+    def add(self, key: float, row_id: int) -> None:
+        """Insert a row."""
+        entry = (key, row_id)
+        self._entries = self._row_ids = None
+        if not self._buckets:
+            self._buckets.append([entry])
+            self._maxes.append(entry)
+            return
+        index = min(bisect_left(self._maxes, entry), len(self._buckets) - 1)
+        bucket = self._buckets[index]
+        insort(bucket, entry)
+        self._maxes[index] = bucket[-1]
+        if len(bucket) > 2 * self.LOAD:
+            self._buckets[index:index + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self._maxes[index:index + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+
+    def remove(self, key: float, row_id: int) -> None:
+        """Remove a row inserted with key."""
+        entry = (key, row_id)
+        self._entries = self._row_ids = None
+        index = bisect_left(self._maxes, entry)
+        bucket = self._buckets[index]
+        del bucket[bisect_left(bucket, entry)]
+        if bucket:
+            self._maxes[index] = bucket[-1]
+        else:
+            del self._buckets[index]
+            del self._maxes[index]
+
+    def matching(self, operator: str, value: float) -> List[int]:
+        """Row ids whose key satisfies the comparison, in key order."""
+        entries, row_ids = self.entries, self.row_ids
+        # Row ids are non-negative, so these bracket every row with key == value
+        below = bisect_left(entries, (value, -1))
+        above = bisect_right(entries, (value, math.inf))
+        if operator == ">":
+            return row_ids[above:]
+        if operator == ">=":
+            return row_ids[below:]
+        if operator == "<":
+            return row_ids[:below]
+        if operator == "<=":
+            return row_ids[:above]
+        return row_ids[below:above]
+
+
+class ResultStore:
+    """
+    Profiles of the current search, indexed for the results view.
+
+    Rows get a stable row id in arrival order. Profiles can be looked up by
+    Treeview iid, username or userid in constant time, numeric columns are
+    kept presorted so sorting and range filters need no full scan, and
+    query results are cached until the store changes.
+    """
+
+    def __init__(self, iid_to_row_id: Callable[[str], Optional[int]]) -> None:
+        """
+        Initialize an empty store.
+
+        Args:
+            iid_to_row_id: Maps a Treeview item id back to its row id
+        """
+        self._iid_to_row_id = iid_to_row_id
+        self._rows: List[Profile] = []
+        self._by_username: Dict[str, int] = {}
+        self._by_userid: Dict[str, int] = {}
+        self._indexes = {column: _SortedIndex() for column in NUMERIC_COLUMNS}
+        self._version = 0
+        self._sorted_cache: Dict[str, Tuple[int, List[int]]] = {}
+        self._query_cache: Optional[Tuple[Any, List[int]]] = None
+
+    def __len__(self) -> int:
+        """Number of profiles in the store."""
+        return len(self._rows)
+
+    @property
+    def rows(self) -> Sequence[Profile]:
+        """Profiles indexed by row id."""
+        return self._rows
+
+    def clear(self) -> None:
+        """Remove every profile."""
+        self._rows = []
+        self._by_username.clear()
+        self._by_userid.clear()
+        self._indexes = {column: _SortedIndex() for column in NUMERIC_COLUMNS}
+        self._changed()
+
+    def add(self, profiles: Sequence[Profile]) -> None:
+        """
+        Add profiles, replacing rows that have the same username.
+
+        Args:
+            profiles: Profiles to add
+        """
+        for profile in profiles:
+            row_id = self._by_username.get(profile.username.lower())
+            if row_id is None:
+                row_id = len(self._rows)
+                self._rows.append(profile)
+            else:
+                self._unindex(row_id)
+                self._rows[row_id] = profile
+            self._index(row_id)
+        if profiles:
+            self._changed()
+
+    def get_by_iid(self, iid: str) -> Optional[Profile]:
+        """Return the profile shown in a Treeview row."""
+        row_id = self._iid_to_row_id(iid)
+        if row_id is None or row_id >= len(self._rows):
+            return None
+        return self._rows[row_id]
+
+    def get_by_username(self, username: str) -> Optional[Profile]:
+        """Return the profile with a username, ignoring case."""
+        row_id = self._by_username.get(username.lower())
+        return None if row_id is None else self._rows[row_id]
+
+    def get_by_userid(self, userid: str) -> Optional[Profile]:
+        """Return the profile with a user id."""
+        row_id = self._by_userid.get(userid)
+        return None if row_id is None else self._rows[row_id]
+
+    def query(
+        self,
+        result_filter: ResultFilter = ResultFilter(),
+        sort_column: Optional[str] = None,
+        reverse: bool = False
+    ) -> List[int]:
+        """
+        Row ids matching a filter in display order.
+
+        Args:
+            result_filter: Filter to apply
+            sort_column: Column to sort by, or None for arrival order
+            reverse: Whether to sort in descending order
+
+        Returns:
+            Matching row ids; the same list object is returned until the
+            store or the arguments change, so callers must not mutate it
+        """
+        cache_key = (self._version, result_filter, sort_column, reverse)
+        if self._query_cache is not None and self._query_cache[0] == cache_key:
+            return self._query_cache[1]
+
+        order = self._sorted(sort_column) if sort_column else range(len(self._rows))
+        if reverse:
+            order = order[::-1]
+        if not result_filter.empty:
+            matching = self._matching(result_filter)
+            order = [row_id for row_id in order if row_id in matching]
+        order = list(order)
+
+        self._query_cache = (cache_key, order)
+        return order
+
+    def _sorted(self, column: str) -> List[int]:
+        """Row ids sorted by a column."""
+        if column in self._indexes:
+            return self._indexes[column].row_ids
+        if column not in OTHER_COLUMNS:
+            raise ValueError(f"Unknown sort column: {column}")
+        cached = self._sorted_cache.get(column)
+        if cached is None or cached[0] != self._version:
+            key = OTHER_COLUMNS[column]
+            cached = (self._version, sorted(range(len(self._rows)), key=lambda row_id: key(self._rows[row_id])))
+            self._sorted_cache[column] = cached
+        return cached[1]
+
+    def _matching(self, result_filter: ResultFilter) -> Set[int]:
+        """Row ids accepted by a filter."""
+        candidates: Optional[Set[int]] = None
+        # Range lookups first, smallest first, so later checks scan few rows
+        ranges = sorted(
+            (self._indexes[c.column].matching(c.operator, c.value) for c in result_filter.comparisons),
+            key=len
+        )
+        for row_ids in ranges:
+            candidates = set(row_ids) if candidates is None else candidates.intersection(row_ids)
+        if candidates is None:
+            candidates = set(range(len(self._rows)))
+
+        checks = [FLAGS[flag] for flag in result_filter.flags]
+        for word in result_filter.text:
+            checks.append(partial(_mentions, word))
+        if checks:
+            candidates = {row_id for row_id in candidates if all(check(self._rows[row_id]) for check in checks)}
+        return candidates
+
+    def _index(self, row_id: int) -> None:
+        """Add a row to every index."""
+        profile = self._rows[row_id]
+        self._by_username[profile.username.lower()] = row_id
+        self._by_userid[profile.userid] = row_id
+        for column, key in NUMERIC_COLUMNS.items():
+            self._indexes[column].add(key(profile), row_id)
+
+    def _unindex(self, row_id: int) -> None:
+        """Remove a row from the indexes it is keyed in by value."""
+        profile = self._rows[row_id]
+        self._by_userid.pop(profile.userid, None)
+        for column, key in NUMERIC_COLUMNS.items():
+            self._indexes[column].remove(key(profile), row_id)
+
+    def _changed(self) -> None:
+        """Invalidate cached orders after a change."""
+        self._version += 1
+        self._query_cache = None
@@ -0,0 +1,234 @@
+"""Virtualized rendering of large result sets in a ttk.Treeview."""
+import time
+from typing import Any, Callable, Generic, List, Optional, Sequence, Set, Tuple, TypeVar
+
+
+T = TypeVar('T')
+
+
+class Viewport:
+    """Index arithmetic for the window of rows materialized in the tree."""
+
+    def __init__(self, buffer: int = 50) -> None:
+        """
+        Initialize the viewport.
+
+        Args:
+            buffer: Rows kept materialized above and below the visible ones
+        """
+        if buffer < 2:
+            raise ValueError("buffer must be at least 2")
+        self.buffer = buffer
+
+    def window(self, first: int, visible: int, total: int) -> Tuple[int, int]:
+        """Rows [start, end) to materialize when first is the top visible row."""
+        start = max(0, first - self.buffer)
+        end = min(total, first + visible + self.buffer)
+        return start, end
+
+    def needs_render(self, first: int, visible: int, start: int, end: int, total: int) -> bool:
+        """Whether the visible rows came too close to an edge of the window."""
+        margin = self.buffer // 2
+        near_top = start > 0 and first - start < margin
+        near_bottom = end < total and end - (first + visible) < margin
+        return near_top or near_bottom or first < start or first + visible > end
+
+    @staticmethod
+    def fractions(first: int, visible: int, total: int) -> Tuple[float, float]:
+        """Scrollbar position of the visible rows within the full dataset."""
+        if total <= 0:
+            return 0.0, 1.0
+        return first / total, min(1.0, (first + visible) / total)
+
+    @staticmethod
+    def clamp(first: int, visible: int, total: int) -> int:
+        """Keep the top visible row inside the dataset."""
+        return max(0, min(first, total - visible))
+
+
+class VirtualTreeView(Generic[T]):
+    """
+    Shows a backing list of items in a Treeview, materializing only the
+    visible rows plus a buffer.
+
+    The scrollbar is driven by the full dataset, so scrolling, sorting and
+    selection work over every item while the widget holds a few hundred
+    rows at most. Rows are inserted in time-sliced chunks scheduled with
+    after(), so large renders never block the event loop for long.
+    """
+
+    def __init__(
+        self,
+        tree: Any,
+        scrollbar: Any,
+        format_row: Callable[[T], Sequence[Any]],
+        buffer: int = 50,
+        slice_ms: float = 8.0
+    ) -> None:
+        """
+        Attach the view to a tree and its scrollbar.
+
+        Args:
+            tree: The ttk.Treeview showing the rows
+            scrollbar: The vertical ttk.Scrollbar next to the tree
+            format_row: Function turning an item into the tree's column values
+            buffer: Rows kept materialized above and below the visible ones
+            slice_ms: Longest time spent inserting rows per event loop turn
+        """
+        self._tree = tree
+        self._scrollbar = scrollbar
+        self._format_row = format_row
+        self._viewport = Viewport(buffer)
+        self._slice_seconds = slice_ms / 1000
+        self._items: Sequence[T] = []
+        self._order: List[int] = []
+        self._selected: Set[int] = set()
+        self._start = 0
+        self._end = 0
+        self._first = 0
+        self._visible = max(1, int(tree.cget('height')))
+        self._render_token = 0
+        self._render_pending = False
+        self._rendering = False
+
+        tree.configure(yscrollcommand=self._on_tree_scrolled)
+        scrollbar.configure(command=self._on_scrollbar)
+        tree.bind('<<TreeviewSelect>>', self._on_tree_select, add='+')
+
+    def __len__(self) -> int:
+        """Number of items in the backing dataset."""
+        return len(self._items)
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._items = []
+        self._order = []
+        self._selected = set()
+        self._first = 0
+        self._render()
+
+    def show(self, items: Sequence[T], order: List[int], keep_position: bool = False) -> None:
+        """
+        Display a subset of items in a given order.
+
+        Args:
+            items: Items indexed by row id; the view keeps a reference
+            order: Row ids to display, in display order
+            keep_position: Whether to stay at the current scroll position
+        """
+        self._items = items
+        self._order = list(order)
+        if not keep_position:
+            self._first = 0
+        self._schedule_render()
+
+    def scroll_to(self, first: int) -> None:
+        """Make the row at display position first the top visible row."""
+        self._first = self._viewport.clamp(first, self._visible, len(self._order))
+        if self._viewport.needs_render(self._first, self._visible, self._start, self._end, len(self._order)):
+            self._render()
+        else:
+            self._move_tree_view()
+
+    def _on_scrollbar(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        """Translate scrollbar actions into positions in the full dataset."""
+        total = len(self._order)
+        if action == 'moveto':
+            first = int(float(amount) * total)
+        elif unit == 'pages':
+            first = self._first + int(amount) * self._visible
+        else:
+            first = self._first + int(amount)
+        self.scroll_to(first)
+
+    def _on_tree_scrolled(self, low: str, high: str) -> None:
+        """Track the tree's own scrolling (mouse wheel, keyboard)."""
+        if self._rendering:
+            return
+        local_count = self._end - self._start
+        if local_count <= 0:
+            self._scrollbar.set(0.0, 1.0)
+            return
+        self._first = self._start + round(float(low) * local_count)
+        self._visible = max(1, round((float(high) - float(low)) * local_count))
+        self._update_scrollbar()
+        if self._viewport.needs_render(self._first, self._visible, self._start, self._end, len(self._order)):
+            self._schedule_render()
+
+    def _on_tree_select(self, event: Any = None) -> None:
+        """Mirror the selection of materialized rows into the full dataset."""
+        if self._rendering:
+            return
+        materialized = set(self._order[self._start:self._end])
+        selected = {row_id for row_id in map(self.row_id_for_iid, self._tree.selection()) if row_id is not None}
+        self._selected = (self._selected - materialized) | (selected & materialized)
+
+    def _schedule_render(self) -> None:
+        """Render once the event loop is idle, coalescing repeated requests."""
+        if not self._render_pending:
+            self._render_pending = True
+            self._tree.after_idle(self._render)
+
+    def _render(self) -> None:
+        """Replace the materialized rows with the window around the top row."""
+        self._render_pending = False
+        self._render_token += 1
+        total = len(self._order)
+        self._first = self._viewport.clamp(self._first, self._visible, total)
+        self._start, self._end = self._viewport.window(self._first, self._visible, total)
+
+        self._rendering = True
+        self._tree.delete(*self._tree.get_children())
+        self._rendering = False
+        self._insert_slice(self._render_token, self._start)
+
+    def _insert_slice(self, token: int, position: int) -> None:
+        """Insert rows until the time budget runs out, then yield to the event loop."""
+        if token != self._render_token:
+            return
+        deadline = time.perf_counter() + self._slice_seconds
+        self._rendering = True
+        try:
+            while position < self._end:
+                row_id = self._order[position]
+                self._tree.insert('', 'end', iid=self.iid_for_row(row_id), values=self._format_row(self._items[row_id]))
+                position += 1
+                if time.perf_counter() >= deadline:
+                    break
+        finally:
+            self._rendering = False
+
+        if position < self._end:
+            self._tree.after(1, self._insert_slice, token, position)
+            return
+
+        selection = [self.iid_for_row(row_id) for row_id in self._order[self._start:self._end] if row_id in self._selected]
+        self._rendering = True
+        try:
+            self._tree.selection_set(selection)
+        finally:
+            self._rendering = False
+        self._move_tree_view()
+
+    def _move_tree_view(self) -> None:
+        """Scroll the tree so that the top visible row is first."""
+        local_count = self._end - self._start
+        if local_count > 0:
+            self._tree.yview_moveto((self._first - self._start) / local_count)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self) -> None:
+        """Show the visible rows' position within the full dataset."""
+        self._scrollbar.set(*self._viewport.fractions(self._first, self._visible, len(self._order)))
+
+    @staticmethod
+    def iid_for_row(row_id: int) -> str:
+        """Tree item id of a row."""
+        return f"r{row_id}"
+
+    @staticmethod
+    def row_id_for_iid(iid: str) -> Optional[int]:
+        """Row id of a tree item id."""
+        if not iid.startswith('r') or not iid[1:].isdigit():
+            return None
+        return int(iid[1:])
@@ -0,0 +1,144 @@
+"""Tests for the asyncio HikerAPI client."""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.application.profile_service import AsyncProfileService
+from src.domain.models.profile import Profile
+from src.infrastructure.api.async_hiker_api_client import AsyncHikerApiClient
+from src.infrastructure.api.errors import NotFoundError, RateLimitError, TransientApiError
+from src.infrastructure.api.request_scheduler import AsyncRequestScheduler
+
+
+class TestAsyncHikerApiClient:
+    """Test suite for AsyncHikerApiClient."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_hikerapi = MagicMock()
+        self.mock_hikerapi.user_by_username_v1 = AsyncMock(
+            side_effect=lambda username: {'pk': f'{username}_pk', 'username': username, 'follower_count': 10}
+        )
+        self.mock_hikerapi.user_medias_v2 = AsyncMock(
+            return_value={'response': {'items': [{'like_count': 4, 'comment_count': 2}]}}
+        )
+
+        with patch('hikerapi.AsyncClient', return_value=self.mock_hikerapi):
+            self.api_client = AsyncHikerApiClient(api_key="test_key", max_concurrency=2)
+
+    def test_get_profile(self):
+        """Test fetching a profile by username."""
+        profile = asyncio.run(self.api_client.get_profile('testuser'))
+
+        self.mock_hikerapi.user_by_username_v1.assert_awaited_once_with('testuser')
+        self.mock_hikerapi.user_medias_v2.assert_awaited_once_with('testuser_pk')
+        assert isinstance(profile, Profile)
+        assert profile.username == 'testuser'
+        assert profile.statistics.followers_count == 10
+        assert profile.engagement_stats.recent_avg_post_likes == 4
+        assert profile.engagement_stats.recent_avg_post_comments == 2
+
+    def test_search_profiles_caps_in_flight_requests(self):
+        """Test that the semaphore limits concurrent requests and order is kept."""
+        in_flight = 0
+        peak = 0
+
+        async def lookup(username):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'pk': username, 'username': username}
+
+        self.mock_hikerapi.user_by_username_v1.side_effect = lookup
+
+        result = asyncio.run(self.api_client.search_profiles('a,b,c,d,e'))
+
+        assert [p.username for p in result.profiles] == ['a', 'b', 'c', 'd', 'e']
+        assert result.total_count == 5
+        assert peak == 2
+
+    def test_search_profiles_rejects_empty_usernames(self):
+        """Test that an empty entry fails before any API call."""
+        with pytest.raises(ValueError):
+            asyncio.run(self.api_client.search_profiles('a,,b'))
+
+        self.mock_hikerapi.user_by_username_v1.assert_not_awaited()
+
+    def test_async_profile_service(self):
+        """Test the asyncio service on top of the client."""
+        service = AsyncProfileService(api_client=self.api_client)
+
+        profile, error = asyncio.run(service.get_profile('testuser'))
+        assert error is None
+        assert profile.username == 'testuser'
+
+        profile, error = asyncio.run(service.get_profile('bad name'))
+        assert profile is None
+        assert error == "Invalid username format"
+
+        profiles, error = asyncio.run(service.search_profiles('a,b'))
+        assert error is None
+        assert [p.username for p in profiles] == ['a', 'b']
+
+
+class TestAsyncHikerApiClientErrors:
+    """Test suite for the error handling of AsyncHikerApiClient against HTTP responses."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.attempts = {}
+
+        def handler(request):
+            username = request.url.params.get('username')
+            self.attempts[username] = self.attempts.get(username, 0) + 1
+            if username == 'gone':
+                return httpx.Response(404, json={'detail': 'Target user not found'})
+            if username == 'busy':
+                return httpx.Response(429, json={'detail': 'Too many requests'})
+            if username == 'flaky' and self.attempts[username] == 1:
+                return httpx.Response(502, json={})
+            return httpx.Response(200, json={'pk': '1', 'username': username, 'is_private': True})
+
+        async def no_sleep(seconds):
+            pass
+
+        scheduler = AsyncRequestScheduler(max_retries=2, base_delay=0, sleep=no_sleep)
+        self.api_client = AsyncHikerApiClient(api_key='test_key', scheduler=scheduler)
+        self.api_client._client._client._transport = httpx.MockTransport(handler)
+
+    def get_profile(self, username):
+        """Fetch one profile and close the client."""
+        async def run():
+            try:
+                return await self.api_client.get_profile(username)
+            finally:
+                await self.api_client.aclose()
+
+        return asyncio.run(run())
+
+    def test_not_found_is_not_retried(self):
+        """Test that a 404 raises NotFoundError after one attempt."""
+        with pytest.raises(NotFoundError):
+            self.get_profile('gone')
+        assert self.attempts == {'gone': 1}
+
+    def test_rate_limit_retried_then_raised(self):
+        """Test that a 429 is retried and raised once retries run out."""
+        with pytest.raises(RateLimitError):
+            self.get_profile('busy')
+        assert self.attempts == {'busy': 3}
+        assert self.api_client.metrics.counter('api_retries_total', endpoint='user_by_username_v1') == 2
+
+    def test_server_error_retried(self):
+        """Test that a 5xx is retried as a TransientApiError."""
+        profile = self.get_profile('flaky')
+
+        assert profile.username == 'flaky'
+        assert self.attempts == {'flaky': 2}
+        assert self.api_client.metrics.counter(
+            'api_errors_total', endpoint='user_by_username_v1', error=TransientApiError.__name__
+        ) == 1
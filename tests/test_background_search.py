@@ -0,0 +1,84 @@
+"""Tests for background profile searches."""
+import threading
+import time
+from unittest.mock import MagicMock
+
+from src.presentation.background_search import BackgroundSearch
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+def collect(search, results, count):
+    """Poll a search into results until it holds at least count items."""
+    def enough():
+        results.extend(search.poll())
+        return len(results) >= count
+    wait_until(enough)
+
+
+class TestBackgroundSearch:
+    """Test suite for BackgroundSearch."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = MagicMock()
+
+    def test_results_arrive_progressively(self):
+        """Test that each result can be polled as soon as it resolves."""
+        release = threading.Event()
+
+        def get_profile(username):
+            if username == 'slow':
+                release.wait(timeout=5)
+            return (None, "not found") if username == 'missing' else (f'profile:{username}', None)
+
+        self.service.get_profile.side_effect = get_profile
+        search = BackgroundSearch(self.service, ['fast', 'slow', 'missing'], max_workers=3)
+
+        results = []
+        collect(search, results, 2)
+        assert {r.username for r in results} == {'fast', 'missing'}
+        assert not search.finished
+
+        release.set()
+        collect(search, results, 3)
+        assert search.finished
+        assert search.received == 3
+        assert [r.error for r in results if r.username == 'missing'] == ["not found"]
+
+    def test_cancel_drops_pending_lookups(self):
+        """Test that cancelling stops lookups that have not started."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def get_profile(username):
+            started.set()
+            release.wait(timeout=5)
+            return f'profile:{username}', None
+
+        self.service.get_profile.side_effect = get_profile
+        search = BackgroundSearch(self.service, [f'user{i}' for i in range(20)], max_workers=1)
+        started.wait(timeout=5)
+
+        search.cancel()
+        release.set()
+
+        wait_until(lambda: search.finished)
+        assert search.poll() == []
+        assert self.service.get_profile.call_count == 1
+
+    def test_service_exception_reported_as_error(self):
+        """Test that an exception in a worker becomes an error result."""
+        self.service.get_profile.side_effect = RuntimeError("boom")
+        search = BackgroundSearch(self.service, ['a'])
+
+        results = []
+        collect(search, results, 1)
+        assert results[0].profile is None
+        assert results[0].error == "boom"
@@ -0,0 +1,173 @@
+"""Tests for resumable batch jobs and the checkpoint journal."""
+import os
+import threading
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock
+
+from src.application.batch_job import BatchJob
+from src.domain.models.lookup import LOOKUP_NOT_FOUND, LOOKUP_OK, LOOKUP_RATE_LIMITED, LookupOutcome
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.storage.checkpoint_journal import CheckpointJournal
+
+
+def make_profile(username):
+    """Create a minimal profile for a username."""
+    return Profile(
+        userid=f'{username}_pk',
+        username=username,
+        full_name=None,
+        bio=None,
+        is_verified=False,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=1,
+            following_count=2,
+            posts_count=3,
+            last_updated=datetime(2023, 1, 1)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=4,
+            recent_avg_post_comments=5,
+            recent_avg_post_reshares=6,
+            recent_post_count=7
+        )
+    )
+
+
+def outcome(name):
+    """Outcome of a fake lookup: 'bad' names are rate limited, 'gone' ones not found."""
+    if name.startswith('bad'):
+        return LookupOutcome(name, LOOKUP_RATE_LIMITED, error="quota exhausted")
+    if name.startswith('gone'):
+        return LookupOutcome(name, LOOKUP_NOT_FOUND, error="User not found")
+    return LookupOutcome(name, LOOKUP_OK, profile=make_profile(name))
+
+
+class TestBatchJob:
+    """Test suite for BatchJob and CheckpointJournal."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmpdir.name, 'jobs', 'nightly.jsonl')
+        self.service = MagicMock()
+        self.service.lookup_profile.side_effect = outcome
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.tmpdir.cleanup()
+
+    def make_job(self, retry_rounds=0):
+        """Create a job on a freshly opened journal."""
+        return BatchJob(self.service, CheckpointJournal(self.journal_path), max_workers=2, retry_rounds=retry_rounds)
+
+    def test_journal_round_trip(self):
+        """Test that journaled profiles are restored intact."""
+        journal = CheckpointJournal(self.journal_path)
+        journal.record_failed('alice', 'timeout')
+        journal.record_done('alice', make_profile('alice'))
+
+        entries = CheckpointJournal(self.journal_path).load()
+
+        assert entries['alice'].status == 'done'
+        assert entries['alice'].profile == make_profile('alice')
+
+    def test_truncated_line_ignored(self):
+        """Test that a partial record from a crash does not corrupt the journal."""
+        journal = CheckpointJournal(self.journal_path)
+        journal.record_done('alice', make_profile('alice'))
+        with open(self.journal_path, 'a', encoding='utf-8') as journal_file:
+            journal_file.write('{"username": "bob", "sta')
+
+        reopened = CheckpointJournal(self.journal_path)
+        reopened.record_done('carol', make_profile('carol'))
+
+        assert sorted(reopened.load()) == ['alice', 'carol']
+
+    def test_failures_do_not_affect_the_others(self):
+        """Test that the other usernames of a job with a failure are still done."""
+        summary = self.make_job().run(['a', 'bad1', 'c'])
+
+        assert (summary.done, summary.failed) == (2, 1)
+
+    def test_resume_skips_finished_work(self):
+        """Test that a rerun only retries temporary failures or pending usernames."""
+        usernames = ['a', 'b', 'bad1', 'gone1']
+        summary = self.make_job().run(usernames)
+        assert (summary.done, summary.failed) == (2, 2)
+
+        self.service.lookup_profile.reset_mock()
+        self.service.lookup_profile.side_effect = lambda name: LookupOutcome(name, LOOKUP_OK, profile=make_profile(name))
+        job = self.make_job()
+        summary = job.run(usernames + ['c'])
+
+        assert sorted(call.args[0] for call in self.service.lookup_profile.call_args_list) == ['bad1', 'c']
+        assert (summary.total, summary.skipped, summary.done, summary.failed) == (5, 3, 2, 0)
+        assert [p.username for p in job.results(usernames)] == ['a', 'b', 'bad1']
+        assert [f.status for f in job.failures(usernames)] == [LOOKUP_NOT_FOUND]
+
+    def test_failures_reported(self):
+        """Test that failed usernames are listed with their classification and error."""
+        job = self.make_job()
+        usernames = ['a', 'b', 'A', 'bad1']
+        job.run(usernames)
+
+        assert [p.username for p in job.results(usernames)] == ['a', 'b']
+        assert job.failures(usernames) == [LookupOutcome('bad1', LOOKUP_RATE_LIMITED, error='quota exhausted')]
+
+    def test_temporary_failures_retried(self):
+        """Test that only rate limited or transient failures are looked up again."""
+        attempts = []
+
+        def flaky(name):
+            attempts.append(name)
+            if attempts.count(name) == 1 or name.startswith('gone'):
+                return outcome(name)
+            return LookupOutcome(name, LOOKUP_OK, profile=make_profile(name))
+
+        self.service.lookup_profile.side_effect = flaky
+        summary = self.make_job(retry_rounds=2).run(['a', 'bad1', 'gone1'])
+
+        assert sorted(attempts[:3]) == ['a', 'bad1', 'gone1']
+        assert attempts[3:] == ['bad1']
+        assert (summary.done, summary.failed, summary.retried) == (2, 1, 1)
+
+    def test_outcomes_journaled_as_they_complete(self):
+        """Test that a finished lookup is journaled while another is still running."""
+        release = threading.Event()
+        journaled_before_release = []
+
+        def slow_a(name):
+            if name == 'a':
+                release.wait(5)
+            return outcome(name)
+
+        def on_progress(processed, pending):
+            if processed == 2:
+                journaled_before_release.extend(sorted(CheckpointJournal(self.journal_path).load()))
+                release.set()
+
+        self.service.lookup_profile.side_effect = slow_a
+        summary = self.make_job().run(['a', 'b', 'c'], on_progress=on_progress)
+
+        assert journaled_before_release == ['b', 'c']
+        assert summary.done == 3
+
+    def test_journal_read_once_per_job(self):
+        """Test that results and failures use the entries run already holds."""
+        self.make_job().run(['a', 'gone1'])
+        journal = CheckpointJournal(self.journal_path)
+        journal.load = MagicMock(wraps=journal.load)
+        job = BatchJob(self.service, journal, max_workers=2)
+        usernames = ['a', 'b', 'gone1', 'bad1']
+
+        job.run(usernames)
+
+        assert [p.username for p in job.results(usernames)] == ['a', 'b']
+        assert [(f.username, f.status) for f in job.failures(usernames)] == [
+            ('gone1', LOOKUP_NOT_FOUND), ('bad1', LOOKUP_RATE_LIMITED)
+        ]
+        assert journal.load.call_count == 1
+        assert sorted(CheckpointJournal(self.journal_path).load()) == ['a', 'b', 'bad1', 'gone1']
@@ -0,0 +1,154 @@
+"""Tests for the headless batch mode."""
+import csv
+import io
+import os
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock
+
+from src.domain.models.lookup import LOOKUP_NOT_FOUND, LOOKUP_OK, LOOKUP_TRANSIENT, LookupOutcome
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.export.csv_exporter import CsvExporter
+from src.presentation import cli
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def make_profile(username):
+    """Create a minimal profile for a username."""
+    return Profile(
+        userid=f'{username}_pk',
+        username=username,
+        full_name=None,
+        bio=None,
+        is_verified=False,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=1,
+            following_count=2,
+            posts_count=3,
+            last_updated=datetime(2023, 1, 1)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=0,
+            recent_avg_post_comments=0,
+            recent_avg_post_reshares=0,
+            recent_post_count=0
+        )
+    )
+
+
+class TestCli:
+    """Test suite for the batch command line mode."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = MagicMock()
+        self.service.lookup_profile.side_effect = lambda username: (
+            LookupOutcome(username, LOOKUP_NOT_FOUND, error="User not found") if username.startswith('missing')
+            else LookupOutcome(username, LOOKUP_OK, profile=make_profile(username))
+        )
+
+    def run(self, usernames):
+        """Run a batch into a temporary CSV and return (exit_code, usernames_written)."""
+        with TemporaryDirectory() as tmpdir:
+            output = os.path.join(tmpdir, 'out.csv')
+            progress = io.StringIO()
+            exit_code = cli.run_batch(
+                self.service, CsvExporter(), usernames, output, concurrency=4, progress=progress
+            )
+            with open(output, newline='', encoding='utf-8') as csvfile:
+                written = [row['username'] for row in csv.DictReader(csvfile)]
+        return exit_code, written, progress.getvalue()
+
+    def test_read_usernames(self):
+        """Test splitting on commas and whitespace with duplicates removed."""
+        stream = io.StringIO("alice, bob\ncarol\n\n  alice,dave  ")
+
+        assert cli.read_usernames(stream) == ['alice', 'bob', 'carol', 'dave']
+
+    def test_all_succeed(self):
+        """Test a batch where every lookup succeeds."""
+        exit_code, written, progress = self.run(['a', 'b', 'c'])
+
+        assert exit_code == cli.EXIT_OK
+        assert written == ['a', 'b', 'c']
+        assert '[3/3] c: ok' in progress
+
+    def test_partial_failure(self):
+        """Test that failed lookups are reported and reflected in the exit code."""
+        exit_code, written, progress = self.run(['a', 'missing1', 'b'])
+
+        assert exit_code == cli.EXIT_PARTIAL
+        assert written == ['a', 'b']
+        assert 'missing1: FAILED [not_found] (User not found)' in progress
+
+    def test_total_failure(self):
+        """Test that a batch without any result exits with failure."""
+        exit_code, written, _ = self.run(['missing1', 'missing2'])
+
+        assert exit_code == cli.EXIT_FAILED
+        assert written == []
+
+    def test_transient_failures_retried_at_the_end(self):
+        """Test that a temporary failure is looked up again after the others."""
+        attempts = []
+
+        def flaky(username):
+            attempts.append(username)
+            if username == 'flaky' and attempts.count('flaky') == 1:
+                return LookupOutcome(username, LOOKUP_TRANSIENT, error="HikerAPI server error 502")
+            return LookupOutcome(username, LOOKUP_OK, profile=make_profile(username))
+
+        self.service.lookup_profile.side_effect = flaky
+        exit_code, written, progress = self.run(['a', 'flaky', 'b'])
+
+        assert exit_code == cli.EXIT_OK
+        assert written == ['a', 'b', 'flaky']
+        assert attempts[-1] == 'flaky'
+        assert 'Retrying 1 temporary failures (round 1)' in progress
+
+    def test_submissions_bounded_while_first_lookup_blocks(self):
+        """Test that a slow lookup does not let the whole input be submitted."""
+        release = threading.Event()
+        started = []
+        started_before_release = []
+
+        def slow_first(username):
+            started.append(username)
+            if username == 'user0':
+                release.wait(5)
+            return LookupOutcome(username, LOOKUP_OK, profile=make_profile(username))
+
+        def unblock():
+            started_before_release.append(len(started))
+            release.set()
+
+        self.service.lookup_profile.side_effect = slow_first
+        timer = threading.Timer(0.2, unblock)
+        timer.start()
+        exit_code, written, _ = self.run([f'user{ix}' for ix in range(50)])
+        timer.join()
+
+        assert exit_code == cli.EXIT_OK
+        assert written == [f'user{ix}' for ix in range(50)]
+        assert started_before_release == [8]
+
+    def test_batch_path_does_not_import_tkinter(self):
+        """Test that the headless entry point never loads Tkinter."""
+        code = (
+            "import sys, main\n"
+            "args = main.parse_arguments(['--api-key', 'k', 'batch', '-o', 'out.csv'])\n"
+            "main.build_profile_service(args)\n"
+            "assert 'tkinter' not in sys.modules, 'tkinter imported'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -1,4 +1,5 @@
 """Tests for CSV exporter."""
+import asyncio
 import csv
 import os
 from datetime import datetime
@@ -6,7 +7,7 @@ from tempfile import NamedTemporaryFile
 
 import pytest
 
-from src.domain.models.profile import Profile, ProfileStatistics
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
 from src.infrastructure.export.csv_exporter import CsvExporter
 
 
@@ -32,24 +33,35 @@ class TestCsvExporter:
             last_updated=datetime(2023, 1, 2, 12, 0, 0)
         )
         
+        engagement = EngagementStatistics(
+            recent_avg_post_likes=40,
+            recent_avg_post_comments=4,
+            recent_avg_post_reshares=1,
+            recent_post_count=5
+        )
+        
         self.profile1 = Profile(
+            userid="1",
             username="user1",
             full_name="User One",
             bio="Bio for user 1",
             is_verified=False,
             is_private=False,
             profile_pic_url="https://example.com/pic1.jpg",
-            statistics=stats1
+            statistics=stats1,
+            engagement_stats=engagement
         )
         
         self.profile2 = Profile(
+            userid="2",
             username="user2",
             full_name="User Two",
             bio="Bio for user 2",
             is_verified=True,
             is_private=True,
             profile_pic_url="https://example.com/pic2.jpg",
-            statistics=stats2
+            statistics=stats2,
+            engagement_stats=engagement
         )
         
         self.profiles = [self.profile1, self.profile2]
@@ -81,6 +93,8 @@ class TestCsvExporter:
                 assert rows[0]['followers_count'] == '1000'
                 assert rows[0]['following_count'] == '500'
                 assert rows[0]['posts_count'] == '100'
+                assert rows[0]['avg_post_likes'] == '40'
+                assert rows[0]['recent_posts_count'] == '5'
                 assert rows[0]['last_updated'] == '2023-01-01 12:00:00'
                 
                 # Check second profile
@@ -112,3 +126,48 @@ class TestCsvExporter:
             # Clean up
             if os.path.exists(filepath):
                 os.unlink(filepath)
+    
+    def test_export_stream_flushes_each_row(self):
+        """Test that streamed rows reach disk before the producer finishes."""
+        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
+            filepath = temp_file.name
+        
+        def read_rows():
+            with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
+                return list(csv.DictReader(csvfile))
+        
+        def produce():
+            yield self.profile1
+            # The first row is already on disk while the second is pending
+            assert [row['username'] for row in read_rows()] == ['user1']
+            raise RuntimeError("lookup failed")
+        
+        try:
+            with pytest.raises(RuntimeError):
+                self.exporter.export_stream(produce(), filepath)
+            
+            assert [row['username'] for row in read_rows()] == ['user1']
+        finally:
+            if os.path.exists(filepath):
+                os.unlink(filepath)
+    
+    def test_export_stream_async(self):
+        """Test exporting profiles from an async iterable."""
+        with NamedTemporaryFile(delete=False, suffix='.csv') as temp_file:
+            filepath = temp_file.name
+        
+        async def produce():
+            for profile in self.profiles:
+                await asyncio.sleep(0)
+                yield profile
+        
+        try:
+            count = asyncio.run(self.exporter.export_stream_async(produce(), filepath))
+            
+            assert count == 2
+            with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
+                rows = list(csv.DictReader(csvfile))
+            assert [row['username'] for row in rows] == ['user1', 'user2']
+        finally:
+            if os.path.exists(filepath):
+                os.unlink(filepath)
@@ -0,0 +1,117 @@
+"""Tests for the delta exporter."""
+import csv
+import gzip
+import json
+import os
+from dataclasses import replace
+from datetime import datetime
+from tempfile import TemporaryDirectory
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.export.delta_exporter import DeltaExporter
+
+
+def make_profile(ix):
+    """Create a profile with values derived from an index."""
+    return Profile(
+        userid=str(ix),
+        username=f'user{ix}',
+        full_name=f'User {ix}',
+        bio=None,
+        is_verified=False,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=ix * 100,
+            following_count=ix,
+            posts_count=ix * 2,
+            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=ix * 10,
+            recent_avg_post_comments=ix,
+            recent_avg_post_reshares=0,
+            recent_post_count=5
+        )
+    )
+
+
+class TestDeltaExporter:
+    """Test suite for DeltaExporter."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = TemporaryDirectory()
+        self.manifest = self.path('manifest.jsonl')
+        self.profiles = [make_profile(ix) for ix in range(1, 5)]
+        DeltaExporter(self.manifest).export_profiles(self.profiles, self.path('first.csv'))
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Path of a file in the temporary directory."""
+        return os.path.join(self.tmpdir.name, name)
+
+    def read_csv(self, name):
+        """Read the rows of a delta CSV file."""
+        with open(self.path(name), newline='', encoding='utf-8') as csv_file:
+            return list(csv.DictReader(csv_file))
+
+    def test_first_run_is_all_new(self):
+        """Test that every account is new without a previous manifest."""
+        rows = self.read_csv('first.csv')
+
+        assert [(r['change'], r['userid']) for r in rows] == [('new', '1'), ('new', '2'), ('new', '3'), ('new', '4')]
+        with open(self.manifest, encoding='utf-8') as manifest:
+            assert len(manifest.readlines()) == 4
+
+    def test_only_differences_are_written(self):
+        """Test new, changed and removed accounts against the previous run."""
+        changed = replace(self.profiles[1], full_name='Renamed')
+        refetched = replace(self.profiles[0], statistics=replace(
+            self.profiles[0].statistics, last_updated=self.profiles[0].statistics.last_updated.replace(year=2024)
+        ))
+        exporter = DeltaExporter(self.manifest)
+
+        count = exporter.export_stream([refetched, changed, self.profiles[2], make_profile(9)], self.path('delta.csv'))
+
+        rows = self.read_csv('delta.csv')
+        assert [(r['change'], r['userid']) for r in rows] == [('changed', '2'), ('new', '9'), ('removed', '4')]
+        assert rows[0]['full_name'] == 'Renamed'
+        assert count == 4
+        assert (exporter.summary.new, exporter.summary.changed, exporter.summary.removed) == (1, 1, 1)
+        assert exporter.summary.unchanged == 2
+
+    def test_failed_lookups_are_not_removed(self):
+        """Test that accounts whose lookup failed are carried over."""
+        exporter = DeltaExporter(self.manifest)
+        exporter.mark_failed('USER4')
+
+        exporter.export_stream(self.profiles[:3], self.path('delta.jsonl.gz'))
+
+        with gzip.open(self.path('delta.jsonl.gz'), 'rt', encoding='utf-8') as delta:
+            assert delta.read() == ''
+        assert exporter.summary.removed == 0
+        with open(self.manifest, encoding='utf-8') as manifest:
+            assert [json.loads(line)['userid'] for line in manifest] == ['1', '2', '3', '4']
+
+    def test_runs_without_engagement_keep_previous_engagement(self):
+        """Test that skipping engagement neither reports changes nor forgets the previous statistics."""
+        skipped = [replace(profile, engagement_stats=None) for profile in self.profiles]
+        skipped[0] = replace(skipped[0], full_name='Renamed')
+
+        exporter = DeltaExporter(self.manifest)
+        exporter.export_stream(skipped, self.path('skipped.csv'))
+
+        assert [(r['change'], r['userid']) for r in self.read_csv('skipped.csv')] == [('changed', '1')]
+        assert exporter.summary.unchanged == 3
+
+        reloaded = [replace(self.profiles[0], full_name='Renamed'), *self.profiles[1:3]]
+        reloaded.append(replace(self.profiles[3], engagement_stats=replace(
+            self.profiles[3].engagement_stats, recent_avg_post_likes=1
+        )))
+        exporter.export_stream(reloaded, self.path('reloaded.csv'))
+
+        assert [(r['change'], r['userid']) for r in self.read_csv('reloaded.csv')] == [('changed', '4')]
@@ -0,0 +1,65 @@
+"""Tests for engagement analytics."""
+import pytest
+
+from src.domain.analytics.engagement import EngagementCalculator, MediaColumns
+
+
+class TestEngagementCalculator:
+    """Test suite for EngagementCalculator."""
+
+    def test_window_limits_posts(self):
+        """Test that only the configured number of recent posts is used."""
+        items = [{'like_count': n} for n in (10, 20, 30, 1000)]
+
+        stats = EngagementCalculator(window=3).compute(items)
+
+        assert stats.recent_post_count == 3
+        assert stats.recent_avg_post_likes == 20
+        assert stats.median_post_likes == 20
+        assert stats.stdev_post_likes == pytest.approx(8.16496, rel=1e-4)
+
+    def test_metrics_averaged_over_their_own_posts(self):
+        """Test that comments and reshares are not divided by the like count."""
+        items = [
+            {'comment_count': 9, 'reshare_count': 4},
+            {'like_count': 10, 'comment_count': 3},
+            {'like_count': 30},
+        ]
+
+        stats = EngagementCalculator(window=5).compute(items)
+
+        assert stats.recent_avg_post_likes == 20
+        assert stats.recent_avg_post_comments == 6
+        assert stats.recent_avg_post_reshares == 4
+        assert stats.median_post_comments == 6
+
+    def test_engagement_rate(self):
+        """Test engagement rate relative to the follower count."""
+        items = [{'like_count': 90, 'comment_count': 10}] * 2
+
+        assert EngagementCalculator().compute(items, followers_count=1000).engagement_rate == pytest.approx(0.1)
+        assert EngagementCalculator().compute(items, followers_count=0).engagement_rate == 0
+
+    def test_no_posts(self):
+        """Test that an account without media yields zeros."""
+        stats = EngagementCalculator().compute([], followers_count=100)
+
+        assert stats.recent_post_count == 0
+        assert stats.recent_avg_post_likes == 0
+        assert stats.median_post_likes == 0
+        assert stats.stdev_post_likes == 0
+
+    def test_columns_built_in_one_pass(self):
+        """Test that a one-shot iterator is consumed only up to the window."""
+        items = iter([{'like_count': n, 'reshare_count': 1} for n in range(10)])
+
+        columns = MediaColumns.from_items(items, window=4)
+
+        assert list(columns.likes) == [0, 1, 2, 3]
+        assert list(columns.reshares) == [1, 1, 1, 1]
+        assert next(items)['like_count'] == 4
+
+    def test_invalid_window(self):
+        """Test that a non-positive window is rejected."""
+        with pytest.raises(ValueError):
+            EngagementCalculator(window=0)
@@ -0,0 +1,151 @@
+"""Tests for background engagement loading."""
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.presentation.engagement_loader import EngagementLoader
+from src.presentation.main_window import ENGAGEMENT_PENDING, ENGAGEMENT_UNAVAILABLE, profile_details, profile_row_values
+
+
+ENGAGEMENT = EngagementStatistics(
+    recent_avg_post_likes=10,
+    recent_avg_post_comments=2,
+    recent_avg_post_reshares=0,
+    recent_post_count=3
+)
+
+
+def make_profile(username, is_private=False):
+    """Create a profile fetched without engagement statistics."""
+    return Profile(
+        userid=f'{username}_pk',
+        username=username,
+        full_name=None,
+        bio=None,
+        is_verified=False,
+        is_private=is_private,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=100,
+            following_count=10,
+            posts_count=3,
+            last_updated=datetime(2023, 1, 1)
+        ),
+        engagement_stats=None
+    )
+
+
+def wait_until(condition, timeout=5.0):
+    """Poll a condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.001)
+
+
+class FakeService:
+    """Profile service whose loads block until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.failing = set()
+
+    def load_engagement(self, profile):
+        self.calls.append(profile.username)
+        self.release.wait(timeout=5)
+        if profile.username in self.failing:
+            return None, "rate limited"
+        return replace(profile, engagement_stats=ENGAGEMENT), None
+
+
+class TestEngagementLoader:
+    """Test suite for EngagementLoader."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.service = FakeService()
+        self.loader = EngagementLoader(self.service, max_workers=1)
+
+    def teardown_method(self):
+        """Stop the workers."""
+        self.service.release.set()
+        self.loader.close()
+
+    def collect(self, count):
+        """Poll the loader until it returned count results."""
+        results = []
+
+        def enough():
+            results.extend(self.loader.poll())
+            return len(results) >= count
+        wait_until(enough)
+        return results
+
+    def test_selected_profile_jumps_the_queue(self):
+        """Test that an urgent request is served before the background backlog."""
+        profiles = [make_profile(f'user{ix}') for ix in range(4)]
+        self.loader.request(profiles[:1])
+        wait_until(lambda: self.service.calls == ['user0'])
+
+        queued = self.loader.request(profiles)
+        self.loader.request([profiles[3]], urgent=True)
+        self.service.release.set()
+        results = self.collect(4)
+
+        assert queued == 3
+        assert self.service.calls == ['user0', 'user3', 'user1', 'user2']
+        assert all(result.profile.engagement_stats == ENGAGEMENT for result in results)
+        assert self.loader.pending == 0
+
+    def test_each_profile_loaded_once(self):
+        """Test that loaded and private profiles are not requested again."""
+        self.service.release.set()
+        profile = make_profile('alice')
+
+        assert self.loader.request([profile, make_profile('hidden', is_private=True)]) == 1
+        (result,) = self.collect(1)
+
+        assert self.loader.request([profile, result.profile]) == 0
+        assert self.service.calls == ['alice']
+
+    def test_failures_retried_when_selected(self):
+        """Test that a failed load is only retried by an urgent request."""
+        self.service.release.set()
+        self.service.failing.add('alice')
+        profile = make_profile('alice')
+        self.loader.request([profile])
+        (result,) = self.collect(1)
+
+        assert result.error == "rate limited"
+        assert self.loader.request([profile]) == 0
+
+        self.service.failing.clear()
+        assert self.loader.request([profile], urgent=True) == 1
+        assert self.collect(1)[0].profile is not None
+
+    def test_reset_drops_pending_loads(self):
+        """Test that results of a previous search are discarded."""
+        self.loader.request([make_profile('old'), make_profile('older')])
+        wait_until(lambda: self.service.calls == ['old'])
+
+        self.loader.reset()
+        self.loader.request([make_profile('new')])
+        self.service.release.set()
+
+        assert [result.username for result in self.collect(1)] == ['new']
+        assert self.service.calls == ['old', 'new']
+
+    def test_placeholders(self):
+        """Test how rows and details show missing engagement statistics."""
+        pending = make_profile('alice')
+        hidden = make_profile('hidden', is_private=True)
+
+        assert profile_row_values(pending)[4:8] == (ENGAGEMENT_PENDING,) * 4
+        assert profile_row_values(hidden)[4:8] == (ENGAGEMENT_UNAVAILABLE,) * 4
+        assert profile_row_values(replace(pending, engagement_stats=ENGAGEMENT))[4] == "10.0"
+        assert "loading" in profile_details(pending)
+        assert "failed to load (timeout)" in profile_details(pending, "timeout")
+        assert "private accounts" in profile_details(hidden)
@@ -0,0 +1,44 @@
+"""End-to-end tests of HikerApiClient against the benchmark fake API."""
+import pytest
+
+from benchmarks.fake_hikerapi import FakeApiConfig, fake_api_in_thread, parse_latency, point_client_at
+from benchmarks.run_benchmarks import percentile
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.request_scheduler import RequestScheduler
+
+
+class TestFakeHikerApi:
+    """Test suite for the fake HikerAPI server."""
+
+    def make_client(self, url):
+        """Create a client with a fast retry policy pointed at url."""
+        scheduler = RequestScheduler(rate=10_000, burst=10_000, base_delay=0.001, max_delay=0.01)
+        api_client = HikerApiClient(api_key='test', max_workers=4, scheduler=scheduler)
+        point_client_at(api_client, url)
+        return api_client
+
+    def test_search_profiles(self):
+        """Test a real search over HTTP."""
+        with fake_api_in_thread() as server:
+            result = self.make_client(server.url).search_profiles('alice,bob')
+
+        assert [p.username for p in result.profiles] == ['alice', 'bob']
+        assert result.profiles[0].engagement_stats.recent_post_count == 5
+        assert server.counts == {200: 4}
+
+    def test_injected_faults_are_retried(self):
+        """Test that 429 and 500 responses are retried to success."""
+        config = FakeApiConfig(error_rate=0.2, rate_limit_rate=0.2, seed=3)
+        with fake_api_in_thread(config) as server:
+            result = self.make_client(server.url).search_profiles(','.join(f'user{ix}' for ix in range(10)))
+
+        assert len(result.profiles) == 10
+        assert server.counts[200] == 20
+        assert server.counts.get(429, 0) + server.counts.get(500, 0) > 0
+
+    def test_parse_latency(self):
+        """Test latency distribution parsing."""
+        assert parse_latency('fixed:20')(None) == pytest.approx(0.02)
+        with pytest.raises(ValueError):
+            parse_latency('gamma:1')
+        assert percentile([3.0, 1.0, 2.0], 0.5) == 2.0
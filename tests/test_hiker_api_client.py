@@ -1,4 +1,6 @@
 """Tests for HikerAPI client."""
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -92,9 +94,10 @@ class TestHikerApiClient:
             }
         ]
         
-        # Configure mock to return our response
-        self.mock_hikerapi.user_by_username_v1.return_value = mock_responses[0]
-        self.mock_hikerapi.user_by_username_v1.side_effect = mock_responses
+        # Configure mock to return our response; lookups run concurrently,
+        # so responses are keyed by username rather than call order
+        responses_by_username = {r['username']: r for r in mock_responses}
+        self.mock_hikerapi.user_by_username_v1.side_effect = responses_by_username.get
         
         # Call the method
         result = self.api_client.search_profiles('user1,user2')
@@ -115,3 +118,118 @@ class TestHikerApiClient:
         assert profile2.username == 'user2'
         assert profile2.full_name == 'User Two'
         assert profile2.statistics.followers_count == 5000
+
+    def test_search_profiles_preserves_input_order(self):
+        """Test that concurrent lookups return profiles in input order."""
+        usernames = [f'user{i}' for i in range(10)]
+        
+        def lookup(username):
+            # Later users answer first, so completion order is reversed
+            time.sleep(0.001 * (10 - int(username[4:])))
+            return {'pk': username, 'username': username}
+        
+        self.mock_hikerapi.user_by_username_v1.side_effect = lookup
+        
+        result = self.api_client.search_profiles(','.join(usernames))
+        
+        assert [p.username for p in result.profiles] == usernames
+        assert result.total_count == 10
+        assert self.mock_hikerapi.user_medias_v2.call_count == 10
+    
+    def test_search_profiles_runs_concurrently(self):
+        """Test that lookups for different profiles overlap."""
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            api_client = HikerApiClient(api_key="test_key", max_workers=4)
+        
+        barrier = threading.Barrier(4, timeout=5)
+        
+        def lookup(username):
+            # Only completes if all four lookups are in flight at once
+            barrier.wait()
+            return {'pk': username, 'username': username}
+        
+        self.mock_hikerapi.user_by_username_v1.side_effect = lookup
+        
+        result = api_client.search_profiles('a,b,c,d')
+        
+        assert [p.username for p in result.profiles] == ['a', 'b', 'c', 'd']
+    
+    def test_search_profiles_rejects_empty_usernames(self):
+        """Test that an empty entry fails before any API call."""
+        with pytest.raises(ValueError):
+            self.api_client.search_profiles('user1,,user2')
+        
+        self.mock_hikerapi.user_by_username_v1.assert_not_called()
+    
+    def test_invalid_max_workers(self):
+        """Test that a non-positive worker count is rejected."""
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            with pytest.raises(ValueError):
+                HikerApiClient(api_key="test_key", max_workers=0)
+    
+    def test_duplicate_usernames_fetched_once(self):
+        """Test that repeated usernames in a query share one lookup."""
+        self.mock_hikerapi.user_by_username_v1.side_effect = lambda username: {
+            'pk': f'{username}_pk', 'username': username
+        }
+        
+        result = self.api_client.search_profiles('user1,user2,User1,user1')
+        
+        assert [p.username for p in result.profiles] == ['user1', 'user2', 'user1', 'user1']
+        assert self.mock_hikerapi.user_by_username_v1.call_count == 2
+        assert self.mock_hikerapi.user_medias_v2.call_count == 2
+        stats = self.api_client.cache_stats['profiles']
+        assert stats.misses == 2
+        assert stats.hits + stats.coalesced == 2
+    
+    def test_engagement_loaded_on_demand(self):
+        """Test that a client without engagement loading fills it only when asked."""
+        self.mock_hikerapi.user_by_username_v1.side_effect = lambda username: {
+            'pk': f'{username}_pk', 'username': username, 'follower_count': 100,
+            'is_private': username == 'hidden'
+        }
+        self.mock_hikerapi.user_medias_v2.return_value = {
+            'response': {'items': [{'like_count': 10, 'comment_count': 2}]}
+        }
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            api_client = HikerApiClient(api_key="test_key", load_engagement=False)
+        
+        profile, hidden = api_client.search_profiles('user1,hidden').profiles
+        
+        assert profile.engagement_stats is None and profile.engagement_pending
+        assert hidden.engagement_stats is None and not hidden.engagement_pending
+        self.mock_hikerapi.user_medias_v2.assert_not_called()
+        
+        filled = api_client.fill_engagement(profile)
+        
+        assert filled.engagement_stats.recent_avg_post_likes == 10
+        assert filled.engagement_stats.engagement_rate == pytest.approx(0.12)
+        assert api_client.fill_engagement(hidden) is hidden
+        self.mock_hikerapi.user_medias_v2.assert_called_once_with('user1_pk')
+
+    
+    def test_engagement_pages_fill_window(self):
+        """Test that media pages are fetched until the engagement window is filled."""
+        pages = {
+            None: {'response': {'items': [{'like_count': 10}] * 3}, 'next_page_id': 'p2'},
+            'p2': {'response': {'items': [{'like_count': 20}] * 3}, 'next_page_id': 'p3'},
+        }
+        self.mock_hikerapi.user_medias_v2.side_effect = lambda userid, page_id=None: pages[page_id]
+        
+        stats = self.api_client.get_engagement_stats('user1_pk', followers_count=100)
+        
+        assert stats.recent_post_count == 5
+        assert stats.recent_avg_post_likes == 14
+        assert self.mock_hikerapi.user_medias_v2.call_count == 2
+    
+    def test_engagement_rate_follows_followers_count(self):
+        """Test that cached media give each follower count its own engagement rate."""
+        self.mock_hikerapi.user_medias_v2.return_value = {
+            'response': {'items': [{'like_count': 10, 'comment_count': 0}]}
+        }
+        
+        first = self.api_client.get_engagement_stats('user1_pk', followers_count=100)
+        second = self.api_client.get_engagement_stats('user1_pk', followers_count=1000)
+        
+        assert (first.engagement_rate, second.engagement_rate) == pytest.approx((0.1, 0.01))
+        self.mock_hikerapi.user_medias_v2.assert_called_once_with('user1_pk')
@@ -0,0 +1,91 @@
+"""Tests for the shared HTTP connection pools."""
+import asyncio
+
+import hikerapi
+import httpx
+import pytest
+
+from benchmarks.fake_hikerapi import fake_api_in_thread, point_client_at
+from src.infrastructure.api.async_hiker_api_client import AsyncHikerApiClient
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.http_pool import AsyncHttpPool, HttpPool, PoolConfig
+from src.infrastructure.api.request_scheduler import RequestScheduler
+
+
+class TestHttpPool:
+    """Test suite for HttpPool and AsyncHttpPool."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pool = HttpPool(PoolConfig(max_connections=4, max_keepalive_connections=4, connect_timeout=1.5))
+
+    def teardown_method(self):
+        """Close the pool."""
+        self.pool.close()
+
+    def make_client(self, api_key):
+        """Create a client on the shared pool."""
+        scheduler = RequestScheduler(rate=10_000, burst=10_000)
+        return HikerApiClient(api_key=api_key, max_workers=4, scheduler=scheduler, http_pool=self.pool)
+
+    def test_clients_share_connections(self):
+        """Test that clients with different keys reuse the same kept-alive connections."""
+        first, second = self.make_client('key1'), self.make_client('key2')
+        assert first._client._client is second._client._client is self.pool.client
+        assert self.pool.client.event_hooks['response'] == [HikerApiClient._check_status]
+
+        with fake_api_in_thread() as server:
+            point_client_at(first, server.url)
+            point_client_at(second, server.url)
+            first.search_profiles(','.join(f'a{ix}' for ix in range(20)))
+            second.search_profiles(','.join(f'b{ix}' for ix in range(20)))
+
+        assert server.counts[200] == 80
+        assert len(server.peers) <= 4
+
+    def test_timeouts_apply_per_phase(self):
+        """Test that hikerapi's per-request timeout becomes the pool's Timeout."""
+        api_client = self.make_client('key')
+
+        timeout = api_client._client._timeout
+        assert isinstance(timeout, httpx.Timeout)
+        assert (timeout.connect, timeout.read) == (1.5, 30.0)
+
+    def test_one_host_per_pool(self):
+        """Test that a pool refuses clients of another host."""
+        self.make_client('key')
+
+        with pytest.raises(ValueError):
+            self.pool.attach(hikerapi.Client(token='key', host='other.example'))
+
+    def test_owned_pool_sized_for_workers(self):
+        """Test that a client without a shared pool keeps a connection per worker."""
+        api_client = HikerApiClient(api_key='key', max_workers=150)
+
+        assert api_client._http_pool.config.max_keepalive_connections == 150
+        api_client.close()
+        assert api_client._http_pool.client is None
+
+    def test_http2_requires_h2(self):
+        """Test that asking for HTTP/2 without h2 fails with a hint."""
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match='h2'):
+                HttpPool(PoolConfig(http2=True))
+        else:
+            assert HttpPool(PoolConfig(http2=True)).config.http2
+
+    def test_async_clients_share_pool(self):
+        """Test that asyncio clients share one AsyncClient."""
+        async def run():
+            pool = AsyncHttpPool()
+            first = AsyncHikerApiClient(api_key='key1', http_pool=pool)
+            second = AsyncHikerApiClient(api_key='key2', http_pool=pool)
+            shared = first._client._client is second._client._client is pool.client
+            await first.aclose()
+            still_open = pool.client is not None
+            await pool.aclose()
+            return shared, still_open
+
+        assert asyncio.run(run()) == (True, True)
@@ -0,0 +1,159 @@
+"""Tests for the API key pool and the client spreading requests over it."""
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from src.domain.models.lookup import LOOKUP_ERROR
+from src.infrastructure.api.errors import AuthError, NotFoundError, RateLimitError, TransientApiError
+from src.infrastructure.api.key_pool import KEYS_ENV_VAR, QUOTA_HEADER, KeyPool, load_api_keys, parse_api_keys
+from src.infrastructure.api.key_pool_client import KeyPoolApiClient
+from src.infrastructure.api.request_scheduler import RequestScheduler
+
+
+class TestKeyPool:
+    """Test suite for KeyPool."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = 0.0
+        self.pool = KeyPool(['key-a', 'key-b', 'key-c'], quarantine=10, clock=lambda: self.now)
+
+    def test_parse_keys_with_quotas(self):
+        """Test that keys files allow comments, commas and quotas."""
+        keys = parse_api_keys("# pool\nkey-a 500\n\nkey-b, key-c\nkey-a\n")
+        assert keys == {'key-a': 500, 'key-b': None, 'key-c': None}
+        assert load_api_keys(environ={KEYS_ENV_VAR: 'x1,x2'}) == {'x1': None, 'x2': None}
+        with pytest.raises(ValueError):
+            parse_api_keys("key-a lots")
+
+    def test_least_loaded_key_is_used(self):
+        """Test that concurrent requests spread over the keys and prefer healthy ones."""
+        assert [self.pool.acquire() for _ in range(3)] == ['key-a', 'key-b', 'key-c']
+        self.pool.release('key-a', TransientApiError("boom"))
+        self.pool.release('key-b')
+        self.pool.release('key-c')
+
+        assert self.pool.acquire() == 'key-b'
+        assert self.pool.acquire() == 'key-c'
+        assert self.pool.stats()[0].error_rate == 1.0
+
+    def test_rate_limited_key_is_quarantined(self):
+        """Test that a 429 rests the key for Retry-After or a doubling interval."""
+        key = self.pool.acquire()
+        self.pool.release(key, RateLimitError("slow down", retry_after=30))
+        leased = [self.pool.acquire() for _ in range(4)]
+        assert 'key-a' not in leased
+
+        self.now = 31
+        assert self.pool.acquire() == 'key-a'
+
+        pool = KeyPool(['key-a'], quarantine=10, clock=lambda: self.now)
+        for rest in (10, 20, 40):
+            pool.release(pool.acquire(), RateLimitError("slow down"))
+            assert pool.stats()[0].quarantined_for == rest
+            self.now += rest
+
+    def test_every_key_quarantined_raises_rate_limit(self):
+        """Test that an exhausted pool reports the wait until the first key returns."""
+        for key, error in (('key-a', AuthError("revoked")), ('key-b', RateLimitError("x", retry_after=5)),
+                           ('key-c', RateLimitError("x", retry_after=8))):
+            assert self.pool.acquire() == key
+            self.pool.release(key, error)
+
+        with pytest.raises(RateLimitError) as excinfo:
+            self.pool.acquire()
+        assert excinfo.value.retry_after == 5
+
+    def test_account_errors_do_not_count_against_key(self):
+        """Test that a missing account is not the key's fault."""
+        key = self.pool.acquire()
+        self.pool.release(key, NotFoundError("no such user"))
+
+        assert self.pool.stats()[0].errors == 0
+        assert self.pool.stats()[0].error_rate == 0.0
+
+    def test_quota_from_headers(self):
+        """Test that the quota header updates the key sent with the request."""
+        pool = KeyPool(['key-a', 'key-b'], quotas={'key-a': 1}, quarantine=10, clock=lambda: self.now)
+        request = httpx.Request('GET', 'https://api.example', headers={'x-access-key': 'key-b'})
+        pool.observe_response(httpx.Response(200, headers={'x-ratelimit-remaining': '0'}, request=request))
+
+        assert pool.acquire() == 'key-a'
+        pool.release('key-a')
+        assert [stats.remaining_quota for stats in pool.stats()] == [0, None]
+        with pytest.raises(RateLimitError):
+            pool.acquire()
+
+
+class TestKeyPoolApiClient:
+    """Test suite for KeyPoolApiClient."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.apis = {}
+
+        def make_api(token):
+            api = MagicMock()
+            api.user_by_username_v1.side_effect = lambda username: {'pk': '1', 'username': username}
+            self.apis[token] = api
+            return api
+
+        scheduler = RequestScheduler(base_delay=0, sleep=lambda seconds: None)
+        self.key_pool = KeyPool(['key-a', 'key-b'])
+        with patch('hikerapi.Client', side_effect=make_api):
+            self.client = KeyPoolApiClient(self.key_pool, scheduler=scheduler, load_engagement=False)
+
+    def test_rate_limited_request_moves_to_another_key(self):
+        """Test that a request rejected on one key is retried on another."""
+        self.apis['key-a'].user_by_username_v1.side_effect = RateLimitError("slow down", retry_after=60)
+
+        outcomes = self.client.lookup_profiles('alice,bob,carol')
+
+        assert all(outcome.profile is not None for outcome in outcomes)
+        assert self.apis['key-a'].user_by_username_v1.call_count == 1
+        assert self.apis['key-b'].user_by_username_v1.call_count == 3
+        assert self.client.metrics.counter('api_key_quarantines_total', key='…ey-a') == 1
+        assert self.client.metrics.counter('api_key_requests_total', key='…ey-b') == 3
+
+    def test_rejected_key_moves_request_to_another_key(self):
+        """Test that a 401 on one key quarantines it and the lookup succeeds on the other."""
+        self.apis['key-a'].user_by_username_v1.side_effect = AuthError("HikerAPI rejected the API key (401)")
+
+        outcomes = self.client.lookup_profiles('alice,bob')
+
+        assert [outcome.ok for outcome in outcomes] == [True, True]
+        assert self.apis['key-a'].user_by_username_v1.call_count == 1
+        assert self.apis['key-b'].user_by_username_v1.call_count == 2
+        assert self.client.metrics.counter('api_key_quarantines_total', key='…ey-a') == 1
+
+    def test_every_key_rejected(self):
+        """Test that a lookup fails with the auth error once every key refused it."""
+        for api in self.apis.values():
+            api.user_by_username_v1.side_effect = AuthError("HikerAPI rejected the API key (401)")
+
+        outcome, = self.client.lookup_profiles('alice')
+
+        assert outcome.status == LOOKUP_ERROR
+        assert sum(api.user_by_username_v1.call_count for api in self.apis.values()) == 2
+
+    def test_quota_header_read_for_every_key(self):
+        """Test that quota headers update the pool for requests sent with a non-first key."""
+        key_pool = KeyPool(['key-a', 'key-b'], quotas={'key-a': 0})
+        client = KeyPoolApiClient(key_pool, scheduler=RequestScheduler(base_delay=0), load_engagement=False)
+        sent_keys = []
+
+        def handler(request):
+            sent_keys.append(request.headers['x-access-key'])
+            return httpx.Response(200, json={'pk': '1', 'username': 'alice'}, headers={QUOTA_HEADER: '7'})
+
+        for api in client._clients.values():
+            api._client._transport = httpx.MockTransport(handler)
+        try:
+            client.get_profile('alice')
+        finally:
+            client.close()
+
+        assert sent_keys == ['key-b']
+        # The header sets the quota to 7, then the finished request uses one
+        assert [stats.remaining_quota for stats in key_pool.stats()] == [0, 6]
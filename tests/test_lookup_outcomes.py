@@ -0,0 +1,157 @@
+"""Tests for per-username lookup outcomes and targeted retries."""
+from unittest.mock import MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.application.profile_service import ProfileService
+from src.domain.models.lookup import (
+    LOOKUP_ERROR,
+    LOOKUP_INVALID,
+    LOOKUP_NOT_FOUND,
+    LOOKUP_OK,
+    LOOKUP_PRIVATE,
+    LOOKUP_RATE_LIMITED,
+    LOOKUP_TRANSIENT,
+    LookupOutcome,
+)
+from src.infrastructure.api.errors import (
+    AuthError,
+    NotFoundError,
+    PrivateAccountError,
+    RateLimitError,
+    TransientApiError,
+)
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.request_scheduler import RequestScheduler
+
+
+def user_response(username, is_private=False):
+    """Minimal user_by_username_v1 payload."""
+    return {'pk': f'{username}_pk', 'username': username, 'is_private': is_private}
+
+
+class TestLookupOutcomes:
+    """Test suite for HikerApiClient.lookup_profiles and the status mapping."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_hikerapi = MagicMock()
+        scheduler = RequestScheduler(max_retries=0, sleep=lambda seconds: None)
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            self.api_client = HikerApiClient(api_key='test', scheduler=scheduler)
+
+    def test_failures_are_classified_and_others_kept(self):
+        """Test that one failing username does not discard the rest."""
+        def lookup(username):
+            if username == 'gone':
+                raise NotFoundError("Target user not found")
+            if username == 'busy':
+                raise RateLimitError("Rate limited by HikerAPI")
+            if username == 'locked':
+                raise PrivateAccountError("Private account")
+            return user_response(username, is_private=username == 'hidden')
+
+        self.mock_hikerapi.user_by_username_v1.side_effect = lookup
+        self.mock_hikerapi.user_medias_v2.return_value = {'response': {'items': []}}
+
+        outcomes = self.api_client.lookup_profiles('alice,gone,busy,locked,hidden')
+
+        assert [(o.username, o.status) for o in outcomes] == [
+            ('alice', LOOKUP_OK), ('gone', LOOKUP_NOT_FOUND), ('busy', LOOKUP_RATE_LIMITED),
+            ('locked', LOOKUP_PRIVATE), ('hidden', LOOKUP_OK)
+        ]
+        assert outcomes[0].profile.username == 'alice'
+        assert outcomes[1].error == "Target user not found"
+        assert outcomes[2].retryable and not outcomes[1].retryable
+        # Private accounts keep their base stats and skip the media call
+        assert outcomes[4].profile.engagement_stats is None
+        self.mock_hikerapi.user_medias_v2.assert_called_once_with('alice_pk')
+
+    @pytest.mark.parametrize('status, body, error', [
+        (404, {'detail': 'Target user not found'}, NotFoundError),
+        (403, {'detail': 'Private account'}, PrivateAccountError),
+        (401, {'detail': 'Invalid key'}, AuthError),
+        (429, {}, RateLimitError),
+        (502, {}, TransientApiError),
+    ])
+    def test_status_mapping(self, status, body, error):
+        """Test that error responses raise their ApiError subclass."""
+        response = httpx.Response(status, json=body, request=httpx.Request('GET', 'https://api.test/v1'))
+
+        with pytest.raises(error):
+            HikerApiClient._check_status(response)
+
+    def test_success_passes(self):
+        """Test that successful responses are left alone."""
+        HikerApiClient._check_status(httpx.Response(200, json={}))
+
+
+class TestServiceLookups:
+    """Test suite for ProfileService lookups and retry_failed."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.api_client = Mock()
+        self.calls = []
+
+        def lookup_profiles(query):
+            names = query.split(',')
+            self.calls.append(names)
+            return [
+                LookupOutcome(name, LOOKUP_TRANSIENT, error="timeout") if name == 'flaky' and len(self.calls) == 1
+                else LookupOutcome(name, LOOKUP_NOT_FOUND, error="User not found") if name == 'gone'
+                else LookupOutcome(name, LOOKUP_OK, profile=Mock())
+                for name in names
+            ]
+
+        self.api_client.lookup_profiles.side_effect = lookup_profiles
+        self.service = ProfileService(self.api_client)
+
+    def test_lookup_and_retry_only_transient(self):
+        """Test that only temporary failures are looked up again."""
+        outcomes = self.service.lookup_profiles(['@Alice', 'flaky', 'gone', 'not valid!', 'alice'])
+
+        assert [(o.username, o.status) for o in outcomes] == [
+            ('alice', LOOKUP_OK), ('flaky', LOOKUP_TRANSIENT), ('gone', LOOKUP_NOT_FOUND), ('not valid!', LOOKUP_INVALID)
+        ]
+
+        retried = self.service.retry_failed(outcomes)
+
+        assert self.calls == [['alice', 'flaky', 'gone'], ['flaky']]
+        assert [o.status for o in retried] == [LOOKUP_OK, LOOKUP_OK, LOOKUP_NOT_FOUND, LOOKUP_INVALID]
+
+    def test_client_failure_marks_every_username(self):
+        """Test that a failing client yields a failed outcome per username."""
+        self.api_client.lookup_profiles.side_effect = RateLimitError("slow down")
+
+        outcomes = self.service.lookup_profiles(['a', 'b'])
+
+        assert [o.status for o in outcomes] == [LOOKUP_RATE_LIMITED, LOOKUP_RATE_LIMITED]
+
+    def test_results_matched_by_username(self):
+        """Test that outcomes returned out of order or missing do not shift onto other names."""
+        self.api_client.lookup_profiles.side_effect = lambda query: [LookupOutcome('B', LOOKUP_NOT_FOUND, error="gone")]
+
+        outcomes = self.service.lookup_profiles(['a', 'b'])
+
+        assert [(o.username, o.status) for o in outcomes] == [('a', LOOKUP_ERROR), ('B', LOOKUP_NOT_FOUND)]
+
+    def test_single_lookup_calls_get_profile(self):
+        """Test that one username is fetched directly rather than as a batch."""
+        def get_profile(username):
+            if username != 'alice':
+                raise NotFoundError("User not found")
+            return Mock()
+
+        self.api_client.get_profile.side_effect = get_profile
+
+        found = self.service.lookup_profile('@Alice')
+        missing = self.service.lookup_profile('gone')
+        invalid = self.service.lookup_profile('not valid!')
+
+        assert (found.username, found.status) == ('alice', LOOKUP_OK)
+        assert (missing.status, missing.error) == (LOOKUP_NOT_FOUND, "User not found")
+        assert invalid.status == LOOKUP_INVALID
+        assert self.api_client.get_profile.call_count == 2
+        self.api_client.lookup_profiles.assert_not_called()
@@ -0,0 +1,75 @@
+"""Tests for the in-process LRU cache."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.cache.memory_cache import LruTtlCache
+
+
+class TestLruTtlCache:
+    """Test suite for LruTtlCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = 0.0
+        self.cache = LruTtlCache(max_size=2, ttl=10, clock=lambda: self.now)
+
+    def test_hit_and_miss(self):
+        """Test that a loaded value is served from the cache."""
+        assert self.cache.get_or_load('a', lambda: 1) == 1
+        assert self.cache.get_or_load('a', lambda: 2) == 1
+
+        stats = self.cache.stats
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_expired_entry_reloaded(self):
+        """Test that entries older than the TTL are loaded again."""
+        self.cache.get_or_load('a', lambda: 1)
+        self.now += 10
+
+        assert self.cache.get_or_load('a', lambda: 2) == 2
+        assert self.cache.stats.misses == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        self.cache.get_or_load('a', lambda: 1)
+        self.cache.get_or_load('b', lambda: 2)
+        self.cache.get_or_load('a', lambda: 0)
+        self.cache.get_or_load('c', lambda: 3)
+
+        assert self.cache.get_or_load('a', lambda: 0) == 1
+        assert self.cache.get_or_load('b', lambda: 0) == 0
+        assert self.cache.stats.evictions == 2
+
+    def test_failed_load_not_cached(self):
+        """Test that a loader error propagates and is not stored."""
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            self.cache.get_or_load('a', fail)
+        assert self.cache.get_or_load('a', lambda: 1) == 1
+
+    def test_concurrent_misses_coalesced(self):
+        """Test that concurrent callers of one key share a single load."""
+        cache = LruTtlCache(max_size=0)
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(timeout=5)
+            return 'value'
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(cache.get_or_load, 'a', load) for _ in range(5)]
+            while cache.stats.coalesced < 4:
+                threading.Event().wait(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ['value'] * 5
+        assert len(calls) == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.size == 0
@@ -0,0 +1,111 @@
+"""Tests for the metrics registry and the API client instrumentation."""
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from src.application.profile_service import ProfileService
+from src.infrastructure.api.errors import TransientApiError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.request_scheduler import RequestScheduler
+from src.infrastructure.metrics.metrics_registry import Histogram, MetricsRegistry
+from src.presentation.main_window import format_metrics
+
+
+class TestMetricsRegistry:
+    """Test suite for MetricsRegistry."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = MetricsRegistry()
+
+    def test_counters_by_label(self):
+        """Test that each label set is a separate series."""
+        self.metrics.increment('calls_total', endpoint='a')
+        self.metrics.increment('calls_total', 2, endpoint='a')
+        self.metrics.increment('calls_total', endpoint='b')
+
+        assert self.metrics.counter('calls_total', endpoint='a') == 3
+        assert self.metrics.counter('calls_total', endpoint='b') == 1
+        assert self.metrics.counter('calls_total', endpoint='c') == 0
+
+    def test_histogram_quantiles(self):
+        """Test quantile estimates interpolated within buckets."""
+        histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == pytest.approx(1.5)
+        assert histogram.quantile(1.0) == pytest.approx(4.0)
+        assert Histogram().quantile(0.5) == 0.0
+
+    def test_registered_counters_are_read_on_dump(self):
+        """Test that callback counters report their current value."""
+        value = [1]
+        self.metrics.register_counter('cache_hits_total', lambda: value[0], cache='profiles')
+        value[0] = 5
+
+        assert self.metrics.counter('cache_hits_total', cache='profiles') == 5
+        assert json.loads(self.metrics.to_json())['counters'][0]['value'] == 5
+
+    def test_prometheus_text(self):
+        """Test the Prometheus exposition format."""
+        self.metrics.increment('errors_total', endpoint='x', error='Rate"Limit')
+        with self.metrics.time('request_seconds', endpoint='x'):
+            pass
+
+        text = self.metrics.to_prometheus()
+
+        assert '# TYPE errors_total counter' in text
+        assert 'errors_total{endpoint="x",error="Rate\\"Limit"} 1' in text
+        assert 'request_seconds_bucket{endpoint="x",le="0.005"} 1' in text
+        assert 'request_seconds_bucket{endpoint="x",le="+Inf"} 1' in text
+        assert 'request_seconds_count{endpoint="x"} 1' in text
+
+
+class TestClientInstrumentation:
+    """Test suite for the metrics of HikerApiClient and ProfileService."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_hikerapi = MagicMock()
+        self.mock_hikerapi.user_by_username_v1.return_value = {'pk': '1', 'username': 'alice', 'follower_count': 10}
+        self.mock_hikerapi.user_medias_v2.side_effect = [TransientApiError("boom"), {'response': {'items': []}}]
+        self.metrics = MetricsRegistry()
+        scheduler = RequestScheduler(base_delay=0, sleep=lambda seconds: None)
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            self.api_client = HikerApiClient(api_key='test', scheduler=scheduler, metrics=self.metrics)
+
+    def test_calls_errors_and_retries(self):
+        """Test per-endpoint call, error and retry counters and latencies."""
+        result = self.api_client.search_profiles('alice')
+        self.api_client.get_profile('alice')
+
+        metrics = self.metrics
+        assert isinstance(result.query_time_ms, int)
+        assert metrics.counter('api_requests_total', endpoint='user_by_username_v1') == 1
+        assert metrics.counter('api_requests_total', endpoint='user_medias_v2') == 2
+        assert metrics.counter('api_errors_total', endpoint='user_medias_v2', error='TransientApiError') == 1
+        assert metrics.counter('api_retries_total', endpoint='user_medias_v2') == 1
+        assert metrics.histogram('api_request_seconds', endpoint='user_medias_v2').count == 2
+        assert metrics.counter('cache_hits_total', cache='profiles') == 1
+        assert metrics.counter('cache_misses_total', cache='profiles') == 1
+
+        summary = format_metrics(metrics.snapshot())
+        assert 'user_medias_v2: 2 calls' in summary
+        assert 'Retries: 1   Cache: 1 hits, 2 misses' in summary
+
+    def test_service_outcomes(self):
+        """Test that the service records the outcome of each operation."""
+        api_client = Mock()
+        api_client.get_profile.side_effect = ValueError("User not found")
+        service = ProfileService(api_client, metrics=self.metrics)
+
+        service.get_profile('missing')
+        service.get_profile('not valid!')
+        service.search_profiles('')
+
+        assert self.metrics.counter('service_requests_total', operation='get_profile', outcome='error') == 1
+        assert self.metrics.counter('service_requests_total', operation='get_profile', outcome='invalid') == 1
+        assert self.metrics.counter('service_requests_total', operation='search_profiles', outcome='invalid') == 1
+        assert self.metrics.histogram('service_request_seconds', operation='get_profile').count == 2
@@ -0,0 +1,143 @@
+"""Tests for the columnar profile table."""
+import csv
+import os
+from dataclasses import replace
+from datetime import datetime
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.domain.analytics.engagement import engagement_rates, mean
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.domain.models.profile_table import ProfileTable
+from src.infrastructure.export.arrow_exporter import ArrowExporter
+from src.infrastructure.export.csv_exporter import CsvExporter
+from src.infrastructure.export.records import profile_to_record, table_to_columns
+
+
+def make_profile(ix):
+    """Create a profile with values derived from an index."""
+    return Profile(
+        userid=str(ix),
+        username=f'user{ix}',
+        full_name=None if ix % 2 else 'Same Name',
+        bio=None,
+        is_verified=ix % 3 == 0,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=ix * 1000,
+            following_count=ix,
+            posts_count=ix * 2,
+            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=ix * 10,
+            recent_avg_post_comments=ix,
+            recent_avg_post_reshares=0,
+            recent_post_count=5,
+            median_post_likes=ix * 9.5,
+            engagement_rate=0.011
+        )
+    )
+
+
+class TestProfileTable:
+    """Test suite for ProfileTable."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.profiles = [make_profile(ix) for ix in range(1, 7)]
+        self.table = ProfileTable.from_profiles(self.profiles)
+        self.tmpdir = TemporaryDirectory()
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.tmpdir.cleanup()
+
+    def test_models_use_slots(self):
+        """Test that the domain models carry no per-instance dict."""
+        profile = self.profiles[0]
+        assert not hasattr(profile, '__dict__')
+        assert not hasattr(profile.statistics, '__dict__')
+        assert not hasattr(profile.engagement_stats, '__dict__')
+
+    def test_rows_round_trip(self):
+        """Test that row views read back the stored profiles."""
+        assert len(self.table) == 6
+        assert [row.to_profile() for row in self.table] == self.profiles
+        assert self.table[-1].username == 'user6'
+        assert self.table[2].statistics.followers_count == 3000
+        assert [row.username for row in self.table[1:3]] == ['user2', 'user3']
+        with pytest.raises(IndexError):
+            self.table[6]
+
+    def test_strings_are_interned(self):
+        """Test that repeated strings are stored once."""
+        assert self.table.values('full_name') == [None, 'Same Name'] * 3
+        # six userids, six usernames and one shared full name
+        assert len(self.table._strings) == 13
+
+    def test_typed_columns(self):
+        """Test raw access to the typed arrays."""
+        assert self.table.column('followers_count').typecode == 'q'
+        assert self.table.values('is_verified') == [False, False, True, False, False, True]
+        with pytest.raises(KeyError):
+            self.table.column('username')
+
+    def test_engagement_rates(self):
+        """Test that engagement rates are read from the typed column, skipping rows without engagement."""
+        first = self.profiles[0]
+        table = ProfileTable.from_profiles([
+            replace(first, engagement_stats=replace(first.engagement_stats, engagement_rate=0.0123)),
+            replace(make_profile(7), engagement_stats=None),
+            self.profiles[1],
+        ])
+
+        rates = engagement_rates(table)
+
+        assert rates.typecode == 'd'
+        assert list(rates) == [0.0123, 0.011]
+        assert mean(rates) == pytest.approx(0.01165)
+
+    def test_rows_without_engagement(self):
+        """Test that profiles fetched without engagement keep None through the table and exports."""
+        pending = replace(make_profile(7), engagement_stats=None)
+        table = ProfileTable.from_profiles([self.profiles[0], pending])
+        csv_path = os.path.join(self.tmpdir.name, 'pending.csv')
+
+        CsvExporter().export_profiles(table, csv_path)
+
+        assert table[1].to_profile() == pending
+        assert table[1].engagement_pending and not table[0].engagement_pending
+        assert table.values('recent_avg_post_likes') == [10, None]
+        assert table_to_columns(table)['engagement_rate'] == [0.011, None]
+        assert profile_to_record(pending)['avg_post_likes'] is None
+        with open(csv_path, encoding='utf-8') as csv_file:
+            row = list(csv.DictReader(csv_file))[1]
+        assert (row['followers_count'], row['avg_post_likes'], row['engagement_rate']) == ('7000', '', '')
+
+    def test_csv_export_matches_profiles(self):
+        """Test that exporting a table equals exporting its profiles."""
+        from_table = os.path.join(self.tmpdir.name, 'table.csv')
+        from_list = os.path.join(self.tmpdir.name, 'list.csv')
+
+        CsvExporter().export_profiles(self.table, from_table)
+        CsvExporter().export_profiles(self.profiles, from_list)
+
+        with open(from_table, encoding='utf-8') as a, open(from_list, encoding='utf-8') as b:
+            assert a.read() == b.read()
+
+    def test_parquet_export_from_columns(self):
+        """Test that a table is written column by column to Parquet."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        filepath = os.path.join(self.tmpdir.name, 'table.parquet')
+
+        count = ArrowExporter('parquet', batch_size=4).export_stream(self.table, filepath)
+
+        parquet = pq.ParquetFile(filepath)
+        assert count == 6
+        assert parquet.metadata.num_row_groups == 2
+        table = parquet.read()
+        assert table.column('avg_post_likes').to_pylist() == [p * 10 for p in range(1, 7)]
+        assert table.column('full_name').to_pylist()[:2] == [None, 'Same Name']
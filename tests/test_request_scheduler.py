@@ -0,0 +1,130 @@
+"""Tests for the request scheduler."""
+import random
+
+import httpx
+import pytest
+
+from src.infrastructure.api.errors import RateLimitError, TransientApiError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.request_scheduler import AdaptiveConcurrencyLimiter, RequestScheduler, TokenBucket
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test suite for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test that calls beyond the burst wait for refilled tokens."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock, sleep=clock.sleep)
+
+        for _ in range(5):
+            bucket.acquire()
+
+        assert clock.sleeps == [0.5, 0.5]
+        assert clock.now == pytest.approx(1.0)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test suite for AdaptiveConcurrencyLimiter."""
+
+    def test_additive_increase_multiplicative_decrease(self):
+        """Test that successes grow the limit and errors halve it."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, max_limit=8, latency_threshold=1.0)
+
+        for _ in range(5):
+            limiter.acquire()
+            limiter.release(latency=0.1, overloaded=False)
+        assert limiter.limit == 5
+
+        limiter.acquire()
+        limiter.release(latency=0.1, overloaded=True)
+        assert limiter.limit == 2
+
+        limiter.acquire()
+        limiter.release(latency=2.0, overloaded=False)
+        assert limiter.limit == 1
+
+
+class TestRequestScheduler:
+    """Test suite for RequestScheduler."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock()
+        self.scheduler = RequestScheduler(
+            rate=100, burst=100, max_retries=3, base_delay=1.0,
+            clock=self.clock, sleep=self.clock.sleep, rng=random.Random(0)
+        )
+
+    def test_retries_transient_errors(self):
+        """Test that transient failures are retried with jittered backoff."""
+        outcomes = [TransientApiError("down"), RateLimitError("slow down", retry_after=7), "ok"]
+
+        def flaky():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert self.scheduler.call(flaky) == "ok"
+        assert self.scheduler.retry_count == 2
+        assert 0 <= self.clock.sleeps[0] <= 1.0
+        assert self.clock.sleeps[1] == 7
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last transient error is raised once retries run out."""
+        def failing():
+            raise TransientApiError("down")
+
+        with pytest.raises(TransientApiError):
+            self.scheduler.call(failing)
+        assert self.scheduler.retry_count == 3
+
+    def test_non_retryable_error_raised_immediately(self):
+        """Test that other errors are not retried."""
+        def failing():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            self.scheduler.call(failing)
+        assert self.scheduler.retry_count == 0
+
+
+class TestStatusCheck:
+    """Test suite for the HTTP status hook of HikerApiClient."""
+
+    def test_rate_limit_status(self):
+        """Test that HTTP 429 becomes a RateLimitError with Retry-After."""
+        response = httpx.Response(429, headers={'retry-after': '3'})
+
+        with pytest.raises(RateLimitError) as exc_info:
+            HikerApiClient._check_status(response)
+        assert exc_info.value.retry_after == 3
+
+    def test_server_error_status(self):
+        """Test that HTTP 5xx becomes a TransientApiError."""
+        with pytest.raises(TransientApiError):
+            HikerApiClient._check_status(httpx.Response(503))
+
+        HikerApiClient._check_status(httpx.Response(200))
+
+    def test_hook_installed_on_real_client(self):
+        """Test that the status hook is attached to hikerapi's HTTP client."""
+        client = HikerApiClient(api_key="test_key")
+
+        assert client._check_status in client._client._client.event_hooks['response']
@@ -0,0 +1,171 @@
+"""Tests for the raw response archive and the replay client."""
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.domain.models.lookup import LOOKUP_NOT_FOUND, LOOKUP_OK
+from src.infrastructure.api.errors import NotFoundError
+from src.infrastructure.api.hiker_api_client import HikerApiClient
+from src.infrastructure.api.replay_api_client import ReplayApiClient
+from src.infrastructure.storage.response_archive import ResponseArchive
+
+
+def user_response(username, followers=100, is_private=False):
+    """Minimal user_by_username_v1 payload."""
+    return {'pk': f'{username}_pk', 'username': username, 'follower_count': followers, 'is_private': is_private}
+
+
+def medias_response(likes):
+    """Minimal user_medias_v2 payload."""
+    return {'response': {'items': [{'like_count': likes, 'comment_count': 1}]}}
+
+
+class TestResponseArchive:
+    """Test suite for ResponseArchive."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = TemporaryDirectory()
+        self.directory = self.tmpdir.name
+        self.archive = ResponseArchive(self.directory, frame_records=4, clock=lambda: 1000.0)
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.archive.close()
+        self.tmpdir.cleanup()
+
+    def fill(self, archive, count):
+        """Archive a profile and a media response per account."""
+        for ix in range(count):
+            archive.append('user_by_username_v1', f'User{ix}', user_response(f'user{ix}', followers=ix))
+            archive.append('user_medias_v2', f'user{ix}_pk', medias_response(ix))
+
+    def test_lookup_by_username_and_pk(self):
+        """Test that written frames can be looked up by either key."""
+        self.fill(self.archive, 10)
+        self.archive.flush()
+
+        archived = self.archive.user('USER3')
+        assert (archived.endpoint, archived.key, archived.fetched_at) == ('user_by_username_v1', 'User3', 1000.0)
+        assert self.archive.user_by_pk('user3_pk') == archived
+        assert self.archive.medias('user3_pk').response == medias_response(3)
+        assert self.archive.user('missing') is None
+        assert len(self.archive) == 30
+
+    def test_latest_response_wins_across_runs(self):
+        """Test that reopening appends new chunks and the index points at the newest response."""
+        self.fill(self.archive, 10)
+        self.archive.close()
+
+        with ResponseArchive(self.directory) as archive:
+            archive.append('user_by_username_v1', 'user3', user_response('user3', followers=999))
+
+        with ResponseArchive(self.directory) as archive:
+            assert archive.user('user3').response['follower_count'] == 999
+            assert archive.user('user4').response['follower_count'] == 4
+            assert archive.usernames() == [f'user{ix}' for ix in range(10)]
+        assert sorted(name for name in os.listdir(self.directory) if name.startswith('users')) == [
+            'users-000000.jsonl.gz', 'users-000001.jsonl.gz'
+        ]
+
+    def test_chunks_are_plain_jsonl_gz(self):
+        """Test that concatenated frames read as one ordinary gzip file."""
+        self.fill(self.archive, 10)
+        self.archive.flush()
+
+        with gzip.open(os.path.join(self.directory, 'users-000000.jsonl.gz'), 'rt', encoding='utf-8') as chunk:
+            assert len(chunk.readlines()) == 10
+
+    def test_reindex_skips_truncated_frame(self):
+        """Test that a lost index is rebuilt and a frame cut short by a crash is ignored."""
+        self.fill(self.archive, 10)
+        self.archive.close()
+        os.remove(os.path.join(self.directory, 'index.bin'))
+        with open(os.path.join(self.directory, 'users-000000.jsonl.gz'), 'ab') as chunk:
+            chunk.write(gzip.compress(b'{"endpoint": "user_by_username_v1"}\n')[:20])
+
+        with ResponseArchive(self.directory) as archive:
+            assert len(archive) == 30
+            assert archive.user('user9').response['follower_count'] == 9
+            assert archive.reindex() == 30
+
+    def test_crash_before_close_reindexes_on_open(self):
+        """Test that frames written after the last index are found when the archive is reopened."""
+        self.fill(self.archive, 4)
+        self.archive.flush()
+        for ix in range(4):
+            self.archive.append('user_by_username_v1', f'user{ix}', user_response(f'user{ix}', followers=500 + ix))
+        # The process dies here: the frame is on disk, the index is not rewritten
+        index_path = os.path.join(self.directory, 'index.bin')
+        index_mtime = os.stat(index_path).st_mtime
+        os.utime(index_path, (index_mtime - 1, index_mtime - 1))
+
+        with ResponseArchive(self.directory) as archive:
+            assert archive.user('user2').response['follower_count'] == 502
+            assert archive.medias('user2_pk').response == medias_response(2)
+
+    def test_zstd_frames(self):
+        """Test the zstd codec when zstandard is installed."""
+        pytest.importorskip('zstandard')
+        with ResponseArchive(os.path.join(self.directory, 'zstd'), compression='zstd', frame_records=3) as archive:
+            self.fill(archive, 5)
+            archive.flush()
+            assert archive.medias('user4_pk').response == medias_response(4)
+
+
+class TestReplayApiClient:
+    """Test suite for ReplayApiClient and archiving from HikerApiClient."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = TemporaryDirectory()
+        self.archive = ResponseArchive(self.tmpdir.name)
+        self.mock_hikerapi = MagicMock()
+        self.mock_hikerapi.user_by_username_v1.side_effect = lambda username: user_response(
+            username, is_private=username == 'hidden'
+        )
+        self.mock_hikerapi.user_medias_v2.return_value = medias_response(20)
+        with patch('hikerapi.Client', return_value=self.mock_hikerapi):
+            self.api_client = HikerApiClient(api_key='test', archive=self.archive)
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.archive.close()
+        self.tmpdir.cleanup()
+
+    def test_replay_matches_live_profiles(self):
+        """Test that replayed profiles equal the ones mapped from the live responses."""
+        live = self.api_client.search_profiles('alice,hidden').profiles
+        self.archive.close()
+
+        with ResponseArchive(self.tmpdir.name) as archive:
+            replay = ReplayApiClient(archive)
+            assert replay.search_profiles('alice,hidden').profiles == live
+            assert list(replay.profiles()) == live
+            assert replay.get_engagement_stats('alice_pk', followers_count=100) == live[0].engagement_stats
+            with pytest.raises(NotFoundError):
+                replay.get_profile('bob')
+            outcomes = replay.lookup_profiles('alice,bob')
+
+        assert live[1].engagement_stats is None
+        assert [o.status for o in outcomes] == [LOOKUP_OK, LOOKUP_NOT_FOUND]
+        self.mock_hikerapi.user_medias_v2.assert_called_once_with('alice_pk')
+
+    def test_paged_media_archived_as_one_response(self):
+        """Test that a replay sees every media page the live lookup fetched."""
+        pages = {
+            None: {'response': {'items': [{'like_count': 10, 'comment_count': 1}]}, 'next_page_id': 'p2'},
+            'p2': {'response': {'items': [{'like_count': 30, 'comment_count': 1}]}, 'next_page_id': None},
+        }
+        self.mock_hikerapi.user_medias_v2.side_effect = lambda userid, page_id=None: pages[page_id]
+        live = self.api_client.get_engagement_stats('alice_pk', followers_count=100)
+        self.archive.close()
+
+        with ResponseArchive(self.tmpdir.name) as archive:
+            replayed = ReplayApiClient(archive).get_engagement_stats('alice_pk', followers_count=100)
+
+        assert live.recent_post_count == 2
+        assert replayed == live
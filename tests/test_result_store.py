@@ -0,0 +1,122 @@
+"""Tests for the indexed result store."""
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.presentation.result_store import ResultStore, _SortedIndex, parse_filter
+from src.presentation.virtual_tree import VirtualTreeView
+
+
+def make_profile(ix, followers, likes=0.0, verified=False):
+    """Create a profile with the indexed values set."""
+    return Profile(
+        userid=str(ix),
+        username=f'User{ix}',
+        full_name=f'Name {ix}',
+        bio=None,
+        is_verified=verified,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=followers,
+            following_count=0,
+            posts_count=0,
+            last_updated=datetime(2023, 1, 1)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=likes,
+            recent_avg_post_comments=0,
+            recent_avg_post_reshares=0,
+            recent_post_count=0
+        )
+    )
+
+
+class TestResultStore:
+    """Test suite for ResultStore."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.store = ResultStore(VirtualTreeView.row_id_for_iid)
+        self.store.add([
+            make_profile(0, 5_000, likes=10, verified=True),
+            make_profile(1, 50_000, likes=300),
+            make_profile(2, 20_000, likes=40, verified=True),
+            make_profile(3, 500, likes=2),
+        ])
+
+    def test_lookups(self):
+        """Test lookups by iid, username and userid."""
+        assert self.store.get_by_iid(VirtualTreeView.iid_for_row(2)).userid == '2'
+        assert self.store.get_by_username('user1').userid == '1'
+        assert self.store.get_by_userid('3').username == 'User3'
+        assert self.store.get_by_iid('bogus') is None
+
+    def test_numeric_sort_uses_presorted_index(self):
+        """Test sorting by numeric columns in both directions."""
+        assert self.store.query(sort_column='followers') == [3, 0, 2, 1]
+        assert self.store.query(sort_column='avg_post_likes', reverse=True) == [1, 2, 0, 3]
+
+    def test_text_sort(self):
+        """Test sorting by a text column."""
+        self.store.add([make_profile(4, 1)])
+        assert self.store.query(sort_column='username', reverse=True) == [4, 3, 2, 1, 0]
+
+    def test_filter_ranges_and_flags(self):
+        """Test filters combining a range and a flag."""
+        result_filter = parse_filter('followers > 10k, verified')
+
+        assert self.store.query(result_filter) == [2]
+        assert self.store.query(parse_filter('likes >= 10, followers <= 20k'), 'followers') == [0, 2]
+
+    def test_query_is_cached_until_change(self):
+        """Test that repeated queries reuse the cached result."""
+        result_filter = parse_filter('followers > 1k')
+        first = self.store.query(result_filter)
+
+        assert self.store.query(result_filter) is first
+        self.store.add([make_profile(4, 2_000)])
+        assert self.store.query(result_filter) == [0, 1, 2, 4]
+
+    def test_readding_username_replaces_row(self):
+        """Test that a profile with a known username updates its row and indexes."""
+        updated = replace(make_profile(3, 90_000), username='USER3')
+        self.store.add([updated])
+
+        assert len(self.store) == 4
+        assert self.store.query(sort_column='followers')[-1] == 3
+        assert self.store.get_by_username('user3') is updated
+
+    def test_filling_equal_keys_across_buckets(self, monkeypatch):
+        """Test that rows sharing a key are replaced correctly when the index spans many buckets."""
+        monkeypatch.setattr(_SortedIndex, 'LOAD', 2)
+        store = ResultStore(VirtualTreeView.row_id_for_iid)
+        store.add([replace(make_profile(ix, ix), engagement_stats=None) for ix in range(40)])
+
+        for ix in range(39, -1, -3):
+            store.add([make_profile(ix, ix, likes=ix % 7)])
+
+        likes = [store.rows[row_id].engagement_stats for row_id in store.query(sort_column='avg_post_likes')]
+        keys = [stats.recent_avg_post_likes if stats else 0 for stats in likes]
+        assert keys == sorted(keys)
+        assert store.query(parse_filter('likes = 0')) == [
+            ix for ix in range(40) if store.rows[ix].engagement_stats is None or ix % 7 == 0
+        ]
+
+    def test_parse_filter(self):
+        """Test filter parsing and validation."""
+        parsed = parse_filter('Followers>1.5k, engagement > 2%, Name')
+
+        assert [(c.column, c.operator) for c in parsed.comparisons] == [
+            ('followers', '>'), ('engagement_rate', '>')
+        ]
+        assert parsed.comparisons[0].value == 1500
+        assert parsed.comparisons[1].value == pytest.approx(0.02)
+        assert parsed.text == ('name',)
+        assert parse_filter(' , ').empty
+        with pytest.raises(ValueError):
+            parse_filter('height > 3')
+        with pytest.raises(ValueError):
+            parse_filter('followers >> 3')
@@ -0,0 +1,134 @@
+"""Tests for the profile snapshot store."""
+from dataclasses import replace
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.profile_service import ProfileService
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.storage.snapshot_store import DAY, SnapshotStore
+
+
+def make_profile(userid, followers):
+    """Create a profile with a given follower count."""
+    return Profile(
+        userid=userid,
+        username=f'user{userid}',
+        full_name=None,
+        bio=None,
+        is_verified=False,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=followers,
+            following_count=1,
+            posts_count=1,
+            last_updated=datetime(2023, 1, 1)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=10,
+            recent_avg_post_comments=1,
+            recent_avg_post_reshares=0,
+            recent_post_count=1
+        )
+    )
+
+
+class TestSnapshotStore:
+    """Test suite for SnapshotStore."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = 100 * DAY
+        self.store = SnapshotStore(':memory:', clock=lambda: self.now)
+
+    def teardown_method(self):
+        """Close the database."""
+        self.store.close()
+
+    def test_history_in_time_order(self):
+        """Test that an account's snapshots come back oldest first."""
+        self.store.record([make_profile('1', 200)], taken_at=self.now - DAY)
+        self.store.record([make_profile('1', 100)], taken_at=self.now - 2 * DAY)
+        self.store.record([make_profile('2', 5)])
+
+        history = self.store.history('1')
+
+        assert [s.followers_count for s in history] == [100, 200]
+        assert [s.followers_count for s in self.store.history('1', since=self.now - DAY)] == [200]
+
+    def test_growth(self):
+        """Test the change over a range ending now."""
+        self.store.record([make_profile('1', 50)], taken_at=self.now - 40 * DAY)
+        self.store.record([make_profile('1', 100)], taken_at=self.now - 20 * DAY)
+        self.store.record([make_profile('1', 150)], taken_at=self.now)
+
+        growth = self.store.growth('1', days=30)
+
+        assert (growth.start_value, growth.end_value, growth.delta) == (100, 150, 50)
+        assert growth.ratio == pytest.approx(0.5)
+        assert self.store.growth('missing') is None
+
+    def test_top_movers(self):
+        """Test ranking accounts by absolute and relative change."""
+        for userid, start, end in (('1', 1000, 1100), ('2', 10, 30), ('3', 500, 400)):
+            self.store.record([make_profile(userid, start)], taken_at=self.now - 10 * DAY)
+            self.store.record([make_profile(userid, end)], taken_at=self.now)
+        self.store.record([make_profile('4', 1)], taken_at=self.now)
+
+        assert [g.userid for g in self.store.top_movers()] == ['1', '2', '3']
+        assert [g.userid for g in self.store.top_movers(relative=True, limit=1)] == ['2']
+        assert [g.userid for g in self.store.top_movers(ascending=True, limit=1)] == ['3']
+        with pytest.raises(ValueError):
+            self.store.top_movers(metric='bio')
+
+    def test_downsample_keeps_latest_per_bucket(self):
+        """Test thinning old snapshots to one per day."""
+        old_day = self.now - 30 * DAY
+        for hour in range(6):
+            self.store.record([make_profile('1', hour)], taken_at=old_day + hour * 3600)
+        self.store.record([make_profile('1', 99)], taken_at=self.now - 3600)
+        self.store.record([make_profile('1', 98)], taken_at=self.now)
+
+        deleted = self.store.downsample(older_than_days=7)
+
+        assert deleted == 5
+        assert [s.followers_count for s in self.store.history('1')] == [5, 99, 98]
+
+    def test_compact_purges(self):
+        """Test that compaction drops rows past the retention."""
+        self.store.record([make_profile('1', 1)], taken_at=self.now - 400 * DAY)
+        self.store.record([make_profile('1', 2)], taken_at=self.now)
+
+        assert self.store.compact(purge_after_days=365) == 1
+        assert len(self.store.history('1')) == 1
+
+    def test_profile_service_records_snapshots(self):
+        """Test that every fetched profile is recorded."""
+        api_client = Mock()
+        api_client.get_profile.return_value = make_profile('7', 70)
+        service = ProfileService(api_client, snapshot_store=self.store)
+
+        service.get_profile('user7')
+
+        assert [s.followers_count for s in self.store.history('7')] == [70]
+
+    def test_unloaded_engagement_is_null_and_skipped(self):
+        """Test that profiles without engagement do not show up as drops to zero."""
+        pending = replace(make_profile('1', 100), engagement_stats=None)
+        self.store.record([make_profile('1', 100)], taken_at=self.now - 10 * DAY)
+        self.store.record([pending], taken_at=self.now)
+
+        assert self.store.history('1')[-1].avg_post_likes is None
+        assert self.store.growth('1', metric='avg_post_likes').end_at == self.now - 10 * DAY
+        assert self.store.top_movers(metric='avg_post_likes') == []
+
+        api_client = Mock()
+        api_client.fill_engagement.side_effect = lambda profile: replace(
+            profile, engagement_stats=make_profile('1', 100).engagement_stats
+        )
+        ProfileService(api_client, snapshot_store=self.store).load_engagement(pending)
+
+        assert self.store.history('1')[-1].avg_post_likes == 10
+        assert self.store.top_movers(metric='avg_post_likes')[0].delta == 0
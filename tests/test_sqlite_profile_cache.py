@@ -0,0 +1,194 @@
+"""Tests for the SQLite profile cache."""
+import os
+from dataclasses import replace
+from datetime import datetime
+from tempfile import TemporaryDirectory
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.models.lookup import LOOKUP_ERROR, LOOKUP_NOT_FOUND, LOOKUP_OK, LookupOutcome
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileSearchResult, ProfileStatistics
+from src.infrastructure.api.errors import ApiError
+from src.infrastructure.cache.sqlite_profile_cache import SqliteProfileCache
+
+
+def make_profile(username, likes=10):
+    """Create a profile whose userid is derived from the username."""
+    return Profile(
+        userid=f'{username}_pk',
+        username=username,
+        full_name=username.title(),
+        bio=None,
+        is_verified=False,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=100,
+            following_count=50,
+            posts_count=10,
+            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=likes,
+            recent_avg_post_comments=2,
+            recent_avg_post_reshares=1,
+            recent_post_count=5
+        )
+    )
+
+
+class TestSqliteProfileCache:
+    """Test suite for SqliteProfileCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.now = 1000.0
+        self.api_client = MagicMock()
+        self.api_client.get_profile.side_effect = make_profile
+        self.api_client.get_engagement_stats.return_value = make_profile('x', likes=99).engagement_stats
+        self.api_client.search_profiles.side_effect = lambda query: ProfileSearchResult(
+            profiles=[make_profile(name) for name in query.split(',')],
+            total_count=len(query.split(',')),
+            query_time_ms=0
+        )
+        self.cache = SqliteProfileCache(
+            api_client=self.api_client,
+            db_path=':memory:',
+            profile_ttl=100,
+            engagement_ttl=10,
+            max_entries=3,
+            clock=lambda: self.now
+        )
+
+    def test_get_profile_hits_cache(self):
+        """Test that a second lookup is served from the cache."""
+        first = self.cache.get_profile('user1')
+        second = self.cache.get_profile('USER1')
+
+        assert second == first
+        self.api_client.get_profile.assert_called_once_with('user1')
+
+    def test_stale_engagement_refreshed_alone(self):
+        """Test that expired engagement stats cost one engagement call only."""
+        self.cache.get_profile('user1')
+        self.now += 20
+
+        profile = self.cache.get_profile('user1')
+
+        assert profile.engagement_stats.recent_avg_post_likes == 99
+        self.api_client.get_profile.assert_called_once()
+        self.api_client.get_engagement_stats.assert_called_once_with('user1_pk', followers_count=100)
+
+    def test_profiles_without_engagement(self):
+        """Test that lazily loaded engagement is cached once filled in."""
+        self.api_client.load_engagement = False
+        self.api_client.get_profile.side_effect = lambda name: replace(make_profile(name), engagement_stats=None)
+        self.api_client.fill_engagement.side_effect = lambda profile: replace(
+            profile, engagement_stats=make_profile('x', likes=42).engagement_stats
+        )
+
+        profile = self.cache.get_profile('user1')
+        assert self.cache.get_profile('user1').engagement_stats is None
+
+        self.cache.fill_engagement(profile)
+
+        assert self.cache.get_profile('user1').engagement_stats.recent_avg_post_likes == 42
+        self.api_client.get_profile.assert_called_once()
+        self.api_client.get_engagement_stats.assert_not_called()
+
+    def test_stale_profile_refetched(self):
+        """Test that an expired profile goes back to the API."""
+        self.cache.get_profile('user1')
+        self.now += 200
+
+        self.cache.get_profile('user1')
+
+        assert self.api_client.get_profile.call_count == 2
+
+    def test_search_profiles_fetches_only_misses(self):
+        """Test that search sends only uncached names to the API, in order."""
+        self.cache.get_profile('user2')
+
+        result = self.cache.search_profiles('user1,user2,user1')
+
+        assert [p.username for p in result.profiles] == ['user1', 'user2', 'user1']
+        self.api_client.search_profiles.assert_called_once_with('user1')
+
+    def test_lookup_by_userid(self):
+        """Test that cached profiles can be found by userid."""
+        self.cache.get_profile('user1')
+
+        assert self.cache.get_cached_by_userid('user1_pk').username == 'user1'
+        assert self.cache.get_cached_by_userid('missing') is None
+
+    def test_evicts_least_recently_used(self):
+        """Test size-based eviction of the least recently used profiles."""
+        for ix, name in enumerate(['a', 'b', 'c', 'd']):
+            self.now += 1
+            self.cache.get_profile(name)
+            if ix == 2:
+                self.now += 1
+                self.cache.get_profile('a')
+
+        assert self.cache.get_cached_by_userid('a_pk') is not None
+        assert self.cache.get_cached_by_userid('b_pk') is None
+
+    def test_persists_across_instances(self):
+        """Test that a new cache on the same file reuses stored profiles."""
+        with TemporaryDirectory() as tmpdir:
+            db_path = os.path.join(tmpdir, 'cache.db')
+            cache = SqliteProfileCache(self.api_client, db_path, clock=lambda: self.now)
+            cache.get_profile('user1')
+            cache.close()
+
+            reopened = SqliteProfileCache(self.api_client, db_path, clock=lambda: self.now)
+            assert reopened.get_profile('user1').username == 'user1'
+            reopened.close()
+
+        self.api_client.get_profile.assert_called_once()
+
+    def test_rejects_empty_usernames(self):
+        """Test that an empty entry fails before any API call."""
+        with pytest.raises(ValueError):
+            self.cache.search_profiles('a,,b')
+        self.api_client.search_profiles.assert_not_called()
+
+    def test_lookup_profiles_caches_successes_only(self):
+        """Test that lookups fetch misses and cache only the found profiles."""
+        self.api_client.lookup_profiles.side_effect = lambda query: [
+            LookupOutcome(name, LOOKUP_NOT_FOUND, error="User not found") if name == 'gone'
+            else LookupOutcome(name, LOOKUP_OK, profile=make_profile(name))
+            for name in query.split(',')
+        ]
+        self.cache.get_profile('user1')
+
+        outcomes = self.cache.lookup_profiles('user1,gone,user2')
+
+        assert [o.status for o in outcomes] == [LOOKUP_OK, LOOKUP_NOT_FOUND, LOOKUP_OK]
+        self.api_client.lookup_profiles.assert_called_once_with('gone,user2')
+        assert self.cache.lookup_profiles('user2')[0].profile == make_profile('user2')
+        assert self.api_client.lookup_profiles.call_count == 1
+
+    def test_results_matched_by_username(self):
+        """Test that reordered or missing results are not attached to the wrong name."""
+        self.api_client.search_profiles.side_effect = lambda query: ProfileSearchResult(
+            profiles=[make_profile(name.upper()) for name in reversed(query.split(','))],
+            total_count=2,
+            query_time_ms=0
+        )
+        self.api_client.lookup_profiles.side_effect = lambda query: [
+            LookupOutcome('USER4', LOOKUP_OK, profile=make_profile('USER4'))
+        ]
+
+        result = self.cache.search_profiles('user1,user2')
+        outcomes = self.cache.lookup_profiles('user3,user4')
+
+        assert [p.username for p in result.profiles] == ['USER1', 'USER2']
+        assert [(o.status, o.profile) for o in outcomes] == [(LOOKUP_ERROR, None), (LOOKUP_OK, make_profile('USER4'))]
+
+        self.api_client.search_profiles.side_effect = lambda query: ProfileSearchResult(
+            profiles=[], total_count=0, query_time_ms=0
+        )
+        with pytest.raises(ApiError):
+            self.cache.search_profiles('user5')
@@ -0,0 +1,15 @@
+"""Startup cost of main.py, measured with python -X importtime."""
+from benchmarks.run_benchmarks import import_times
+
+# Modules only the code paths that call the API, store data or show the GUI need
+HEAVY_MODULES = ('hikerapi', 'httpx', 'sqlite3', 'tkinter', 'pyarrow', 'zstandard', 'concurrent.futures')
+
+
+class TestStartup:
+    """Test suite for the import cost of the entry point."""
+
+    def test_help_loads_no_heavy_module(self):
+        """Test that parsing arguments imports neither the API clients nor storage."""
+        times = import_times('main.py', '--help')
+
+        assert [module for module in HEAVY_MODULES if module in times] == []
@@ -0,0 +1,125 @@
+"""Tests for the Parquet, Arrow and JSON-lines exporters."""
+import gzip
+import json
+import os
+from datetime import datetime
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from src.domain.models.profile import EngagementStatistics, Profile, ProfileStatistics
+from src.infrastructure.export.arrow_exporter import ArrowExporter
+from src.infrastructure.export.csv_exporter import CsvExporter
+from src.infrastructure.export.jsonl_exporter import JsonlExporter
+from src.infrastructure.export.registry import MultiFormatExporter, format_for_path
+
+
+def make_profile(ix):
+    """Create a profile with values derived from an index."""
+    return Profile(
+        userid=str(ix),
+        username=f'user{ix}',
+        full_name=f'User {ix}',
+        bio=None,
+        is_verified=ix % 2 == 0,
+        is_private=False,
+        profile_pic_url=None,
+        statistics=ProfileStatistics(
+            followers_count=ix * 100,
+            following_count=ix,
+            posts_count=ix * 2,
+            last_updated=datetime(2023, 1, 1, 12, 0, 0)
+        ),
+        engagement_stats=EngagementStatistics(
+            recent_avg_post_likes=ix * 10,
+            recent_avg_post_comments=ix,
+            recent_avg_post_reshares=0,
+            recent_post_count=5,
+            engagement_rate=0.11
+        )
+    )
+
+
+class TestStructuredExporters:
+    """Test suite for the structured exporters."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tmpdir = TemporaryDirectory()
+        self.profiles = [make_profile(ix) for ix in range(1, 6)]
+
+    def teardown_method(self):
+        """Remove temporary files."""
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Path of a file in the temporary directory."""
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_gzip_jsonl(self):
+        """Test that gzip JSON lines hold one typed record per profile."""
+        filepath = self.path('out.jsonl.gz')
+
+        count = JsonlExporter('gzip', batch_size=2).export_stream(iter(self.profiles), filepath)
+
+        with gzip.open(filepath, 'rt', encoding='utf-8') as jsonl_file:
+            records = [json.loads(line) for line in jsonl_file]
+        assert count == 5
+        assert [r['username'] for r in records] == [p.username for p in self.profiles]
+        assert records[0]['followers_count'] == 100
+        assert records[0]['last_updated'] == '2023-01-01T12:00:00'
+
+    def test_zstd_jsonl(self):
+        """Test zstd compressed JSON lines."""
+        zstandard = pytest.importorskip('zstandard')
+        filepath = self.path('out.jsonl.zst')
+
+        JsonlExporter('zstd').export_profiles(self.profiles, filepath)
+
+        with zstandard.open(filepath, 'rt', encoding='utf-8') as jsonl_file:
+            assert len(jsonl_file.readlines()) == 5
+
+    def test_parquet_row_groups_and_schema(self):
+        """Test that Parquet output is typed and written in row groups."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        filepath = self.path('out.parquet')
+
+        ArrowExporter('parquet', batch_size=2).export_profiles(self.profiles, filepath)
+
+        parquet_file = pq.ParquetFile(filepath)
+        assert parquet_file.metadata.num_row_groups == 3
+        table = parquet_file.read()
+        assert table.num_rows == 5
+        assert str(table.schema.field('followers_count').type) == 'int64'
+        assert str(table.schema.field('last_updated').type) == 'timestamp[ms]'
+        assert table.column('username').to_pylist() == [p.username for p in self.profiles]
+
+    def test_arrow_ipc(self):
+        """Test Arrow IPC file output."""
+        pa = pytest.importorskip('pyarrow')
+        filepath = self.path('out.arrow')
+
+        count = ArrowExporter('arrow', batch_size=4).export_stream(self.profiles, filepath)
+
+        with pa.memory_map(filepath) as source:
+            table = pa.ipc.open_file(source).read_all()
+        assert count == 5
+        assert table.column('engagement_rate').to_pylist() == [0.11] * 5
+
+    def test_format_from_extension(self):
+        """Test that formats are chosen by the longest matching extension."""
+        assert format_for_path('a/b.JSONL.GZ').name == 'jsonl.gz'
+        assert format_for_path('b.jsonl').name == 'jsonl'
+        assert format_for_path('b.csv').name == 'csv'
+        assert format_for_path('b.txt') is None
+
+    def test_multi_format_exporter(self):
+        """Test dispatching by extension with a CSV fallback."""
+        exporter = MultiFormatExporter()
+        filepath = self.path('out.txt')
+
+        exporter.export_profiles(self.profiles, filepath)
+
+        with open(filepath, encoding='utf-8') as output:
+            assert output.readline().strip() == ','.join(CsvExporter.fieldnames)
+        assert exporter.filetypes[0] == ('CSV files', '*.csv')
@@ -0,0 +1,88 @@
+"""Tests for bulk username input parsing."""
+import io
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.profile_service import ProfileService
+from src.domain.models.profile import ProfileSearchResult
+from src.domain.validators.username_input import (
+    normalize_username,
+    parse_usernames,
+    read_usernames,
+    split_query,
+)
+
+
+class TestUsernameInput:
+    """Test suite for the username input module."""
+
+    def test_normalize_username(self):
+        """Test that handles and profile URLs reduce to usernames."""
+        assert normalize_username('  @Alice ') == 'alice'
+        assert normalize_username('https://www.instagram.com/Bob.Smith/?hl=en') == 'bob.smith'
+        assert normalize_username('instagram.com/carol') == 'carol'
+
+    def test_parse_mixed_separators(self):
+        """Test comma, semicolon and whitespace separators with dedupe."""
+        batch = parse_usernames("alice, @Bob\ncarol;ALICE\t\thttps://instagram.com/bob/")
+
+        assert batch.valid == ['alice', 'bob', 'carol']
+        assert batch.duplicates == 2
+        assert batch.rejected == {}
+
+    def test_rejected_entries(self):
+        """Test that invalid names and non-profile links are rejected."""
+        batch = parse_usernames('good .bad user-name https://www.instagram.com/p/Cxyz/ ' + 'a' * 31)
+
+        assert batch.valid == ['good']
+        assert set(batch.rejected) == {
+            '.bad', 'user-name', 'https://www.instagram.com/p/Cxyz/', 'a' * 31
+        }
+        assert batch.rejected['https://www.instagram.com/p/Cxyz/'] == "Not a profile URL"
+
+    def test_read_stream(self):
+        """Test reading a stream line by line."""
+        stream = io.StringIO("one\ntwo,three\n\n@one\n")
+
+        assert read_usernames(stream).valid == ['one', 'two', 'three']
+
+    def test_split_query(self):
+        """Test strict splitting of API client queries."""
+        assert split_query('a, b,a') == ['a', 'b', 'a']
+        with pytest.raises(ValueError):
+            split_query('a,,b')
+        with pytest.raises(ValueError):
+            split_query('a,bad name')
+
+
+class TestProfileServiceInput:
+    """Test that the profile service only sends clean, unique names."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.api_client = Mock()
+        self.api_client.search_profiles.return_value = ProfileSearchResult(
+            profiles=[], total_count=0, query_time_ms=0
+        )
+        self.service = ProfileService(self.api_client)
+
+    def test_search_sends_unique_names(self):
+        """Test that duplicates and handles are cleaned before the API call."""
+        self.service.search_profiles('@Alice bob\nalice')
+
+        self.api_client.search_profiles.assert_called_once_with('alice,bob')
+
+    def test_search_rejects_invalid_names(self):
+        """Test that invalid names fail without an API call."""
+        profiles, error = self.service.search_profiles('alice, bad-name')
+
+        assert profiles is None
+        assert 'bad-name' in error
+        self.api_client.search_profiles.assert_not_called()
+
+    def test_get_profile_normalizes(self):
+        """Test that a profile URL is looked up by its username."""
+        self.service.get_profile('https://instagram.com/Alice')
+
+        self.api_client.get_profile.assert_called_once_with('alice')
@@ -0,0 +1,173 @@
+"""Tests for the virtualized Treeview rendering."""
+import pytest
+
+from src.presentation.virtual_tree import Viewport, VirtualTreeView
+
+
+class FakeTree:
+    """Stand-in for ttk.Treeview running scheduled callbacks on demand."""
+
+    def __init__(self, height=10):
+        self.height = height
+        self.rows = {}
+        self.selected = ()
+        self.scheduled = []
+        self.yview = None
+        self.options = {}
+
+    def cget(self, option):
+        return self.height
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def bind(self, sequence, func, add=None):
+        self.options[sequence] = func
+
+    def after(self, ms, func, *args):
+        self.scheduled.append((func, args))
+
+    def after_idle(self, func, *args):
+        self.scheduled.append((func, args))
+
+    def run_pending(self):
+        while self.scheduled:
+            func, args = self.scheduled.pop(0)
+            func(*args)
+
+    def get_children(self):
+        return tuple(self.rows)
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.rows[iid]
+
+    def insert(self, parent, index, iid, values):
+        self.rows[iid] = values
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, iids):
+        self.selected = tuple(iids)
+
+    def yview_moveto(self, fraction):
+        self.yview = fraction
+
+
+class FakeScrollbar:
+    """Stand-in for ttk.Scrollbar recording its position."""
+
+    def __init__(self):
+        self.position = None
+        self.options = {}
+
+    def configure(self, **options):
+        self.options.update(options)
+
+    def set(self, low, high):
+        self.position = (low, high)
+
+
+class TestViewport:
+    """Test suite for the viewport arithmetic."""
+
+    def test_window_is_clipped_to_dataset(self):
+        """Test that the window covers the visible rows plus the buffer."""
+        viewport = Viewport(buffer=20)
+        assert viewport.window(0, 10, 1000) == (0, 30)
+        assert viewport.window(500, 10, 1000) == (480, 530)
+        assert viewport.window(995, 10, 1000) == (975, 1000)
+
+    def test_needs_render_near_edges(self):
+        """Test that rendering is only needed close to the window edges."""
+        viewport = Viewport(buffer=20)
+        assert not viewport.needs_render(500, 10, 480, 530, 1000)
+        assert viewport.needs_render(485, 10, 480, 530, 1000)
+        assert viewport.needs_render(515, 10, 480, 530, 1000)
+        assert not viewport.needs_render(0, 10, 0, 30, 1000)
+
+
+class TestVirtualTreeView:
+    """Test suite for VirtualTreeView."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.tree = FakeTree(height=10)
+        self.scrollbar = FakeScrollbar()
+        self.view = VirtualTreeView(self.tree, self.scrollbar, lambda n: (str(n),), buffer=20, slice_ms=1000)
+
+    def values(self):
+        """Values of the materialized rows in tree order."""
+        return [int(values[0]) for values in self.tree.rows.values()]
+
+    def show(self, count, view=None):
+        """Show the numbers below count in order."""
+        (view or self.view).show(list(range(count)), list(range(count)))
+
+    def test_only_window_is_materialized(self):
+        """Test that a large dataset only renders the visible window plus buffer."""
+        self.show(10_000)
+        self.tree.run_pending()
+
+        assert len(self.view) == 10_000
+        assert self.values() == list(range(30))
+        assert self.scrollbar.position == (0.0, 0.001)
+
+    def test_scrollbar_moves_window(self):
+        """Test that dragging the scrollbar re-renders around the new position."""
+        self.show(10_000)
+        self.tree.run_pending()
+
+        self.view._on_scrollbar('moveto', '0.5')
+
+        assert self.values() == list(range(4980, 5030))
+        assert self.tree.yview == pytest.approx(20 / 50)
+        assert self.scrollbar.position[0] == pytest.approx(0.5)
+
+    def test_small_scroll_stays_in_window(self):
+        """Test that scrolling inside the buffer does not re-render."""
+        self.show(10_000)
+        self.tree.run_pending()
+        self.view._on_scrollbar('moveto', '0.5')
+        self.tree.rows['sentinel'] = ('-1',)
+
+        self.view._on_scrollbar('scroll', '3', 'units')
+
+        assert 'sentinel' in self.tree.rows
+        assert self.tree.yview == pytest.approx(23 / 50)
+
+    def test_inserts_are_time_sliced(self):
+        """Test that rendering yields to the event loop when out of time."""
+        view = VirtualTreeView(self.tree, self.scrollbar, lambda n: (str(n),), buffer=20, slice_ms=0)
+        self.show(100, view)
+        self.tree.run_pending()
+
+        assert self.values() == list(range(30))
+
+    def test_order_covers_full_dataset(self):
+        """Test that the display order applies to every item, not only rendered ones."""
+        self.show(1000)
+        self.tree.run_pending()
+
+        self.view.show(list(range(1000)), list(range(999, -1, -1)))
+        self.tree.run_pending()
+
+        assert self.values()[:3] == [999, 998, 997]
+        self.view._on_scrollbar('moveto', '1')
+        assert self.values()[-1] == 0
+
+    def test_selection_survives_scrolling(self):
+        """Test that selected items are kept when their rows are unrendered."""
+        self.show(1000)
+        self.tree.run_pending()
+        self.tree.selected = ('r2', 'r5')
+        self.view._on_tree_select()
+
+        self.view._on_scrollbar('moveto', '0.9')
+        self.tree.run_pending()
+        assert self.view._selected == {2, 5}
+
+        self.view._on_scrollbar('moveto', '0')
+        self.tree.run_pending()
+        assert self.tree.selected == ('r2', 'r5')